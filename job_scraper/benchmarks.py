@@ -0,0 +1,323 @@
+"""
+Crawl benchmark that runs against recorded traffic instead of the network.
+
+Record a fixture bundle once (needs network access):
+
+    python -m job_scraper.benchmarks record --job "파이썬 개발자" \
+        --bundle fixtures/wanted
+
+Replay it as often as needed (no network access):
+
+    python -m job_scraper.benchmarks run --bundle fixtures/wanted --repeat 3
+
+Measure the start-up cost of the CLI (`python -X importtime`):
+
+    python -m job_scraper.benchmarks imports --repeat 5
+"""
+
+import argparse
+import asyncio
+from contextlib import asynccontextmanager
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.scrapers.browser_pool import BrowserPool
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+from job_scraper.storage.crawl_state import CrawlStateStore
+from job_scraper.storage.database import DatabaseSink
+from job_scraper.storage.exporter import StreamExporter
+from job_scraper.utils.fixtures import FixtureBundle
+from job_scraper.utils.fixtures import RECORD
+from job_scraper.utils.fixtures import REPLAY
+from job_scraper.utils.http_client import create_client
+from job_scraper.utils.http_client import pooled_transport
+from job_scraper.utils.rate_limiter import RateLimitedTransport
+from job_scraper.utils.rate_limiter import RateLimiter
+
+logger = setup_logger(__name__)
+
+# replay 때는 서버를 보호할 필요가 없으므로 pacing을 사실상 끈다
+REPLAY_RATE_LIMIT = {
+    "rate": 1000.0,
+    "max_rate": 1000.0,
+    "burst": 1000,
+    "concurrency": 8,
+    "max_concurrency": 8,
+}
+
+# `import job_scraper.main`만으로는 로드되면 안 되는 패키지
+LAZY_BACKENDS = (
+    "playwright",
+    "bs4",
+    "lxml",
+    "cssselect",
+    "selenium",
+    "inquirer",
+)
+
+
+class BenchmarkScraper(WantedScraper):
+    """
+    WantedScraper that measures how long each crawl phase runs.
+
+    Detail workers and saves run concurrently (and overlap the list phase),
+    so a phase is the wall-clock span from its first start to its last end
+    instead of the sum of every call.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.phase_spans: Dict[str, Tuple[float, float]] = {}
+        self.saved = 0
+
+    @classmethod
+    def get_url(cls, url_key, job_id) -> str:
+        return super().get_url(WantedScraper.__name__, job_id)
+
+    @asynccontextmanager
+    async def timed(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            first_start, last_end = self.phase_spans.get(phase, (start, end))
+            self.phase_spans[phase] = (
+                min(first_start, start),
+                max(last_end, end),
+            )
+
+    async def _crawl(self, list_phase: Callable[[], Awaitable[None]]):
+        async def timed_list_phase():
+            async with self.timed("list"):
+                await list_phase()
+
+        return await super()._crawl(timed_list_phase)
+
+    async def _fetch_job_detail(self, page, job_data: Dict[str, Dict]):
+        async with self.timed("details"):
+            await super()._fetch_job_detail(page, job_data)
+
+    async def save(self, data: Dict[str, Dict]):
+        async with self.timed("save"):
+            await super().save(data)
+        self.saved += 1
+
+    def phases(self) -> Dict[str, float]:
+        # 구간이 겹치므로 합이 전체 시간보다 클 수 있다
+        spans = {
+            phase: self.phase_spans.get(phase, (0.0, 0.0))
+            for phase in ("list", "details", "save")
+        }
+        return {phase: end - start for phase, (start, end) in spans.items()}
+
+
+def peak_rss_mb() -> Dict[str, float]:
+    """Peak RSS of this process and of its finished children (Chromium)"""
+    to_mb = 1 / 1024  # Linux reports ru_maxrss in KiB
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * to_mb,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        * to_mb,
+    }
+
+
+async def crawl(
+    bundle: FixtureBundle,
+    mode: str,
+    job: str,
+    params: Dict[str, Any] = None,
+) -> Dict[str, Any]:
+    """
+    Crawl one job while recording or replaying `bundle`.
+
+    Outputs and crawl state go to a temporary directory, so every run starts
+    from the same state and leaves nothing behind.
+
+    Returns:
+        Dict[str, Any]: Postings, phase times and browser round trips.
+    """
+    rate_limiter = RateLimiter(REPLAY_RATE_LIMIT if mode == REPLAY else None)
+    transport = (
+        bundle.transport(
+            RECORD, RateLimitedTransport(rate_limiter, pooled_transport())
+        )
+        if mode == RECORD
+        else bundle.transport(REPLAY)
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        crawl_state = CrawlStateStore(
+            url=f"sqlite:///{os.path.join(directory, 'crawl_state.db')}"
+        )
+        browser_pool: BrowserPool = bundle.browser_pool(mode)
+        try:
+            async with create_client(
+                transport=transport
+            ) as session, DatabaseSink(
+                url=f"sqlite:///{os.path.join(directory, 'job_scraper.db')}"
+            ) as sink, StreamExporter(
+                directory=directory
+            ) as exporter:
+                scraper = await BenchmarkScraper.create(
+                    job,
+                    params=params,
+                    browser_pool=browser_pool,
+                    rate_limiter=rate_limiter,
+                    crawl_state=crawl_state,
+                    sink=sink,
+                    exporter=exporter,
+                    session=session,
+                )
+                if scraper is None:
+                    raise RuntimeError(f"Failed to create scraper for {job}")
+
+                start = time.perf_counter()
+                await scraper.fetch(session, scraper.url)
+                elapsed = time.perf_counter() - start
+                round_trips = browser_pool.round_trips()
+        finally:
+            await browser_pool.close()
+            crawl_state.close()
+
+    return {
+        "postings": scraper.saved,
+        "seconds": elapsed,
+        "postings_per_sec": scraper.saved / elapsed if elapsed else 0.0,
+        "phase_seconds": scraper.phases(),
+        "browser_round_trips": round_trips,
+    }
+
+
+async def record(bundle: FixtureBundle, job: str, params: Dict[str, Any]):
+    bundle.save_meta({"job": job, "params": params})
+    result = await crawl(bundle, RECORD, job, params)
+    logger.info(f"Recorded {result['postings']} postings to {bundle.directory}")
+
+
+async def run(bundle: FixtureBundle, repeat: int) -> Dict[str, Any]:
+    meta = bundle.load_meta()
+    runs = [
+        await crawl(bundle, REPLAY, meta["job"], meta["params"])
+        for _ in range(repeat)
+    ]
+    best = max(runs, key=lambda result: result["postings_per_sec"])
+    return {
+        "job": meta["job"],
+        "runs": runs,
+        "best_postings_per_sec": best["postings_per_sec"],
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """Cumulative import time (us) of every module, from a fresh interpreter"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def imports(
+    module: str = "job_scraper.main", repeat: int = 5, top: int = 15
+) -> Dict[str, Any]:
+    """
+    Median import time of `module` and of its slowest dependencies.
+
+    Heavy backends (Playwright, bs4, lxml, Selenium, inquirer) should not
+    show up here; they are imported only when their fetch mode, HTML
+    parsing or the prompt is used.
+    """
+    runs: List[Dict[str, int]] = [import_times(module) for _ in range(repeat)]
+    median = {
+        name: statistics.median(run.get(name, 0) for run in runs)
+        for name in runs[0]
+    }
+    top_level = {name: us for name, us in median.items() if "." not in name}
+    return {
+        "module": module,
+        "runs": repeat,
+        "total_ms": median[module] / 1000,
+        "slowest_packages_ms": {
+            name: us / 1000
+            for name, us in sorted(
+                top_level.items(), key=lambda item: item[1], reverse=True
+            )[:top]
+        },
+        "lazy_backends_loaded": [
+            name
+            for name in LAZY_BACKENDS
+            if name in median
+        ],
+    }
+
+
+def parse_opt():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Record a bundle")
+    record_parser.add_argument("--job", required=True, help="Job to crawl")
+    record_parser.add_argument(
+        "--location", default=None, help="e.g. seoul.all"
+    )
+    record_parser.add_argument("--bundle", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Replay a bundle")
+    run_parser.add_argument("--bundle", required=True)
+    run_parser.add_argument("--repeat", type=int, default=1)
+    run_parser.add_argument(
+        "--output", default=None, help="Write the report to a JSON file"
+    )
+
+    imports_parser = subparsers.add_parser(
+        "imports", help="Measure the import time of the CLI"
+    )
+    imports_parser.add_argument("--module", default="job_scraper.main")
+    imports_parser.add_argument("--repeat", type=int, default=5)
+    imports_parser.add_argument("--top", type=int, default=15)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    opt = parse_opt()
+
+    if opt.command == "imports":
+        print(
+            json.dumps(
+                imports(opt.module, opt.repeat, opt.top),
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+    elif opt.command == "record":
+        bundle = FixtureBundle(opt.bundle)
+        params = {"locations": opt.location} if opt.location else {}
+        asyncio.run(record(bundle, opt.job, params))
+    else:
+        bundle = FixtureBundle(opt.bundle)
+        report = json.dumps(
+            asyncio.run(run(bundle, opt.repeat)), ensure_ascii=False, indent=2
+        )
+        print(report)
+        if opt.output:
+            with open(opt.output, "w", encoding="utf-8") as file:
+                file.write(report)
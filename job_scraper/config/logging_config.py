@@ -1,36 +1,178 @@
-import os
+import atexit
+from collections import defaultdict
 import logging
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+import multiprocessing.util
+import os
+import queue
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from job_scraper.config.settings import LOGGING_CONFIG
+
+LOG_FORMAT = (
+    "%(asctime)s - [%(levelname)s] - %(filename)s - %(funcName)s - %(message)s"
+)
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+_lock = threading.Lock()
+
+
+class ModuleFileHandler(logging.Handler):
+    """
+    모듈별 로그 파일 핸들러.
+    레코드의 로거 이름으로 `{directory}/{name}.log` 파일을 처음 쓸 때 연다.
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+        self._handlers: Dict[str, logging.FileHandler] = {}
+
+    def emit(self, record: logging.LogRecord):
+        handler = self._handlers.get(record.name)
+        if handler is None:
+            handler = logging.FileHandler(
+                os.path.join(self.directory, f"{record.name}.log"),
+                encoding="utf-8",
+            )
+            handler.setFormatter(self.formatter)
+            self._handlers[record.name] = handler
+        handler.emit(record)
+
+    def close(self):
+        for handler in self._handlers.values():
+            handler.close()
+        super().close()
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    hot path 메시지 출력 제한 필터.
+    `extra=rate_limited(key)`로 기록한 메시지는 key마다 초당 `rate`개
+    (최대 `burst`개 연속)까지만 통과시키고, 버려진 개수는 다음 메시지에 붙인다.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._suppressed: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, "rate_limit_key", None)
+        if key is None:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                self._suppressed[key] += 1
+                return False
+            self._buckets[key] = (tokens - 1, now)
+            suppressed = self._suppressed.pop(key, 0)
+
+        if suppressed:
+            record.msg = (
+                f"{record.msg} ({suppressed} similar messages suppressed)"
+            )
+        return True
+
+
+def rate_limited(key: str) -> Dict[str, str]:
+    """
+    hot path 로그에 넘기는 `extra`.
+    e.g. logger.info("Scraped ...", extra=rate_limited("scraped_posting"))
+    """
+    return {"rate_limit_key": key}
+
+
+def _level_for(name: str) -> str:
+    """모듈별 설정 중 가장 구체적인 레벨, 없으면 기본 레벨"""
+    levels = LOGGING_CONFIG["levels"]
+    parts = name.split(".")
+    for i in range(len(parts), 0, -1):
+        prefix = ".".join(parts[:i])
+        if prefix in levels:
+            return levels[prefix]
+    return os.getenv("LOG_LEVEL") or LOGGING_CONFIG["level"]
+
+
+def configure_logging():
+    """
+    프로세스당 한 번만 핸들러를 설정하는 함수.
+    로거는 QueueHandler에 레코드를 넣기만 하고, 파일/콘솔 출력은
+    QueueListener 스레드가 담당하므로 이벤트 루프가 I/O로 막히지 않는다.
+    """
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is not None:
+            return
+
+        directory = os.getenv("LOG_DIR") or LOGGING_CONFIG["directory"]
+        os.makedirs(directory, exist_ok=True)  # logs 폴더 없으면 생성
+        formatter = logging.Formatter(LOG_FORMAT)
+
+        file_handler = ModuleFileHandler(directory)
+        file_handler.setLevel(LOGGING_CONFIG["file_level"])
+        file_handler.setFormatter(formatter)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(
+            os.getenv("LOG_LEVEL") or LOGGING_CONFIG["console_level"]
+        )
+        console_handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        _queue_handler = QueueHandler(log_queue)
+        _queue_handler.addFilter(
+            RateLimitFilter(
+                LOGGING_CONFIG["rate_limit"], LOGGING_CONFIG["rate_limit_burst"]
+            )
+        )
+        logging.getLogger().addHandler(_queue_handler)
+        for name, level in LOGGING_CONFIG["levels"].items():
+            logging.getLogger(name).setLevel(level)
+
+        _listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        _listener.start()
+
+        # worker 프로세스는 atexit를 실행하지 않으므로 Finalize도 등록
+        atexit.register(shutdown_logging)
+        multiprocessing.util.Finalize(None, shutdown_logging, exitpriority=0)
+
+
+def shutdown_logging():
+    """남은 레코드를 모두 출력하고 핸들러를 닫는 함수."""
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is None:
+            return
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
 
 def setup_logger(name):
     """
     모듈별 로깅 설정을 위한 함수.
-    각 모듈의 __name__을 받아 해당 모듈 전용 로거를 생성.
+    각 모듈의 __name__을 받아 해당 모듈 전용 로거를 반환.
+    핸들러는 root 로거에 한 번만 등록되므로 여러 번 호출해도 중복되지 않는다.
     """
+    configure_logging()
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)  # 필요에 따라 로그 레벨 조정
-
-    # 로그 파일 경로 설정 (모듈명 기반)
-    log_dir = "logs"
-    os.makedirs(log_dir, exist_ok=True)  # logs 폴더 없으면 생성
-    log_file = os.path.join("..",log_dir, f"{name}.log")  # 파일명 자동 설정
-
-    # 파일 핸들러 설정
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
-    
-    # 로그 포맷 설정
-    formatter = logging.Formatter(
-        "%(asctime)s - [%(levelname)s] - %(filename)s - %(funcName)s - %(message)s"
-    )
-    file_handler.setFormatter(formatter)
-
-    # 콘솔 출력 핸들러 추가
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)  # 콘솔에서는 INFO 이상만 출력
-    console_handler.setFormatter(formatter)
-
-    # 핸들러 등록
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-
+    logger.setLevel(_level_for(name))
     return logger
@@ -17,6 +17,18 @@ JOB_CONFIG = {
     },
 }
 
+# 채용 공고 목록 API 설정
+# fetch_mode: "api" (httpx로 목록 JSON 수집) / "browser" (스크롤하며 카드 수집)
+WANTED_API_CONFIG = {
+    "fetch_mode": "api",
+    "listing_path": "/api/chaos/navigation/v1/results",
+    "job_group_id": 518,
+    "job_group_name": "개발",
+    "limit": 20,  # 페이지당 공고 수
+    "max_pages": 50,
+    "concurrency": 4,  # 동시에 요청하는 페이지 수
+}
+
 # 공통 헤더 정보
 HEADERS = {
     "Content-Type": "application/json",
@@ -37,3 +49,173 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; U; Intel Mac OS X 8_5_9; en-US) Gecko/20100101 Firefox/46.3",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_2_2) Gecko/20100101 Firefox/60.1"
 ]
+
+# Headless browser pool 설정
+BROWSER_CONFIG = {
+    "headless": True,
+    "max_pages": 5,  # 동시에 열어 둘 수 있는 페이지 수
+    "max_navigations_per_context": 50,  # 컨텍스트 재생성 주기 (메모리 제한)
+    "user_agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
+    ),
+    "blocked_resource_types": ["media", "font", "iframe", "stylesheet"],
+}
+
+# 채용 공고 상세 페이지 수집 설정
+DETAIL_CONFIG = {
+    "workers": 4,  # 동시에 상세 페이지를 수집하는 worker 수
+    "overlap_scroll": True,  # 스크롤 도중 상세 페이지 수집 시작 여부
+    "expand_timeout": 3,  # "상세 정보 더 보기" 버튼을 기다리는 시간(초)
+}
+
+# Host별 요청 속도 제한 (token bucket + AIMD)
+RATE_LIMIT_CONFIG = {
+    "rate": 1.0,  # 초기 초당 요청 수
+    "min_rate": 0.2,
+    "max_rate": 10.0,
+    "burst": 2,  # token bucket 크기
+    "concurrency": 2,  # 초기 동시 요청 수
+    "min_concurrency": 1,
+    "max_concurrency": 8,
+    "increase": 1.0,  # 정상 응답 시 additive increase 폭
+    "decrease": 0.5,  # 429/5xx/timeout 시 multiplicative decrease 비율
+    "cooldown": 2.0,  # 연속 감소를 막기 위한 최소 간격 (초)
+}
+
+# 재시도 / host별 circuit breaker
+RESILIENCE_CONFIG = {
+    "max_attempts": 3,  # 첫 요청을 포함한 최대 시도 횟수
+    "base_delay": 0.5,  # 지수 backoff 기본 대기 시간 (초, full jitter)
+    "max_delay": 10.0,
+    "retry_budget_ratio": 0.2,  # 전체 요청 수 대비 허용하는 재시도 비율
+    "retry_budget_min": 10,  # 요청 수와 무관하게 허용하는 재시도 수
+    "failure_threshold": 5,  # 연속 실패 시 circuit open
+    "reset_timeout": 30.0,  # open 후 probe 요청을 보내기까지의 시간 (초)
+    "max_reset_timeout": 300.0,  # probe 실패 시 2배씩 늘리는 시간의 상한
+    "half_open_probes": 1,  # half-open 상태에서 동시에 보내는 probe 수
+}
+
+# SQLite 저장소 공통 설정 (shard 프로세스들이 같은 DB 파일을 함께 쓴다)
+SQLITE_CONFIG = {
+    "busy_timeout": 30.0,  # 다른 프로세스가 write lock을 잡고 있을 때 기다리는 시간 (초)
+}
+
+# 증분 수집 상태 저장소 (변경되지 않은 공고는 상세 페이지를 다시 수집하지 않음)
+CRAWL_STATE_CONFIG = {
+    "enabled": True,
+    "url": "sqlite:///crawl_state.db",  # SQLAlchemy engine URL
+    "recheck_interval_hours": 24,  # 이 시간이 지나면 변경이 없어도 다시 수집
+}
+
+# 수집 결과 저장소 (batched upsert)
+PERSISTENCE_CONFIG = {
+    "enabled": True,
+    "url": "sqlite:///job_scraper.db",  # SQLAlchemy engine URL
+    "batch_size": 100,  # 한 번에 upsert 하는 레코드 수
+    "flush_interval": 5.0,  # 버퍼를 비우는 최대 간격 (초)
+}
+
+# 수집 결과 스트리밍 내보내기
+EXPORT_CONFIG = {
+    "enabled": True,
+    "directory": "output",
+    "file_format": "jsonl",  # "jsonl" / "jsonl.gz" / "parquet" (pyarrow 필요)
+    "max_file_bytes": 64 * 1024 * 1024,  # 파일 교체 기준 크기
+    "queue_size": 1000,  # 가득 차면 수집 속도를 늦춘다 (backpressure)
+    "batch_size": 100,  # 한 번에 기록하는 레코드 수
+}
+
+# httpx 응답 디스크 캐시 (ETag/Last-Modified 재검증)
+HTTP_CACHE_CONFIG = {
+    "enabled": True,
+    "path": ".cache/http_cache.db",
+    "max_bytes": 256 * 1024 * 1024,  # 초과 시 LRU 순서로 삭제
+    "default_ttl": 0,  # 0이면 매번 조건부 요청으로 재검증
+    "ttls": {  # URL 패턴(fnmatch)별 TTL (초)
+        "*/api/chaos/navigation/*": 600,
+        "*/wd/*": 3600,
+    },
+    "offline": False,  # True면 네트워크 없이 캐시된 응답만 사용
+}
+
+# 모든 scraper가 공유하는 httpx 클라이언트 (connection pool / HTTP/2 재사용)
+HTTP_CLIENT_CONFIG = {
+    "http2": True,  # h2 패키지가 없으면 HTTP/1.1로 동작
+    "max_connections": 20,  # 전체 동시 연결 수
+    "max_keepalive_connections": 10,  # 재사용을 위해 열어 두는 연결 수
+    "keepalive_expiry": 30.0,  # 쉬는 연결을 닫기까지의 시간 (초)
+    "timeout": 10.0,
+    "connect_timeout": 5.0,
+    "max_redirects": 5,
+    "fetch_workers": 8,  # fetch_all에서 URL을 가져오는 worker 수
+}
+
+# URL 검증 결과 캐시
+URL_VALIDATION_CONFIG = {
+    "ttl": 3600,  # 접근 가능 여부를 재사용하는 시간 (초)
+    "negative_ttl": 30,  # 접근 실패를 재사용하는 시간 (초, 일시 장애 대비)
+    "timeout": 5,
+    "concurrency": 8,  # 여러 URL을 동시에 검증할 때 최대 동시 요청 수
+}
+
+# 여러 job을 동시에 실행하는 ScraperManager 설정
+MANAGER_CONFIG = {
+    "max_concurrency": 4,  # 동시에 실행하는 전체 job 수
+    "per_scraper_concurrency": {  # scraper class별 최대 동시 실행 수
+        "WantedScraper": 3,
+    },
+    "locations": None,  # 수집할 지역 목록 (None이면 JOB_CONFIG의 지역)
+    "years": None,  # 수집할 경력 조건 목록 (None이면 JOB_CONFIG의 경력)
+    "processes": 1,  # 2 이상이면 job x 지역을 여러 프로세스로 나눠 수집
+}
+
+# 정적/동적 페이지 판별 결과 캐시
+PAGE_CLASSIFIER_CONFIG = {
+    "ttl": 6 * 60 * 60,  # URL 패턴별 판별 결과 유지 시간 (초)
+}
+
+# 목록 페이지 스크롤 설정 (고정 sleep 대신 카드 수 증가를 기다림)
+SCROLL_CONFIG = {
+    "max_scrolls": 50,
+    "initial_timeout": 10.0,  # 첫 카드가 나타날 때까지 기다리는 최대 시간 (초)
+    "idle_timeout": 3.0,  # 스크롤 후 카드가 늘지 않으면 종료하는 시간 (초)
+    "max_duration": 120.0,  # 스크롤 전체에 쓰는 최대 시간 (초)
+}
+
+# 성능 지표 설정 (실행이 끝나면 JSON 요약과 Prometheus 텍스트 파일로 저장)
+METRICS_CONFIG = {
+    "enabled": True,
+    "json_path": "output/metrics.json",
+    "prometheus_path": "output/metrics.prom",
+    "host": "127.0.0.1",  # 외부에 노출하려면 "0.0.0.0"
+    "port": None,  # 지정하면 실행 중 http://localhost:{port}/metrics 제공
+}
+
+# 로깅 설정 (환경 변수 LOG_LEVEL, LOG_DIR가 있으면 우선 적용)
+LOGGING_CONFIG = {
+    "level": "INFO",  # job_scraper 로거의 레벨
+    "console_level": "INFO",
+    "file_level": "DEBUG",
+    "directory": "logs",  # 모듈별 로그 파일 위치 (실행 위치 기준)
+    "levels": {  # 모듈별 레벨 (e.g. "job_scraper.scrapers.wanted_scraper")
+        "httpx": "WARNING",
+    },
+    "rate_limit": 1.0,  # hot path 메시지 종류별 초당 최대 출력 수
+    "rate_limit_burst": 5,
+}
+
+# HTML 파서 설정 ("css": 컴파일된 selector, "lxml", "bs4": BeautifulSoup+lxml)
+PARSER_CONFIG = {
+    "backend": "css",
+    "scrapers": {},  # 스크래퍼별 backend (e.g. {"WantedScraper": "bs4"})
+}
+
+# 상세 수집 대기열 저널 (중단된 수집을 --resume으로 이어서 실행)
+WORK_QUEUE_CONFIG = {
+    "enabled": True,
+    "path": ".cache/work_queue.db",
+    "batch_size": 50,  # 이 개수만큼 모이면 한 번에 commit
+    "flush_interval": 2.0,  # 또는 마지막 commit 후 이 시간(초)이 지나면 commit
+    "max_attempts": 3,  # 실패한 공고를 resume 때 다시 시도하는 최대 횟수
+}
@@ -1,55 +1,209 @@
+"""
+Job scraper entry point.
+
+Interactive use prompts for the jobs to crawl. For cron jobs and containers,
+pass everything as flags or in a JSON/TOML config file (flags win):
+
+    python -m job_scraper.main --job "파이썬 개발자" --job DBA --concurrency 4
+    python -m job_scraper.main --job DBA --location seoul.all --output out
+    python -m job_scraper.main --job DBA --years 0 --years 3
+
+    python -m job_scraper.main --config crawl.toml
+
+Every job x location x years combination is crawled at the same time, and a
+posting listed by several of them is fetched only once.
+
+Config file keys: jobs, locations, years, output, concurrency, processes,
+resume.
+
+`output` only moves the exported record files. The database, the work queue
+journal, the crawl state and the HTTP cache keep the paths in
+`config/settings.py`, relative to the working directory.
+"""
+
 import argparse
+import asyncio
+import json
 import sys
 import time
-
-import inquirer
+from typing import Any, Dict, List
 
 from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import EXPORT_CONFIG
 from job_scraper.scrapers.scraper_manager import ScraperManager
 from job_scraper.scrapers.wanted_scraper import WantedScraper
 
 logger = setup_logger(__name__)
 
-questions = [
-    inquirer.Checkbox(
-        "job",
-        message="원하는 직무를 선택하시려면 스페이스바로 체크 후 엔터를 눌러주세요.",
-        choices=[
-            "파이썬 개발자",
-            "머신러닝 엔지니어",
-            "데이터 엔지니어",
-            "DBA",
-            "서버 개발자",
-            "빅데이터 엔지니어",
-            ".NET 개발자",
-        ],
-    )
+JOB_CHOICES = [
+    "파이썬 개발자",
+    "머신러닝 엔지니어",
+    "데이터 엔지니어",
+    "DBA",
+    "서버 개발자",
+    "빅데이터 엔지니어",
+    ".NET 개발자",
 ]
-answers = inquirer.prompt(questions)
-if answers is None:
-    sys.exit(1)
+CONFIG_KEYS = {
+    "jobs",
+    "locations",
+    "years",
+    "output",
+    "concurrency",
+    "processes",
+    "resume",
+}
+
+
+def prompt_jobs() -> List[str]:
+    """터미널에서 직무를 선택받는 함수 (inquirer는 이때만 import)"""
+    import inquirer
+
+    questions = [
+        inquirer.Checkbox(
+            "job",
+            message="원하는 직무를 선택하시려면 스페이스바로 체크 후 엔터를 눌러주세요.",
+            choices=JOB_CHOICES,
+        )
+    ]
+    answers = inquirer.prompt(questions)
+    if answers is None:
+        sys.exit(1)
+    return answers["job"]
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    """
+    Read a JSON or TOML (`.toml`) config file.
+
+    Raises:
+        ValueError: If the file is not a table of settings.
+    """
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:  # Python 3.10
+            import tomli as tomllib
+
+        with open(path, "rb") as file:
+            config = tomllib.load(file)
+    else:
+        with open(path, encoding="utf-8") as file:
+            config = json.load(file)
+
+    if not isinstance(config, dict):
+        raise ValueError(f"{path} must contain a table of settings")
+    return config
+
+
+def resolve_options(
+    opt: argparse.Namespace, parser: argparse.ArgumentParser
+) -> argparse.Namespace:
+    """Fill unset flags from the config file, then prompt or fail for jobs"""
+    config = load_config(opt.config) if opt.config else {}
+    unknown = set(config) - CONFIG_KEYS
+    if unknown:
+        parser.error(f"Unknown config keys: {', '.join(sorted(unknown))}")
+
+    opt.job = opt.job or config.get("jobs")
+    opt.location = opt.location or config.get("locations")
+    opt.years = opt.years or config.get("years")
+    opt.output = opt.output or config.get("output")
+    opt.concurrency = opt.concurrency or config.get("concurrency")
+    opt.processes = opt.processes or config.get("processes")
+    opt.resume = opt.resume or bool(config.get("resume", False))
+
+    if isinstance(opt.job, str):
+        opt.job = [opt.job]
+    if isinstance(opt.location, str):
+        opt.location = [opt.location]
+    if isinstance(opt.years, int):
+        opt.years = [opt.years]
+
+    if not opt.job:
+        # cron / 컨테이너처럼 터미널이 없으면 입력을 기다리지 않고 종료
+        if not sys.stdin.isatty():
+            parser.error("--job or a config file with jobs is required")
+        opt.job = prompt_jobs()
+    return opt
 
 
 async def main(opt):
-    logger.info(f"Start main function (job: {opt.job[0]})")
-    manager = ScraperManager(scraper_classes=[WantedScraper], jobs=[opt.job[0]])
+    logger.info(f"Start main function (job: {opt.job})")
+    if opt.output:
+        EXPORT_CONFIG["directory"] = opt.output
+    manager = ScraperManager(
+        scraper_classes=[WantedScraper] * len(opt.job),
+        jobs=opt.job,
+        max_concurrency=opt.concurrency,
+        locations=opt.location,
+        years=opt.years,
+        processes=opt.processes,
+        resume=opt.resume,
+    )
     await manager.run()
 
 
-def parse_opt(known=False):
-    parser = argparse.ArgumentParser()
+def parse_opt(argv: List[str] = None, known=False):
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join(__doc__.splitlines()[3:]),
+    )
+    parser.add_argument(
+        "--job",
+        action="append",
+        default=None,
+        help="Job to crawl; repeat for several jobs (prompts if omitted)",
+    )
+    parser.add_argument(
+        "--location",
+        action="append",
+        default=None,
+        help="Location to crawl, e.g. seoul.all; repeat for several",
+    )
+    parser.add_argument(
+        "--years",
+        action="append",
+        type=int,
+        default=None,
+        help="Experience filter (-1 for any); repeat for several",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Directory for the exported record files (JSONL/Parquet)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Number of jobs crawled at the same time",
+    )
     parser.add_argument(
-        "--job", type=list, default=answers["job"], help="Choose the job"
+        "--processes", type=int, default=None, help="Number of worker processes"
+    )
+    parser.add_argument(
+        "--config", default=None, help="JSON or TOML file with the options"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted crawl from the durable work queue",
     )
 
-    return parser.parse_known_args()[0] if known else parser.parse_args()
+    opt = (
+        parser.parse_known_args(argv)[0] if known else parser.parse_args(argv)
+    )
+    return resolve_options(opt, parser)
 
 
-if __name__ == "__main__":
+def cli(argv: List[str] = None):
     start = time.time()
-    opt = parse_opt()
-
-    import asyncio
-
+    opt = parse_opt(argv)
     asyncio.run(main(opt))
     logger.info("Finish the work: {0:.2f} sec".format(time.time() - start))
+
+
+if __name__ == "__main__":
+    cli()
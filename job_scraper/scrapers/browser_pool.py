@@ -0,0 +1,284 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+import functools
+import glob
+import os
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    TYPE_CHECKING,
+)
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import BROWSER_CONFIG
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser
+    from playwright.async_api import BrowserContext
+    from playwright.async_api import Page
+    from playwright.async_api import Playwright
+    from playwright.async_api import Route
+
+logger = setup_logger(__name__)
+
+RouteHandler = Callable[["Route"], Awaitable[None]]
+
+
+# 한 번 호출할 때마다 Playwright driver와 한 번 왕복하는 메서드
+COUNTED_PAGE_METHODS = (
+    "goto",
+    "reload",
+    "content",
+    "evaluate",
+    "wait_for_selector",
+    "wait_for_function",
+)
+COUNTED_LOCATOR_METHODS = ("click", "count", "evaluate", "inner_text")
+
+
+async def filter_resource(route: "Route"):
+    """Block images, media, fonts, and ads that are not needed for scraping"""
+    if route.request.resource_type in BROWSER_CONFIG["blocked_resource_types"]:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def block_network(route: "Route"):
+    """Abort every request that is not answered from a recorded HAR"""
+    await route.abort()
+
+
+class BrowserPool:
+    """
+    A single Chromium instance shared by every scraper in a run.
+
+    Pages are handed out from a small number of browser contexts. The
+    resource filter is installed once per context, so every page already
+    has it. A context is retired after `max_navigations_per_context`
+    main-frame navigations and closed as soon as its last page is
+    released, which keeps the memory of long crawls bounded.
+
+    The browser is launched lazily on the first `page()` call, so runs that
+    never need a browser never pay for one.
+
+    With `har_mode="record"` every context saves its traffic as a HAR file
+    in `har_dir`. With `har_mode="replay"` requests are answered from those
+    files and everything else is aborted, so a crawl runs without network.
+    """
+
+    def __init__(
+        self,
+        headless: Optional[bool] = None,
+        max_pages: Optional[int] = None,
+        max_navigations_per_context: Optional[int] = None,
+        user_agent: Optional[str] = None,
+        route_handler: Optional[RouteHandler] = filter_resource,
+        har_dir: Optional[str] = None,
+        har_mode: Optional[str] = None,
+    ):
+        self.headless = (
+            BROWSER_CONFIG["headless"] if headless is None else headless
+        )
+        self.max_pages = max_pages or BROWSER_CONFIG["max_pages"]
+        self.max_navigations_per_context = (
+            max_navigations_per_context
+            or BROWSER_CONFIG["max_navigations_per_context"]
+        )
+        self.user_agent = user_agent or BROWSER_CONFIG["user_agent"]
+        self.route_handler = route_handler
+        if har_mode not in (None, "record", "replay"):
+            raise ValueError(f"Unsupported HAR mode: {har_mode}")
+        if har_mode is not None and har_dir is None:
+            raise ValueError("har_dir is required with har_mode")
+        self.har_dir = har_dir
+        self.har_mode = har_mode
+        if har_mode == "replay":
+            self.route_handler = block_network
+        self._har_files = 0
+
+        self._playwright: Optional["Playwright"] = None
+        self._browser: Optional["Browser"] = None
+        self._context: Optional["BrowserContext"] = None
+        self._navigations: Dict["BrowserContext", int] = defaultdict(int)
+        self._leases: Dict["BrowserContext", int] = defaultdict(int)
+        self._page_contexts: Dict["Page", "BrowserContext"] = {}
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._lock = asyncio.Lock()
+        self._round_trips = 0
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Launch the browser if it is not running yet"""
+        if self._browser is not None:
+            return
+
+        # Playwright는 브라우저가 실제로 필요할 때만 import
+        from playwright.async_api import async_playwright
+
+        logger.info("🚀 Launching shared Chromium instance")
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless
+        )
+
+    async def close(self):
+        """Close every context, the browser, and the Playwright driver"""
+        for context in list(self._leases.keys() | self._navigations.keys()):
+            await self._close_context(context)
+        self._context = None
+
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+            logger.info("Shared Chromium instance closed")
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator["Page"]:
+        """
+        Lease a page from the pool.
+
+        Yields:
+            Page: A fresh page whose context already has `route_handler`
+                  installed. The page is closed when the block exits.
+        """
+        async with self._semaphore:
+            async with self._lock:
+                await self.start()
+                context = await self._current_context()
+                self._leases[context] += 1
+
+            page = None
+            try:
+                page = await context.new_page()
+                self._count_round_trips(page, COUNTED_PAGE_METHODS)
+                self._count_locators(page)
+                self._page_contexts[page] = context
+                page.on(
+                    "framenavigated",
+                    lambda frame: self._on_navigation(page, frame),
+                )
+                yield page
+            finally:
+                if page is not None:
+                    self._page_contexts.pop(page, None)
+                    try:
+                        await page.close()
+                    except Exception as e:
+                        logger.debug(f"Failed to close page: {e}")
+
+                async with self._lock:
+                    self._leases[context] -= 1
+                    if self._is_retired(context) and not self._leases[context]:
+                        await self._close_context(context)
+
+    def round_trips(self) -> int:
+        """
+        Browser calls made through leased pages so far.
+
+        Every call such as `goto`, `evaluate` or a locator's `count` is one
+        round trip to the Playwright driver. Only the calls listed in
+        `COUNTED_PAGE_METHODS` and `COUNTED_LOCATOR_METHODS` are counted.
+        """
+        return self._round_trips
+
+    def is_exhausted(self, page: "Page") -> bool:
+        """
+        Whether the context of `page` has reached its navigation limit.
+
+        Long-lived callers should release the page and lease a new one.
+        """
+        context = self._page_contexts.get(page)
+        if context is None:
+            return True
+        return self._navigations[context] >= self.max_navigations_per_context
+
+    async def _current_context(self) -> "BrowserContext":
+        if (
+            self._context is None
+            or self._navigations[self._context]
+            >= self.max_navigations_per_context
+        ):
+            previous = self._context
+            self._context = await self._new_context()
+            if previous is not None and not self._leases[previous]:
+                await self._close_context(previous)
+        return self._context
+
+    async def _new_context(self) -> "BrowserContext":
+        # Set the user agent to bypass bot detection
+        options = {"extra_http_headers": {"User-Agent": self.user_agent}}
+        if self.har_mode == "record":
+            # context마다 별도 HAR 파일 (context를 닫을 때 기록됨)
+            os.makedirs(self.har_dir, exist_ok=True)
+            options["record_har_path"] = os.path.join(
+                self.har_dir, f"context-{self._har_files:04d}.har"
+            )
+            self._har_files += 1
+
+        context = await self._browser.new_context(**options)
+        if self.route_handler is not None:
+            await context.route("**/*", self.route_handler)
+        if self.har_mode == "replay":
+            # 나중에 등록한 route가 먼저 처리되므로 HAR에 없는 요청만 차단됨
+            for path in sorted(glob.glob(os.path.join(self.har_dir, "*.har"))):
+                await context.route_from_har(path, not_found="fallback")
+
+        self._navigations[context] = 0
+        self._leases[context] = 0
+        logger.debug("New browser context created")
+        return context
+
+    async def _close_context(self, context: "BrowserContext"):
+        self._navigations.pop(context, None)
+        self._leases.pop(context, None)
+        try:
+            await context.close()
+            logger.debug("Browser context recycled")
+        except Exception as e:
+            logger.debug(f"Failed to close browser context: {e}")
+
+    def _is_retired(self, context: "BrowserContext") -> bool:
+        return context is not self._context
+
+    def _on_navigation(self, page: "Page", frame):
+        context = self._page_contexts.get(page)
+        if context is not None and frame == page.main_frame:
+            self._navigations[context] += 1
+
+    def _count_round_trips(self, target, methods):
+        for name in methods:
+            method = getattr(target, name, None)
+            if method is not None:
+                setattr(target, name, self._counted(method))
+
+    def _counted(self, method):
+        @functools.wraps(method)
+        def call(*args, **kwargs):
+            self._round_trips += 1
+            return method(*args, **kwargs)
+
+        return call
+
+    def _count_locators(self, page: "Page"):
+        locator = page.locator
+
+        @functools.wraps(locator)
+        def counted_locator(*args, **kwargs):
+            result = locator(*args, **kwargs)
+            self._count_round_trips(result, COUNTED_LOCATOR_METHODS)
+            return result
+
+        page.locator = counted_locator
@@ -0,0 +1,188 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from job_scraper.config.logging_config import setup_logger
+
+logger = setup_logger(__name__)
+
+DETAIL_SECTION_SELECTOR = (
+    "div.JobDescription_JobDescription__paragraph__wrapper__G4CNd > div"
+)
+LD_JSON_SELECTOR = 'script[type="application/ld+json"]'
+
+# ld+json JobPosting 필드 -> 상세 정보의 항목 이름
+LD_JSON_FIELDS = {
+    "datePosted": "게시일",
+    "validThrough": "마감일",
+    "hiringOrganization": "회사",
+    "jobLocation": "근무지",
+    "employmentType": "고용형태",
+    "baseSalary": "급여",
+}
+
+# 상세 페이지의 모든 섹션과 ld+json을 한 번의 호출로 읽는다
+EXTRACT_JOB_DETAILS_JS = """
+([sectionSelector, ldJsonSelector]) => {
+    const sections = Array.from(
+        document.querySelectorAll(sectionSelector)
+    ).map((div) => {
+        const title = div.querySelector("h3");
+        const spans = Array.from(div.querySelectorAll("span"));
+        return [
+            title ? title.textContent : null,
+            spans.map((span) => span.textContent),
+        ];
+    });
+    const script = document.querySelector(ldJsonSelector);
+    return {sections, ldJson: script ? script.textContent : null};
+}
+"""
+
+
+def build_job_details(
+    sections: List[Tuple[Optional[str], List[str]]], ld_json: Optional[str]
+) -> Dict[str, str]:
+    """
+    Build the job details record from raw section texts and ld+json.
+
+    Args:
+        sections (List[Tuple[Optional[str], List[str]]]):
+            (title, span texts) pair of every description section.
+        ld_json (Optional[str]): Text of the `application/ld+json` script.
+
+    Returns:
+        Dict[str, str]: Description per section title, plus the structured
+                        fields of `LD_JSON_FIELDS` found in ld+json (e.g.
+                        the posted date under "게시일"). A section with the
+                        same title is kept as is.
+    """
+    job_details = dict()
+    for title, descriptions in sections:
+        title = title if title is not None else "No title"
+        job_details[title] = (
+            "\n".join(descriptions) if descriptions else "No description"
+        )
+        logger.debug(f"Scraped job details: {title}")
+
+    structured = parse_ld_json(ld_json)
+    for field, label in LD_JSON_FIELDS.items():
+        value = structured_text(field, structured.get(field))
+        if value:
+            job_details.setdefault(label, value)
+    return job_details
+
+
+def structured_text(field: str, value: Any) -> Optional[str]:
+    """Flatten a schema.org JobPosting field into a single string"""
+    if field == "jobLocation":
+        return _location_text(value)
+    if field == "baseSalary":
+        return _salary_text(value)
+    return _text(value)
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, list):
+        return ", ".join(filter(None, map(_text, value))) or None
+    if isinstance(value, dict):
+        # e.g. hiringOrganization: {"@type": "Organization", "name": ...}
+        return _text(value.get("name"))
+    return str(value)
+
+
+def _location_text(value: Any) -> Optional[str]:
+    locations = value if isinstance(value, list) else [value]
+    texts = []
+    for location in locations:
+        address = (
+            location.get("address", location)
+            if isinstance(location, dict)
+            else location
+        )
+        if isinstance(address, dict):
+            text = " ".join(
+                str(address[key])
+                for key in ("addressRegion", "addressLocality", "streetAddress")
+                if address.get(key)
+            )
+        else:
+            text = _text(address)
+        if text:
+            texts.append(text)
+    return ", ".join(texts) or None
+
+
+def _salary_text(value: Any) -> Optional[str]:
+    # MonetaryAmount: {"currency": "KRW", "value": {"minValue": ...,
+    # "maxValue": ..., "unitText": "YEAR"}} 또는 value가 숫자
+    if not isinstance(value, dict):
+        return _text(value)
+    amount, unit = value.get("value"), None
+    if isinstance(amount, dict):
+        unit = amount.get("unitText")
+        bounds = [
+            str(amount[key])
+            for key in ("minValue", "maxValue")
+            if amount.get(key) is not None
+        ]
+        amount = "-".join(bounds) if bounds else amount.get("value")
+    if amount is None or amount == "":
+        return None
+    text = f"{value['currency']} {amount}" if value.get("currency") else amount
+    return f"{text} / {unit}" if unit else str(text)
+
+
+def parse_ld_json(ld_json: Optional[str]) -> Dict[str, Any]:
+    """Return the JobPosting object of an ld+json document ({} if missing)"""
+    if not ld_json:
+        return {}
+    try:
+        data = json.loads(ld_json)
+    except json.JSONDecodeError as e:
+        logger.warning(f"Invalid ld+json: {e}")
+        return {}
+
+    candidates = data if isinstance(data, list) else [data]
+    for candidate in candidates:
+        if isinstance(candidate, dict) and "@graph" in candidate:
+            candidates.extend(candidate["@graph"])
+        elif isinstance(candidate, dict) and "datePosted" in candidate:
+            return candidate
+    return {}
+
+
+async def extract_job_details(page) -> Dict[str, str]:
+    """Extract the job details from a live Playwright page in one call"""
+    raw = await page.evaluate(
+        EXTRACT_JOB_DETAILS_JS, [DETAIL_SECTION_SELECTOR, LD_JSON_SELECTOR]
+    )
+    logger.debug(f"Found {len(raw['sections'])} div elements.")
+    return build_job_details(raw["sections"], raw["ldJson"])
+
+
+def parse_job_details(content: str) -> Dict[str, str]:
+    """
+    Extract the job details from saved HTML with lxml, without a browser.
+
+    Produces the same record as `extract_job_details`, so archived pages can
+    be parsed offline.
+    """
+    from lxml import html as lxml_html  # 저장된 HTML을 파싱할 때만 import
+
+    tree = lxml_html.fromstring(content)
+    sections = []
+    for div in tree.cssselect(DETAIL_SECTION_SELECTOR):
+        title = div.cssselect("h3")
+        sections.append(
+            (
+                title[0].text_content() if title else None,
+                [span.text_content() for span in div.cssselect("span")],
+            )
+        )
+
+    ld_json = tree.cssselect(LD_JSON_SELECTOR)
+    return build_job_details(
+        sections, ld_json[0].text_content() if ld_json else None
+    )
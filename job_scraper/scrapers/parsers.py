@@ -0,0 +1,269 @@
+from abc import ABC
+from abc import abstractmethod
+import copy
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import PARSER_CONFIG
+
+# lxml과 cssselect는 HTML을 파싱할 때만 import (api 모드에서는 필요 없음)
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from cssselect import HTMLTranslator
+    from lxml import etree
+    from lxml import html as lxml_html
+    from lxml.cssselect import CSSSelector
+
+logger = setup_logger(__name__)
+
+Markup = Union[str, bytes]
+ElementMatcher = Callable[["etree._Element"], bool]
+
+
+class ParserBackend(ABC):
+    """HTML parser used by a scraper to turn markup into selectable trees"""
+
+    name: str
+
+    @abstractmethod
+    def parse(self, content: Markup) -> Any:
+        """Parse a whole document"""
+        pass
+
+    @abstractmethod
+    def select(self, tree: Any, selector: str) -> List[Any]:
+        """Elements of `tree` matching a CSS selector"""
+        pass
+
+    @abstractmethod
+    def text(self, element: Any) -> str:
+        """Text content of an element and its descendants"""
+        pass
+
+
+class LxmlBackend(ParserBackend):
+    """lxml.html tree, translating the CSS selector on every call"""
+
+    name = "lxml"
+
+    def parse(self, content: Markup) -> "lxml_html.HtmlElement":
+        from lxml import html as lxml_html
+
+        return lxml_html.fromstring(content)
+
+    def select(
+        self, tree: "lxml_html.HtmlElement", selector: str
+    ) -> List[Any]:
+        return tree.cssselect(selector)
+
+    def text(self, element: "lxml_html.HtmlElement") -> str:
+        return element.text_content()
+
+
+class CssSelectBackend(LxmlBackend):
+    """
+    lxml.html tree with compiled selectors.
+
+    Each CSS selector is translated to XPath and compiled once, so repeated
+    selections (e.g. the same card selector on every page) only run the
+    compiled XPath. This is the fastest backend.
+    """
+
+    name = "css"
+
+    def select(
+        self, tree: "lxml_html.HtmlElement", selector: str
+    ) -> List[Any]:
+        return compile_selector(selector)(tree)
+
+
+class SoupBackend(ParserBackend):
+    """BeautifulSoup over the lxml parser, for code that needs the bs4 API"""
+
+    name = "bs4"
+
+    def parse(self, content: Markup) -> "BeautifulSoup":
+        from bs4 import BeautifulSoup  # bs4 backend를 쓸 때만 import
+
+        return BeautifulSoup(content, "lxml")
+
+    def select(self, tree: "BeautifulSoup", selector: str) -> List[Any]:
+        return tree.select(selector)
+
+    def text(self, element) -> str:
+        return element.get_text()
+
+
+PARSER_BACKENDS: Dict[str, Type[ParserBackend]] = {
+    backend.name: backend
+    for backend in (CssSelectBackend, LxmlBackend, SoupBackend)
+}
+
+
+def get_parser(scraper_name: str = None) -> ParserBackend:
+    """
+    Parser backend configured for a scraper.
+
+    Args:
+        scraper_name (str): Scraper class name looked up in
+            `PARSER_CONFIG["scrapers"]`. Falls back to the default backend.
+    """
+    name = PARSER_CONFIG["scrapers"].get(scraper_name, PARSER_CONFIG["backend"])
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unsupported parser backend: {name}")
+    return PARSER_BACKENDS[name]()
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str) -> "CSSSelector":
+    from lxml.cssselect import CSSSelector
+
+    return CSSSelector(selector, translator="html")
+
+
+@lru_cache(maxsize=256)
+def compile_matcher(selector: str) -> ElementMatcher:
+    """
+    Compile a CSS selector into a test of a single element.
+
+    Unlike `compile_selector`, which searches a subtree, the matcher checks
+    an element against its own ancestors only, so it works on a document
+    that is still being parsed. Descendant (` `) and child (`>`) combinators
+    are supported.
+    """
+    import cssselect
+
+    translator = cssselect.HTMLTranslator()
+    chains = []
+    for parsed in cssselect.parse(selector):
+        if parsed.pseudo_element:
+            raise ValueError(f"Pseudo-elements are not supported: {selector}")
+
+        # a b > c 는 왼쪽으로 중첩된 CombinedSelector이므로 오른쪽부터 펼친다
+        chain: List[Tuple["etree.XPath", str]] = []
+        node, combinator = parsed.parsed_tree, None
+        while isinstance(node, cssselect.parser.CombinedSelector):
+            if node.combinator not in (" ", ">"):
+                raise ValueError(
+                    f"Unsupported combinator {node.combinator!r}: {selector}"
+                )
+            chain.append(
+                (_self_xpath(translator, node.subselector), combinator)
+            )
+            node, combinator = node.selector, node.combinator
+        chain.append((_self_xpath(translator, node), combinator))
+        chains.append(chain)
+
+    def matches(element: "etree._Element") -> bool:
+        return any(_matches_chain(element, chain) for chain in chains)
+
+    return matches
+
+
+def _self_xpath(translator: "HTMLTranslator", compound) -> "etree.XPath":
+    from lxml import etree
+
+    return etree.XPath(f"self::{translator.xpath(compound)}")
+
+
+def _matches_chain(
+    element: "etree._Element", chain: List[Tuple["etree.XPath", str]]
+) -> bool:
+    test, combinator = chain[0]
+    if not test(element):
+        return False
+    if len(chain) == 1:
+        return True
+
+    parent = element.getparent()
+    if combinator == ">":
+        return parent is not None and _matches_chain(parent, chain[1:])
+    while parent is not None:
+        if _matches_chain(parent, chain[1:]):
+            return True
+        parent = parent.getparent()
+    return False
+
+
+class StreamingParser:
+    """
+    Incremental HTML parser that finds elements while bytes arrive.
+
+    Bytes are fed to `etree.HTMLPullParser` as they are received. An
+    element is reported once its end tag has been parsed, i.e. as soon as
+    it is complete, without waiting for the rest of the document. Reported
+    elements are detached copies, so they stay valid after later `feed`
+    calls while the parsed tree is cleared behind them.
+
+    Usage:
+        parser = StreamingParser('div[data-cy="job-card"] a')
+        async for chunk in response.aiter_bytes():
+            for link in parser.feed(chunk):
+                ...
+        for link in parser.close():
+            ...
+    """
+
+    def __init__(self, selector: str, encoding: str = "utf-8"):
+        from lxml import etree
+
+        self.matches = compile_matcher(selector)
+        self._parser = etree.HTMLPullParser(events=("end",), encoding=encoding)
+        self._found: List["etree._Element"] = []
+
+    def feed(self, chunk: bytes) -> List["etree._Element"]:
+        self._parser.feed(chunk)
+        return self._read()
+
+    def close(self) -> List["etree._Element"]:
+        self._parser.close()
+        return self._read()
+
+    def _read(self) -> List["etree._Element"]:
+        # 이미 사본을 돌려준 원본은 비워서 메모리를 줄인다
+        for element in self._found:
+            element.clear(keep_tail=True)
+        self._found = [
+            element
+            for _, element in self._parser.read_events()
+            if self.matches(element)
+        ]
+        # 호출자가 모아 두어도 내용이 지워지지 않도록 분리된 사본을 돌려준다
+        return [copy.deepcopy(element) for element in self._found]
+
+
+def iter_elements(
+    chunks: Iterable[Markup], selector: str
+) -> Iterator["etree._Element"]:
+    """Yield elements matching `selector` while parsing `chunks`"""
+    parser = StreamingParser(selector)
+    for chunk in chunks:
+        yield from parser.feed(
+            chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        )
+    yield from parser.close()
+
+
+async def aiter_elements(
+    chunks: AsyncIterator[bytes], selector: str
+) -> AsyncIterator["etree._Element"]:
+    """Async version of `iter_elements`, e.g. over `response.aiter_bytes()`"""
+    parser = StreamingParser(selector)
+    async for chunk in chunks:
+        for element in parser.feed(chunk):
+            yield element
+    for element in parser.close():
+        yield element
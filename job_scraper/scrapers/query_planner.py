@@ -0,0 +1,234 @@
+import asyncio
+from collections import Counter
+from collections import defaultdict
+from itertools import product
+from typing import Any, Dict, Iterable, List, MutableMapping, Tuple, Type
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import JOB_CONFIG
+from job_scraper.config.settings import MANAGER_CONFIG
+from job_scraper.scrapers.scraper import WebScraper
+from job_scraper.utils.metrics import metrics
+
+logger = setup_logger(__name__)
+
+# (scraper class, job, params override)
+ScrapeTask = Tuple[Type[WebScraper], Any, Dict[str, Any]]
+
+# {href: metadata} 공고 레코드
+Posting = Dict[str, Dict[str, Any]]
+
+# 검색 조건 grid의 차원 (JOB_CONFIG["params"]의 key)
+GRID_PARAMS = ("locations", "years")
+
+
+def task_key(job: Any, params: Dict[str, Any]) -> Tuple:
+    """Key of a task in `ScraperManager.results`, e.g. (job, location, years)"""
+    return (job,) + tuple(params.get(name) for name in GRID_PARAMS)
+
+
+class QueryPlanner:
+    """
+    Expands a grid of jobs x locations x years into scrape tasks.
+
+    Each dimension defaults to `MANAGER_CONFIG`, then to the single value
+    in `JOB_CONFIG["params"]`, so covering more regions or experience
+    levels is a matter of listing them instead of running again.
+
+    Usage:
+        planner = QueryPlanner(
+            [WantedScraper] * 2,
+            ["데이터 엔지니어", "빅데이터 엔지니어"],
+            locations=["seoul.all", "gyeonggi.all"],
+            years=[-1, 0],
+        )
+        planner.tasks()  # 2 x 2 x 2 = 8 tasks
+    """
+
+    def __init__(
+        self,
+        scraper_classes: List[Type[WebScraper]],
+        jobs: List[Any],
+        locations: List[str] = None,
+        years: List[int] = None,
+    ):
+        self.scraper_classes = scraper_classes
+        self.jobs = jobs
+        self.grid: Dict[str, List[Any]] = {
+            "locations": self._axis("locations", locations),
+            "years": self._axis("years", years),
+        }
+
+    @staticmethod
+    def _axis(name: str, values: List[Any] = None) -> List[Any]:
+        values = values or MANAGER_CONFIG[name] or [JOB_CONFIG["params"][name]]
+        # 같은 값이 두 번 들어와도 task는 하나만
+        return list(dict.fromkeys(values))
+
+    def tasks(self) -> List[ScrapeTask]:
+        """One task per (scraper, job) and every point of the grid"""
+        return [
+            (Scraper, job, dict(zip(self.grid, point)))
+            for Scraper, job in dict.fromkeys(
+                zip(self.scraper_classes, self.jobs)
+            )
+            for point in product(*self.grid.values())
+        ]
+
+
+class PostingRegistry:
+    """
+    Hands each `posting_id` to the first query of the grid that lists it.
+
+    Related categories (e.g. 데이터 엔지니어 and 빅데이터 엔지니어) and
+    neighbouring locations return many of the same postings. Scrapers
+    `claim` a posting before queuing it for details, so a posting listed
+    by several queries is fetched and saved only once, and the registry
+    counts how many detail fetches that saved. The other queries still
+    save their listing record, only the detail fetch is skipped.
+
+    A query whose crawl fails `release`s the postings it had not finished.
+    `orphans` then hands those postings to another query that listed them,
+    so they are not lost with the failed crawl.
+
+    `claims` can be a `multiprocessing.Manager().dict()`, shared by the
+    worker processes of a sharded run; `setdefault` on it is atomic.
+    """
+
+    def __init__(self, claims: MutableMapping[str, str] = None):
+        self.shared = claims is not None
+        self.claims = claims if claims is not None else {}
+        self.listed: Counter = Counter()  # query -> 목록에서 본 공고 수
+        self.claimed: Counter = Counter()  # query -> 상세를 가져갈 공고 수
+        self.overlaps: Counter = Counter()  # (query, owner) -> 겹친 공고 수
+        # posting_id -> owner 대신 가져올 수 있는 첫 번째 (query, 공고)
+        self.deferred: Dict[str, Tuple[str, Posting]] = {}
+        self.released = set()  # 실패한 owner가 놓아준 posting_id
+
+    async def claim(
+        self, posting_id: str, query: str, posting: Posting = None
+    ) -> bool:
+        """
+        Record that `query` listed the posting.
+
+        Args:
+            posting_id (str): ID of the posting.
+            query (str): Query that listed it.
+            posting (Posting): Listing record, kept when another query owns
+                the posting so `query` can fetch it if the owner fails.
+
+        Returns:
+            bool: Whether `query` owns the posting and should fetch it.
+        """
+        if self.shared:
+            # Manager dict는 blocking IPC이므로 thread에서 호출
+            owner = await asyncio.to_thread(
+                self.claims.setdefault, posting_id, query
+            )
+        else:
+            owner = self.claims.setdefault(posting_id, query)
+
+        self.listed[query] += 1
+        if owner == query:
+            self.claimed[query] += 1
+            return True
+        self.overlaps[(query, owner)] += 1
+        if posting is not None:
+            self.deferred.setdefault(posting_id, (query, posting))
+        metrics.counter(
+            "postings_deduplicated_total",
+            "Postings already claimed by another query of the grid",
+        ).inc()
+        return False
+
+    async def release(self, query: str, posting_ids: Iterable[str]) -> int:
+        """
+        Give up the claims of `query` on postings it did not finish.
+
+        Returns:
+            int: Number of claims released.
+        """
+
+        def release_owned() -> List[str]:
+            released = []
+            for posting_id in posting_ids:
+                if self.claims.get(posting_id) == query:
+                    del self.claims[posting_id]
+                    released.append(posting_id)
+            return released
+
+        if self.shared:
+            released = await asyncio.to_thread(release_owned)
+        else:
+            released = release_owned()
+
+        self.released.update(released)
+        self.claimed[query] -= len(released)
+        metrics.counter(
+            "postings_released_total", "Claims released by failed queries"
+        ).inc(len(released))
+        return len(released)
+
+    def orphans(self) -> Dict[str, List[Posting]]:
+        """
+        Released postings that no other query claimed since.
+
+        Each one is assigned to the first other query that listed it, which
+        then owns it.
+
+        Returns:
+            Dict[str, List[Posting]]: Listing records to fetch, by query.
+        """
+        orphans = defaultdict(list)
+        for posting_id in self.released:
+            if posting_id in self.deferred and posting_id not in self.claims:
+                query, posting = self.deferred.pop(posting_id)
+                self.claims[posting_id] = query
+                self.claimed[query] += 1
+                orphans[query].append(posting)
+        self.released.clear()
+        return dict(orphans)
+
+    def state(self) -> Dict[str, Any]:
+        """Picklable counters that can be merged into another registry"""
+        return {
+            "listed": dict(self.listed),
+            "claimed": dict(self.claimed),
+            "overlaps": list(self.overlaps.items()),
+            "deferred": list(self.deferred.items()),
+            "released": list(self.released),
+        }
+
+    def merge(self, state: Dict[str, Any]):
+        self.listed.update(state["listed"])
+        self.claimed.update(state["claimed"])
+        self.overlaps.update(
+            {tuple(pair): count for pair, count in state["overlaps"]}
+        )
+        for posting_id, (query, posting) in state["deferred"]:
+            self.deferred.setdefault(posting_id, (query, posting))
+        self.released.update(state["released"])
+
+    def report(self, top: int = 5) -> Dict[str, Any]:
+        """
+        How much the de-duplication saved.
+
+        Returns:
+            Dict[str, Any]: Postings listed over the whole grid, unique
+                postings, detail fetches saved and the share they represent,
+                plus the query pairs that overlap the most.
+        """
+        listed = sum(self.listed.values())
+        unique = sum(self.claimed.values())
+        saved = listed - unique
+        return {
+            "queries": len(self.listed),
+            "listed_postings": listed,
+            "unique_postings": unique,
+            "detail_fetches_saved": saved,
+            "saved_ratio": round(saved / listed, 3) if listed else 0.0,
+            "top_overlaps": [
+                {"query": query, "owner": owner, "postings": count}
+                for (query, owner), count in self.overlaps.most_common(top)
+            ],
+        }
@@ -1,20 +1,39 @@
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Union
+from abc import ABC
+from abc import abstractmethod
+from typing import Any, Dict, Iterator, List, TYPE_CHECKING, Union
 
-from bs4 import BeautifulSoup
-from lxml.etree import _ElementTree
-from playwright.async_api import ElementHandle
-from selenium.webdriver.remote.webelement import WebElement
+import httpx
 
-from job_scraper.config.settings import HEADERS, USER_AGENTS
-from job_scraper.utils.url_validator import is_valid_url
+from job_scraper.config.logging_config import rate_limited
 from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import HEADERS
+from job_scraper.config.settings import USER_AGENTS
+from job_scraper.utils.metrics import metrics
+from job_scraper.utils.resilience import CircuitOpenError
+from job_scraper.utils.resilience import classify
+from job_scraper.utils.resilience import ScraperError
+from job_scraper.utils.resilience import TransientError
+from job_scraper.utils.url_validator import is_valid_url_async
 
 logger= setup_logger(__name__)
 
 # Type alias definition
-HTMLContent = Union[str, ElementHandle, WebElement]
-ParsedContent = Union[_ElementTree, BeautifulSoup, Dict[str, Any]]
+# 브라우저/파서 패키지는 타입 검사 때만 import (실행 시 불필요한 import 비용 제거)
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from lxml.etree import _Element
+    from lxml.etree import _ElementTree
+    from playwright.async_api import ElementHandle
+    from selenium.webdriver.remote.webelement import WebElement
+
+HTMLContent = Union[str, bytes, "ElementHandle", "WebElement"]
+ParsedContent = Union[
+    "_ElementTree",
+    "_Element",
+    "BeautifulSoup",
+    Dict[str, Any],
+    Iterator["_Element"],
+]
 
 
 class WebScraper(ABC):
@@ -82,18 +101,21 @@ class WebScraper(ABC):
         pass
     
     @staticmethod
-    async def validate_url(url: str) -> bool:
+    async def validate_url(url: str, client: httpx.AsyncClient = None) -> bool:
         """
         Validate the URL by checking its format and existencd. 
         
         This method should: 
         - Verify if the URL format is correct using regex or other validation techniques.
         - Make a request to check if the URL is accessible. 
+
+        The reachability check goes through `client` without blocking the
+        event loop, and its result is cached per URL and host for a while.
         
         Return `True` if the URL is valid and reachable, otherwise `ValueError` 
         """
         try:
-            if not is_valid_url(url): 
+            if not await is_valid_url_async(url, client): 
                 raise ValueError(f"Invalid URL: {url}")
 
             return True 
@@ -111,11 +133,35 @@ class WebScraper(ABC):
         pass
 
     @abstractmethod
-    def save(self, data, file_format: str):
-        """Save the parsed data in a specific format"""
+    async def save(self, data):
+        """Save a scraped record to the configured storage"""
         pass
 
-    @abstractmethod
-    def handle_error(self, error: Exception):
-        """Handle errors that occur during scraping"""
-        pass
+    def handle_error(self, error: Exception, url: str = None) -> ScraperError:
+        """
+        Handle errors that occur during scraping.
+
+        The error is classified (transient, permanent or circuit open),
+        counted and logged at a level matching its kind. Retries happen
+        before this, in `Resilience.call`.
+
+        Returns:
+            ScraperError: The classified error, for the caller to raise or
+                record.
+        """
+        original, error = error, classify(error, url)
+        metrics.counter(
+            "scrape_errors_total", "Scraping errors by kind", kind=error.kind
+        ).inc()
+        extra = rate_limited(f"scrape_error_{error.kind}")
+        if isinstance(error, CircuitOpenError):
+            logger.debug(f"Skipped {url}: {error}", extra=extra)
+        elif isinstance(error, TransientError):
+            logger.warning(f"Gave up on {url}: {error}", extra=extra)
+        else:
+            logger.error(
+                f"Failed to scrape {url}: {error}",
+                exc_info=original,
+                extra=extra,
+            )
+        return error
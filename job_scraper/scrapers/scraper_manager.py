@@ -1,23 +1,122 @@
 import asyncio as asyc
-from typing import Any, List, Type
-
-import httpx
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AsyncExitStack
+import multiprocessing
+import time
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import CRAWL_STATE_CONFIG
+from job_scraper.config.settings import EXPORT_CONFIG
+from job_scraper.config.settings import HTTP_CACHE_CONFIG
+from job_scraper.config.settings import MANAGER_CONFIG
+from job_scraper.config.settings import METRICS_CONFIG
+from job_scraper.config.settings import PERSISTENCE_CONFIG
+from job_scraper.config.settings import WORK_QUEUE_CONFIG
+from job_scraper.scrapers.browser_pool import BrowserPool
+from job_scraper.scrapers.query_planner import Posting
+from job_scraper.scrapers.query_planner import PostingRegistry
+from job_scraper.scrapers.query_planner import QueryPlanner
+from job_scraper.scrapers.query_planner import ScrapeTask
+from job_scraper.scrapers.query_planner import task_key
 from job_scraper.scrapers.scraper import WebScraper
+from job_scraper.storage.crawl_state import CrawlStateStore
+from job_scraper.storage.database import DatabaseSink
+from job_scraper.storage.exporter import StreamExporter
+from job_scraper.storage.work_queue import DurableWorkQueue
+from job_scraper.utils.http_cache import HttpCache
+from job_scraper.utils.http_client import create_client
+from job_scraper.utils.metrics import metrics
+from job_scraper.utils.rate_limiter import RateLimiter
+from job_scraper.utils.resilience import Resilience
 
 logger = setup_logger(__name__)
 
 
+class ResultForwarder:
+    """Exporter stand-in that sends records from a worker to the parent"""
+
+    def __init__(self, results):
+        self.results = results
+        self.sent = 0
+
+    async def put(self, record: Dict[str, Any]):
+        # Manager queue는 blocking IPC이므로 thread에서 호출
+        await asyc.to_thread(self.results.put, record)
+        self.sent += 1
+
+
+def run_shard(
+    Scraper: Type[WebScraper],
+    job: Any,
+    params: Dict[str, Any],
+    results,
+    resume: bool = False,
+    claims=None,
+) -> Dict[str, Any]:
+    """
+    Entry point of a worker process.
+
+    Crawls a single job x location x years shard on its own event loop and
+    browser, streaming finished records back through `results`. Postings
+    are claimed in the shared `claims` dict, so a posting listed by several
+    shards is fetched by only one of them. The returned metrics cover this
+    shard only, since the pool runs several shards in the same worker.
+    """
+    # worker process는 재사용되므로 이전 shard의 값을 지우고 이 shard의 값만 보낸다
+    metrics.reset()
+    forwarder = ResultForwarder(results)
+    registry = PostingRegistry(claims)
+    manager = ScraperManager(
+        [Scraper],
+        [job],
+        locations=[params["locations"]],
+        years=[params["years"]],
+        processes=1,
+        resume=resume,
+    )
+    start = time.monotonic()
+    asyc.run(manager._run_local(forwarder, registry))
+    return {
+        **manager.stats,
+        "records": forwarder.sent,
+        "worker_seconds": round(time.monotonic() - start, 2),
+        "metrics": metrics.state(),
+        "overlap": registry.state(),
+        "queries": manager.queries,
+    }
+
+
 class ScraperManager:
     def __init__(
-        self, scraper_classes: List[Type[WebScraper]], jobs: List[Any]
+        self,
+        scraper_classes: List[Type[WebScraper]],
+        jobs: List[Any],
+        max_concurrency: int = None,
+        per_scraper_concurrency: Dict[str, int] = None,
+        locations: List[str] = None,
+        years: List[int] = None,
+        processes: int = None,
+        resume: bool = False,
     ):
         """
         Initialize the ScraperManager with a list of scraper instance.
 
         Args:
             scrapers (List[Type[WebScraper]]): List of scraper instance to manage.
+            jobs (List[Any]): Job passed to `create` of the matching scraper.
+            max_concurrency (int): Number of jobs running at the same time.
+            per_scraper_concurrency (Dict[str, int]): Cap on concurrent jobs
+                per scraper class name.
+            locations (List[str]): Locations crawled for every job. Defaults
+                to the location in `JOB_CONFIG["params"]`.
+            years (List[int]): Experience filters crawled for every job and
+                location. Defaults to the one in `JOB_CONFIG["params"]`.
+            processes (int): Number of worker processes. With more than one,
+                the job x location x years shards are crawled in a process
+                pool.
+            resume (bool): Continue interrupted crawls from the durable work
+                queue instead of starting over.
         """
         if len(scraper_classes) != len(jobs):
             raise ValueError(
@@ -27,24 +126,357 @@ class ScraperManager:
         self.scraper_classes = scraper_classes
         self.task_queue = asyc.Queue()
         self.jobs = jobs
+        self.max_concurrency = (
+            max_concurrency or MANAGER_CONFIG["max_concurrency"]
+        )
+        self.per_scraper_concurrency = (
+            per_scraper_concurrency
+            or MANAGER_CONFIG["per_scraper_concurrency"]
+        )
+        self.planner = QueryPlanner(scraper_classes, jobs, locations, years)
+        self.registry = PostingRegistry()
+        self.processes = processes or MANAGER_CONFIG["processes"]
+        self.resume = resume
+        self.results: Dict[Any, Optional[Exception]] = {}
+        self.stats: Dict[str, Any] = {}
+        # scraper의 queue_name -> task (실패한 query의 공고를 넘길 때 사용)
+        self.queries: Dict[str, ScrapeTask] = {}
+
+        self.logger = logger
 
-        self.logger = setup_logger(__name__)
+    def tasks(self) -> List[ScrapeTask]:
+        """Expand the jobs into one task per job x location x years"""
+        return self.planner.tasks()
 
     async def run(self):
         """
         Orchestrates the scraping process for all scrapers in the manager.
+
+        Runs every task in this process, or splits them across a process
+        pool when `processes` is greater than one.
+        """
+        if METRICS_CONFIG["enabled"] and METRICS_CONFIG["port"]:
+            metrics.serve()
+
+        try:
+            if self.processes > 1:
+                await self._run_sharded()
+            else:
+                await self._run_local()
+        finally:
+            if METRICS_CONFIG["enabled"]:
+                metrics.export()
+
+        self.stats["overlap"] = self.registry.report()
+        self.logger.info(
+            "Query grid overlap: {listed_postings} postings listed, "
+            "{unique_postings} unique, {detail_fetches_saved} detail fetches "
+            "saved".format(**self.stats["overlap"])
+        )
+        self.logger.info(f"Crawl stats: {self.stats}")
+
+    async def _run_local(
+        self,
+        exporter: ResultForwarder = None,
+        registry: PostingRegistry = None,
+        orphans: Dict[str, List[Posting]] = None,
+    ):
         """
+        Run every task on the current event loop.
 
-        for Scraper, job in zip(self.scraper_classes, self.jobs):
-            try:
-                self.logger.info(f"Starting scraper: {Scraper.__name__}")
-                # Create a new instance of the scraper
-                wscraper = await Scraper.create(job)
+        Every (scraper, job, location) task is put into `task_queue` and
+        consumed by up to `max_concurrency` workers, with an extra cap per
+        scraper class. A failing job is logged and recorded in `results`
+        without affecting the others. The postings a failed job had claimed
+        but not finished are then fetched by another query that listed
+        them (see `PostingRegistry.orphans`).
 
-                async with httpx.AsyncClient() as session:
-                    await wscraper.fetch(session, wscraper.url)
+        The jobs share every resource of the run: one browser pool (so
+        Chromium is launched at most once), one rate limiter (so httpx
+        requests and browser navigations to the same host are paced
+        together), one HTTP client behind the on-disk HTTP cache, one set of
+        per-host circuit breakers and the retry budget, the registry that
+        de-duplicates postings across the query grid, the crawl state
+        store, the batched persistence sink, and the streaming exporter.
 
-            except Exception as e:
-                self.logger.error(
-                    f"Error in {Scraper.__name__}: {e}", exc_info=True
+        Args:
+            exporter (ResultForwarder): Replaces the persistence sink and the
+                streaming exporter, used by worker processes.
+            registry (PostingRegistry): Posting claims shared with the other
+                shards, used by worker processes. They leave the released
+                postings to the parent.
+            orphans (Dict[str, List[Posting]]): Only fetch these postings,
+                by query, instead of running the tasks.
+        """
+        if registry is not None:
+            self.registry = registry
+        rate_limiter = RateLimiter()
+
+        async with AsyncExitStack() as stack:
+            crawl_state = http_cache = sink = durable_queue = None
+            if CRAWL_STATE_CONFIG["enabled"]:
+                crawl_state = CrawlStateStore()
+                stack.callback(crawl_state.close)
+            if WORK_QUEUE_CONFIG["enabled"]:
+                durable_queue = DurableWorkQueue()
+                stack.push_async_callback(durable_queue.close)
+            if HTTP_CACHE_CONFIG["enabled"]:
+                http_cache = HttpCache()
+                stack.callback(http_cache.close)
+            if exporter is None:
+                sink, exporter = await self._open_outputs(stack)
+
+            browser_pool = await stack.enter_async_context(BrowserPool())
+            # 모든 scraper가 하나의 connection pool을 공유
+            session = await stack.enter_async_context(
+                create_client(rate_limiter, http_cache=http_cache)
+            )
+            shared = dict(
+                browser_pool=browser_pool,
+                rate_limiter=rate_limiter,
+                crawl_state=crawl_state,
+                sink=sink,
+                exporter=exporter,
+                http_cache=http_cache,
+                durable_queue=durable_queue,
+                resume=self.resume,
+                session=session,
+                resilience=Resilience(),
+                posting_registry=self.registry,
+            )
+
+            if orphans is not None:
+                await self._fetch_orphans(orphans, shared)
+                return
+
+            self.results.update(await self._run_tasks(self.tasks(), shared))
+            self.stats = {
+                "tasks": len(self.results),
+                "failed": sum(bool(error) for error in self.results.values()),
+                "skipped": crawl_state.skipped if crawl_state else 0,
+            }
+            if not self.registry.shared:
+                await self._fetch_orphans(self.registry.orphans(), shared)
+
+    async def _run_tasks(
+        self,
+        tasks: List[ScrapeTask],
+        shared: Dict[str, Any],
+        postings: Dict[Tuple, List[Posting]] = None,
+    ) -> Dict[Any, Optional[Exception]]:
+        """Run `tasks` with the worker pool and return the error of each"""
+        results: Dict[Any, Optional[Exception]] = {}
+        for task in tasks:
+            self.task_queue.put_nowait(task)
+        scraper_limits = {
+            Scraper: asyc.Semaphore(
+                self.per_scraper_concurrency.get(
+                    Scraper.__name__, self.max_concurrency
                 )
+            )
+            for Scraper in set(self.scraper_classes)
+        }
+
+        await asyc.gather(
+            *(
+                self._worker(scraper_limits, shared, results, postings)
+                for _ in range(min(self.max_concurrency, len(tasks)))
+            )
+        )
+        return results
+
+    async def _fetch_orphans(
+        self, orphans: Dict[str, List[Posting]], shared: Dict[str, Any]
+    ):
+        """Fetch the postings released by failed queries, by their new owner"""
+        tasks = [self.queries[query] for query in orphans]
+        if not tasks:
+            return
+        self.logger.info(
+            f"Fetching {sum(map(len, orphans.values()))} postings released "
+            f"by failed queries with {len(tasks)} other queries"
+        )
+        postings = {
+            task_key(job, params): orphans[query]
+            for query, (Scraper, job, params) in zip(orphans, tasks)
+        }
+        results = await self._run_tasks(tasks, shared, postings)
+        self.stats["orphans"] = {
+            "postings": sum(map(len, orphans.values())),
+            "failed": sum(bool(error) for error in results.values()),
+        }
+
+    async def _run_sharded(self):
+        """
+        Crawl the job x location x years shards in a process pool.
+
+        Each worker runs its own event loop and browser. Postings are claimed
+        in a dict shared by the workers, so each detail page is fetched by a
+        single shard. Finished records stream back through a bounded queue;
+        the parent de-duplicates them by `posting_id` and query, writes them
+        to its own sink and exporter, and merges the per-worker stats.
+        Postings released by failed shards are fetched last, in the parent.
+        """
+        tasks = self.tasks()
+        loop = asyc.get_running_loop()
+        context = multiprocessing.get_context("spawn")
+
+        with context.Manager() as mp_manager, ProcessPoolExecutor(
+            max_workers=self.processes, mp_context=context
+        ) as pool:
+            results = mp_manager.Queue(maxsize=EXPORT_CONFIG["queue_size"])
+            claims = mp_manager.dict()  # posting_id -> 처음 수집한 query
+            registry = self.registry = PostingRegistry(claims)
+
+            async with AsyncExitStack() as stack:
+                sink, exporter = await self._open_outputs(stack)
+                collector = asyc.create_task(
+                    self._collect(results, sink, exporter)
+                )
+
+                shard_stats = await asyc.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool,
+                            run_shard,
+                            Scraper,
+                            job,
+                            params,
+                            results,
+                            self.resume,
+                            claims,
+                        )
+                        for Scraper, job, params in tasks
+                    ),
+                    return_exceptions=True,
+                )
+                for (Scraper, job, params), stats in zip(tasks, shard_stats):
+                    key = task_key(job, params)
+                    if isinstance(stats, BaseException):
+                        self.logger.error(f"Shard {key} failed: {stats}")
+                        self.results[key] = stats
+                        continue
+                    self.results[key] = None
+                    metrics.merge(stats.pop("metrics"))
+                    registry.merge(stats.pop("overlap"))
+                    self.queries.update(stats.pop("queries"))
+                    for name, value in stats.items():
+                        self.stats[name] = self.stats.get(name, 0) + value
+
+                # 실패한 shard가 놓아준 공고는 같은 collector로 흘려보낸다
+                orphans = registry.orphans()
+                if orphans:
+                    await self._run_local(
+                        ResultForwarder(results), registry, orphans
+                    )
+                await asyc.to_thread(results.put, None)
+                collected, duplicates = await collector
+
+        self.stats.update(
+            shards=len(tasks),
+            failed_shards=sum(
+                isinstance(stats, BaseException) for stats in shard_stats
+            ),
+            unique_postings=collected,
+            duplicate_postings=duplicates,
+        )
+
+    async def _collect(
+        self,
+        results,
+        sink: Optional[DatabaseSink],
+        exporter: Optional[StreamExporter],
+    ) -> Tuple[int, int]:
+        # (posting_id, query) -> 상세 정보 포함 여부
+        seen: Dict[Tuple[str, str], bool] = {}
+        duplicates = 0
+
+        while True:
+            record = await asyc.to_thread(results.get)
+            if record is None:
+                return len({posting_id for posting_id, _ in seen}), duplicates
+
+            key = (record["posting_id"], record.get("query"))
+            has_details = bool(record.get("job_details"))
+            if key in seen and (seen[key] or not has_details):
+                duplicates += 1
+                continue
+            seen[key] = has_details
+
+            if exporter is not None:
+                await exporter.put(record)
+            if sink is not None:
+                await sink.put_record(record)
+
+    @staticmethod
+    async def _open_outputs(
+        stack: AsyncExitStack,
+    ) -> Tuple[Optional[DatabaseSink], Optional[StreamExporter]]:
+        sink = exporter = None
+        if PERSISTENCE_CONFIG["enabled"]:
+            sink = await stack.enter_async_context(DatabaseSink())
+        if EXPORT_CONFIG["enabled"]:
+            exporter = await stack.enter_async_context(StreamExporter())
+        return sink, exporter
+
+    async def _worker(
+        self,
+        scraper_limits: Dict[Type[WebScraper], asyc.Semaphore],
+        shared: Dict[str, Any],
+        results: Dict[Any, Optional[Exception]],
+        postings: Dict[Tuple, List[Posting]] = None,
+    ):
+        while not self.task_queue.empty():
+            Scraper, job, params = self.task_queue.get_nowait()
+            key = task_key(job, params)
+            metrics.gauge("task_queue_depth", "Jobs waiting to start").set(
+                self.task_queue.qsize()
+            )
+            async with scraper_limits[Scraper]:
+                with metrics.gauge(
+                    "jobs_in_flight", "Jobs running", scraper=Scraper.__name__
+                ).track(), metrics.histogram(
+                    "job_seconds", "Duration of a job", scraper=Scraper.__name__
+                ).time():
+                    error = await self._run_job(
+                        Scraper,
+                        job,
+                        params,
+                        shared,
+                        postings[key] if postings else None,
+                    )
+            results[key] = error
+            metrics.counter(
+                "jobs_total",
+                "Finished jobs",
+                scraper=Scraper.__name__,
+                status="failed" if error else "ok",
+            ).inc()
+            self.task_queue.task_done()
+
+    async def _run_job(
+        self,
+        Scraper: Type[WebScraper],
+        job: Any,
+        params: Dict[str, Any],
+        shared: Dict[str, Any],
+        postings: List[Posting] = None,
+    ) -> Optional[Exception]:
+        try:
+            self.logger.info(f"Starting scraper: {Scraper.__name__} ({job})")
+            # Create a new instance of the scraper
+            wscraper = await Scraper.create(job, params=params, **shared)
+            if wscraper is None:
+                raise ValueError(f"Failed to create scraper for job: {job}")
+            self.queries[wscraper.queue_name] = (Scraper, job, params)
+            if postings is None:
+                await wscraper.fetch(shared["session"], wscraper.url)
+            else:
+                await wscraper.fetch_postings(postings)
+            self.logger.info(f"Finished scraper: {Scraper.__name__} ({job})")
+
+        except Exception as e:
+            self.logger.error(
+                f"Error in {Scraper.__name__} ({job}): {e}", exc_info=True
+            )
+            return e
@@ -1,41 +1,304 @@
 import asyncio
 from asyncio import Queue
-import json
+from contextlib import AsyncExitStack
 import os
-import random
-from typing import Dict, List, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 import httpx
-from lxml import etree
-from playwright.async_api import async_playwright
 
+from job_scraper.config.logging_config import rate_limited
 from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import DETAIL_CONFIG
 from job_scraper.config.settings import JOB_CONFIG
+from job_scraper.config.settings import SCROLL_CONFIG
+from job_scraper.config.settings import WANTED_API_CONFIG
+from job_scraper.scrapers.browser_pool import BrowserPool
+from job_scraper.scrapers.browser_pool import filter_resource
+from job_scraper.scrapers.job_details import extract_job_details
+from job_scraper.scrapers.parsers import aiter_elements
+from job_scraper.scrapers.parsers import get_parser
+from job_scraper.scrapers.parsers import iter_elements
+from job_scraper.scrapers.query_planner import PostingRegistry
 from job_scraper.scrapers.scraper import HTMLContent
 from job_scraper.scrapers.scraper import ParsedContent
 from job_scraper.scrapers.scraper import WebScraper
+from job_scraper.storage.crawl_state import CrawlStateStore
+from job_scraper.storage.crawl_state import utcnow
+from job_scraper.storage.database import DatabaseSink
+from job_scraper.storage.exporter import StreamExporter
+from job_scraper.storage.work_queue import DONE
+from job_scraper.storage.work_queue import DurableWorkQueue
+from job_scraper.storage.work_queue import FAILED
+from job_scraper.storage.work_queue import IN_PROGRESS
+from job_scraper.utils.http_cache import HttpCache
+from job_scraper.utils.http_client import create_client
+from job_scraper.utils.http_client import stream_fetch
+from job_scraper.utils.metrics import metrics
+from job_scraper.utils.page_classifier import DYNAMIC
+from job_scraper.utils.page_classifier import EMBEDDED_JSON
+from job_scraper.utils.page_classifier import embedded_json
+from job_scraper.utils.page_classifier import find_json_objects
+from job_scraper.utils.page_classifier import page_classifier
+from job_scraper.utils.page_classifier import STATIC
+from job_scraper.utils.rate_limiter import RateLimiter
+from job_scraper.utils.resilience import check_status
+from job_scraper.utils.resilience import CircuitOpenError
+from job_scraper.utils.resilience import Resilience
+from job_scraper.utils.resilience import ScraperError
 
 logger = setup_logger(__name__)
 load_dotenv()
 
+# work_queue 종료 신호 (모든 worker가 받을 수 있도록 다시 queue에 넣는다)
+QUEUE_DONE = object()
+
+CARD_SELECTOR = "li.Card_Card__WdaEk"
+EXPAND_BUTTON_SELECTOR = "button:has(span:text('상세 정보 더 보기'))"
+JOB_LINK_SELECTOR = 'div[data-cy="job-card"] a[data-position-id]'
+
+# 카드 수가 늘어나면 새 카드 수를, 아니면 false를 반환 (mutation 마다 평가)
+# 카드 수가 count를 넘으면 그 수를, timeout(ms) 안에 늘지 않으면 null을 돌려준다.
+# MutationObserver가 DOM 변경 때마다 확인하므로 polling 간격만큼 늦지 않는다.
+WAIT_FOR_MORE_CARDS_JS = """
+([selector, count, timeout]) => new Promise((resolve) => {
+    const more = () => {
+        const current = document.querySelectorAll(selector).length;
+        return current > count ? current : null;
+    };
+    if (more() !== null) {
+        resolve(more());
+        return;
+    }
+    const observer = new MutationObserver(() => {
+        const current = more();
+        if (current !== null) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(current);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(null);
+    }, timeout);
+    observer.observe(document.body, { childList: true, subtree: true });
+})
+"""
+
+# 아직 수집하지 않은 카드의 속성을 한 번에 읽고 수집 완료 표시를 남긴다
+EXTRACT_NEW_CARDS_JS = """
+(selector) => Array.from(
+    document.querySelectorAll(`${selector}:not([data-scraped])`)
+).map((card) => {
+    card.setAttribute("data-scraped", "1");
+    const link = card.querySelector('div[data-cy="job-card"] a');
+    if (!link) {
+        return null;
+    }
+    return {
+        href: link.getAttribute("href"),
+        position: link.getAttribute("data-position-name"),
+        posting_id: link.getAttribute("data-position-id"),
+        company: link.getAttribute("data-company-name"),
+        company_id: link.getAttribute("data-company-id"),
+        job_category: link.getAttribute("data-job-category"),
+        job_category_id: link.getAttribute("data-job-category-id"),
+    };
+}).filter(Boolean)
+"""
+
+
+class ListingTraffic:
+    """
+    Tracks listing XHRs of a page while it scrolls.
+
+    Tells when the network is idle, and when `on_items` is given, decodes
+    every successful listing response and passes its items to it, so the
+    postings never have to be read back from the rendered cards.
+    """
+
+    def __init__(
+        self,
+        page,
+        listing_path: str,
+        on_items: Callable[[List[Dict[str, Any]]], Awaitable[Any]] = None,
+    ):
+        self.listing_path = listing_path
+        self.on_items = on_items
+        self.in_flight = set()
+        self.responses = 0  # 성공한 목록 응답 수
+        self.captured = 0  # JSON에서 읽은 공고 수
+        self._decoding = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+        if on_items is not None:
+            page.on("response", self._on_response)
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """
+        Wait for in-flight listing XHRs to finish.
+
+        Returns:
+            bool: Whether any XHR was in flight and finished in time.
+        """
+        if self._idle.is_set() or timeout <= 0:
+            return False
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def drain(self):
+        """Wait until every captured response has been decoded"""
+        if self._decoding:
+            await asyncio.gather(*self._decoding, return_exceptions=True)
+
+    def _on_request(self, request):
+        if self.listing_path in request.url:
+            self.in_flight.add(request)
+            self._idle.clear()
+
+    def _on_done(self, request):
+        self.in_flight.discard(request)
+        if not self.in_flight:
+            self._idle.set()
+
+    def _on_response(self, response):
+        if self.listing_path not in response.url or not response.ok:
+            return
+        self.responses += 1
+        task = asyncio.create_task(self._decode(response))
+        self._decoding.add(task)
+        task.add_done_callback(self._decoding.discard)
+
+    async def _decode(self, response):
+        from playwright.async_api import Error as PlaywrightError
+
+        try:
+            items = (await response.json())["data"]
+        except (PlaywrightError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Failed to decode listing response: {e}")
+            return
+        self.captured += len(items)
+        try:
+            await self.on_items(items)
+        except Exception as e:
+            # task 안에서 사라지거나 drain()을 멈추지 않도록 여기서 기록
+            logger.error(
+                f"Failed to handle listing items: {e}",
+                exc_info=True,
+                extra=rate_limited("listing_items_failed"),
+            )
+
 
 class WantedScraper(WebScraper):
 
-    def __init__(self, job_id, url):
+    def __init__(
+        self,
+        job_id,
+        url,
+        params: Dict[str, Any] = None,
+        browser_pool: BrowserPool = None,
+        rate_limiter: RateLimiter = None,
+        crawl_state: CrawlStateStore = None,
+        sink: DatabaseSink = None,
+        exporter: StreamExporter = None,
+        http_cache: HttpCache = None,
+        durable_queue: DurableWorkQueue = None,
+        resume: bool = False,
+        session: httpx.AsyncClient = None,
+        resilience: Resilience = None,
+        posting_registry: PostingRegistry = None,
+    ):
         super().__init__()
         self.job_id = job_id
-        self.params = JOB_CONFIG["params"]
+        self.params = {**JOB_CONFIG["params"], **(params or {})}
         self.base_url = "https://www.wanted.co.kr"
         self.url = url
         self.work_queue = Queue()
+        self.seen_postings = set()
+        self.claimed = set()  # 이 query가 가져가서 아직 끝내지 못한 공고
+        self.browser_pool = browser_pool
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.crawl_state = crawl_state
+        self.sink = sink
+        self.exporter = exporter
+        self.http_cache = http_cache
+        self.api_config = WANTED_API_CONFIG
+        self.parser = get_parser(type(self).__name__)
+        self.durable_queue = durable_queue
+        self.resume = resume
+        self.session = session
+        self.resilience = resilience or Resilience()
+        self.posting_registry = posting_registry
+        # job x location(과 그 밖의 조건)마다 별도의 저널
+        self.queue_name = f"{type(self).__name__}:{job_id}:" + ",".join(
+            f"{key}={value}" for key, value in sorted(self.params.items())
+        )
 
     @classmethod
-    async def create(cls, job):
+    async def create(
+        cls,
+        job,
+        params: Dict[str, Any] = None,
+        browser_pool: BrowserPool = None,
+        rate_limiter: RateLimiter = None,
+        crawl_state: CrawlStateStore = None,
+        sink: DatabaseSink = None,
+        exporter: StreamExporter = None,
+        http_cache: HttpCache = None,
+        durable_queue: DurableWorkQueue = None,
+        resume: bool = False,
+        session: httpx.AsyncClient = None,
+        resilience: Resilience = None,
+        posting_registry: PostingRegistry = None,
+    ):
         """
         Factory method for creating an instance with a validated URL property.
 
+        Args:
+            job (str): Job name defined in `JOB_CONFIG["job_id"]`.
+            params (Dict[str, Any]): Overrides of `JOB_CONFIG["params"]`,
+                e.g. `{"locations": "seoul.all"}`.
+            browser_pool (BrowserPool): Shared browser pool. If omitted, the
+                scraper launches its own pool and closes it after fetching.
+            rate_limiter (RateLimiter): Per-host rate limiter shared with the
+                HTTP session. If omitted, the scraper uses its own.
+            crawl_state (CrawlStateStore): Store used to skip postings whose
+                details were fetched recently. The caller owns and closes
+                it. If omitted, every posting is fetched.
+            sink (DatabaseSink): Persistence sink for scraped records.
+            exporter (StreamExporter): Streaming file export. Any object with
+                an async `put(record)` works.
+            http_cache (HttpCache): Disk cache used by `fetch_all`.
+            durable_queue (DurableWorkQueue): Journal of `work_queue`, so an
+                interrupted crawl can be resumed.
+            resume (bool): Continue from the journal of a previous run
+                instead of starting over.
+            session (httpx.AsyncClient): Shared client (see
+                `utils.http_client.create_client`) used to check that the URL
+                is reachable and by `fetch_all`.
+            resilience (Resilience): Retries and per-host circuit breakers
+                shared with the other scrapers. If omitted, the scraper uses
+                its own.
+            posting_registry (PostingRegistry): Claims postings across the
+                query grid, so a posting also listed by another job, location
+                or experience filter is fetched only once.
         """
         job_id = JOB_CONFIG["job_id"].get(job, None)
         if not job_id:
@@ -47,9 +310,24 @@ class WantedScraper(WebScraper):
 
         try:
             # URL 검증
-            if await WebScraper.validate_url(url):
+            if await WebScraper.validate_url(url, session):
                 logger.info(f"URL validation successful {url}")
-                return cls(job_id, url)  # if url is valid, create instance
+                return cls(
+                    job_id,
+                    url,
+                    params=params,
+                    browser_pool=browser_pool,
+                    rate_limiter=rate_limiter,
+                    crawl_state=crawl_state,
+                    sink=sink,
+                    exporter=exporter,
+                    http_cache=http_cache,
+                    durable_queue=durable_queue,
+                    resume=resume,
+                    session=session,
+                    resilience=resilience,
+                    posting_registry=posting_registry,
+                )  # if url is valid, create instance
         except Exception as e:
             logger.exception(f"Error during URL validation {e}")
 
@@ -63,282 +341,838 @@ class WantedScraper(WebScraper):
     async def fetch(
         self, session: Union[httpx.AsyncClient, httpx.Client], url: str
     ) -> str:
+        with metrics.gauge(
+            "fetches_in_flight", "WantedScraper.fetch calls running"
+        ).track(), metrics.histogram(
+            "fetch_seconds", "Duration of WantedScraper.fetch"
+        ).time():
+            return await self._fetch(session, url)
+
+    async def _fetch(
+        self, session: Union[httpx.AsyncClient, httpx.Client], url: str
+    ) -> str:
+        # 목록 전체 수집(스크롤, 상세 worker, 저널 초기화)은 self.url에서만
+        is_listing = url == self.url
+        if is_listing and self.api_config["fetch_mode"] == "api":
+            return await self._crawl(lambda: self._fetch_api(session))
+
         try:
+            # 이미 동적 페이지로 판별된 URL 패턴이면 GET 없이 바로 브라우저 사용
+            if page_classifier.get(url) == DYNAMIC:
+                if is_listing:
+                    return await self._fetch_dynamic(url)
+                return await self._render(url)
+            # 정적 목록 페이지는 응답을 받는 동안 바로 파싱해서 공고를 넘긴다
+            if is_listing and page_classifier.get(url) == STATIC:
+                return await self._crawl(
+                    lambda: self._list_remaining_pages(
+                        session,
+                        lambda: self._stream_static_postings(session, url),
+                    )
+                )
+
             logger.info(f"Fetching URL: {url}")
-            response = await session.get(url, params=self.params, timeout=10)
-            response.raise_for_status()
+            response = await self.resilience.call(
+                url, lambda: self._get(session, url)
+            )
+            self._record_page("http", len(response.content))
 
             if response.status_code == 200:
-                if (
-                    "window.__INITIAL_STATE__" in response.text
-                    or "<script>" in response.text
-                ):
+                kind = page_classifier.get(url) or page_classifier.classify(
+                    url,
+                    response.text,
+                    selector=JOB_LINK_SELECTOR,
+                    json_keys=("position", "company"),
+                )
+                if kind == DYNAMIC:
                     logger.info(
                         "Dynamic page characteristics have been detected."
                     )
-                    return await self._fetch_dynamic(self.url, True)
+                    if is_listing:
+                        return await self._fetch_dynamic(url)
+                    return await self._render(url)
+                if not is_listing:
+                    return response.text
+
+                if kind == EMBEDDED_JSON:
+                    logger.info("Embedded JSON has been detected.")
+                    return await self._crawl(
+                        lambda: self._list_remaining_pages(
+                            session,
+                            lambda: self._scrape_embedded_postings(
+                                response.text
+                            ),
+                        )
+                    )
                 logger.info("Static page characteristics have been detected.")
-                return response.text
+                return await self._crawl(
+                    lambda: self._list_remaining_pages(
+                        session,
+                        lambda: self._scrape_static_postings(response.text),
+                    )
+                )
             else:
                 logger.warning(
                     f"Unexpected status code: {response.status_code}"
                 )
 
-        except httpx.RequestError as e:
-            logger.exception(f"HTTPX request failed: {e}", exc_info=True)
-            raise ValueError(f"HTTPX request failed: {e}")
-
-    async def fetch_all(self, urls: Queue) -> List[str]:
-        async with httpx.AsyncClient(
-            http2=True,
-            follow_redirects=True,
-            max_redirects=5,
-            headers=getattr(self, "headers", {}),  # self.headers
-        ) as session:
-            tasks = [
-                self.fetch(session, await urls.get())
-                for _ in range(urls.qsize())
-            ]  # 세션을 fetch 메소드에 넘김
-            results = await asyncio.gather(*tasks)
-            return results
-
-    async def _fetch_dynamic(self, url: str, block_resource=False) -> str:
-        browser = None
+        except ScraperError as e:
+            raise self.handle_error(e, url)
+
+    async def _get(
+        self, session: Union[httpx.AsyncClient, httpx.Client], url: str
+    ) -> httpx.Response:
+        response = await session.get(url, params=self.params, timeout=10)
+        response.raise_for_status()
+        return response
+
+    async def fetch_all(
+        self, urls: Queue, workers: int = None
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Fetch every URL in `urls` and yield `(url, html)` as each finishes.
+
+        A fixed number of workers pull from the queue (see `stream_fetch`),
+        all over the shared session, so a large URL set keeps the number of
+        sockets and pending results bounded.
+
+        Usage:
+            async for url, html in scraper.fetch_all(urls):
+                ...
+        """
+        async with AsyncExitStack() as stack:
+            session = self.session
+            if session is None:
+                session = await stack.enter_async_context(
+                    create_client(self.rate_limiter, http_cache=self.http_cache)
+                )
+            async for url, html in stream_fetch(
+                lambda url: self.fetch(session, url), urls, workers
+            ):
+                yield url, html
+
+    async def _render(self, url: str) -> str:
+        """HTML of a page other than the list, rendered in the browser"""
+        async with AsyncExitStack() as stack:
+            browser_pool = self.browser_pool
+            if browser_pool is None:
+                browser_pool = await stack.enter_async_context(BrowserPool())
+            page = await stack.enter_async_context(browser_pool.page())
+            await self.resilience.call(url, lambda: self._goto(page, url))
+            return await page.content()
+
+    async def _fetch_dynamic(self, url: str) -> str:
+        with metrics.gauge(
+            "dynamic_fetches_in_flight", "Browser list crawls running"
+        ).track(), metrics.histogram(
+            "dynamic_fetch_seconds", "Duration of browser list crawls"
+        ).time():
+            return await self._crawl(lambda: self._scroll_listing(url))
+
+    async def _crawl(self, list_phase: Callable[[], Awaitable[None]]):
+        """
+        Run a list phase that fills `work_queue`, then fetch job details.
+
+        Args:
+            list_phase (Callable[[], Awaitable[None]]): Coroutine factory that
+                puts posting records into `work_queue`.
+
+        Raises:
+            Exception: Whatever made the list or detail phase fail, after
+                the detail workers are stopped and the unfinished postings
+                are released to the other queries of the grid.
+        """
+        owns_pool = self.browser_pool is None
+        if owns_pool:
+            self.browser_pool = BrowserPool()
+
+        details_task = None
         try:
-            logger.info("🚀 Dynamic page Fetch start...")
-            async with async_playwright() as playwright:
-                browser = await playwright.chromium.launch(
-                    headless=True
-                )  # create a browser instance
-
-                # Set the user agent to bypass bot detection
-                context = await browser.new_context(
-                    extra_http_headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)  \
-                                AppleWebKit/537.36 (KHTML, like Gecko) \
-                                Chrome/58.0.3029.110 Safari/537.3"
-                    }
-                )  # create a new context
-                page = await context.new_page()  # create a new page
-
-                # Browser request filter
-                await page.route(
-                    "**/*", self.filter_resource
-                )  # block images, media, fonts ,and ads
-
-                await page.goto(url)  # go to the target page
-                await page.wait_for_timeout(5000)  # wait for 5 second
+            listed = await self._restore_work_queue()
+            if DETAIL_CONFIG["overlap_scroll"]:
+                # 목록 수집과 동시에 상세 페이지 수집 시작
+                details_task = asyncio.create_task(self.fetch_job_details())
+
+            try:
+                if not listed:
+                    await list_phase()
+                    if self.durable_queue is not None:
+                        await self.durable_queue.mark_listed(self.queue_name)
+            finally:
+                await self.work_queue.put(QUEUE_DONE)
+
+            if details_task is None:
+                details_task = asyncio.create_task(self.fetch_job_details())
+            await details_task
+
+        except BaseException:
+            # 정리만 하고 다시 raise해서 ScraperManager가 실패로 기록하게 한다
+            if details_task is not None:
+                details_task.cancel()
+                await asyncio.gather(details_task, return_exceptions=True)
+            await self._release_claims()
+            raise
+        finally:
+            if owns_pool:
+                await self.browser_pool.close()
+                self.browser_pool = None
+
+    async def _restore_work_queue(self) -> bool:
+        """
+        Prepare the journal before the list phase.
+
+        When resuming, the unfinished postings of the previous run are put
+        back into `work_queue` and the finished ones are marked as seen.
+        Otherwise the old journal is discarded.
+
+        Returns:
+            bool: Whether the previous run had finished its list phase, in
+                which case it does not need to run again.
+        """
+        if self.durable_queue is None:
+            return False
+        if not self.resume:
+            await self.durable_queue.reset(self.queue_name)
+            return False
+
+        postings, finished, listed = await self.durable_queue.restore(
+            self.queue_name
+        )
+        self.seen_postings.update(finished)
+        for posting in postings:
+            (metadata,) = posting.values()
+            self.seen_postings.add(metadata["posting_id"])
+            if await self._claim(posting):
+                await self.work_queue.put(posting)
+        logger.info(
+            f"Resumed {self.queue_name}: {len(postings)} postings left, "
+            f"{len(finished)} finished, list phase "
+            f"{'done' if listed else 'restarted'}"
+        )
+        return listed
+
+    async def _scroll_listing(self, url: str):
+        # 브라우저 모드에서만 필요하므로 Playwright는 여기서 import
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        logger.info("🚀 Dynamic page Fetch start...")
+        async with self.browser_pool.page() as page:
+            # 페이지가 받아오는 목록 JSON을 그대로 공고로 변환
+            traffic = ListingTraffic(
+                page,
+                self.api_config["listing_path"],
+                on_items=self._enqueue_api_items,
+            )
+            async with self.rate_limiter.limit(url) as permit:
+                response = await page.goto(url)  # go to the target page
+                if response is not None:
+                    permit.observe(response.status)
+                    self._record_browser_page(response)
+            try:
                 await page.wait_for_selector(
-                    "li.Card_Card__WdaEk", timeout=5000
+                    CARD_SELECTOR,
+                    timeout=SCROLL_CONFIG["initial_timeout"] * 1000,
                 )  # wait for the job postings to load
+            except PlaywrightTimeoutError:
+                # 카드 class 이름이 바뀌어도 JSON을 받았다면 계속 진행
+                if not traffic.responses:
+                    raise
 
-                previous_count = len(
-                    await page.query_selector_all("li.Card_Card__WdaEk")
+            async def scrape_cards(page):
+                # 목록 JSON을 받지 못한 경우에만 DOM에서 카드를 읽음
+                if not traffic.responses:
+                    await self.scrape_job_postings(page)
+
+            # 스크롤 실행 (스크롤할 때마다 scrape_cards 실행)
+            await self.auto_scroll(
+                page, callback=scrape_cards, traffic=traffic
+            )
+            await traffic.drain()
+            if traffic.captured:
+                logger.info(
+                    f"🐳 Captured {traffic.captured} job postings "
+                    f"from {traffic.responses} listing responses"
+                )
+
+    async def _fetch_api(self, session: httpx.AsyncClient):
+        """
+        Collect postings from the listing JSON API without a browser.
+
+        Offsets are requested `concurrency` pages at a time until a page comes
+        back short. If the API fails, fall back to scrolling the list page.
+        """
+        limit = self.api_config["limit"]
+        concurrency = self.api_config["concurrency"]
+        collected = 0
+
+        try:
+            for first_page in range(
+                0, self.api_config["max_pages"], concurrency
+            ):
+                last_page = min(
+                    first_page + concurrency, self.api_config["max_pages"]
                 )
-                logger.info(f"previous_count: {previous_count}")
-
-                # 스크롤 실행 (스크롤할 때마다 scrape_job_postings 실행)
-                await self.auto_scroll(
-                    page,
-                    max_scrolls=50,
-                    scroll_delay=2000,
-                    callback=self.scrape_job_postings,
+                pages = await asyncio.gather(
+                    *(
+                        self._fetch_api_page(session, page * limit)
+                        for page in range(first_page, last_page)
+                    )
                 )
 
-                await self.fetch_job_details()
+                for items in pages:
+                    collected += await self._enqueue_api_items(items)
+
+                if any(len(items) < limit for items in pages):
+                    break
+        except (ScraperError, httpx.HTTPError, ValueError, KeyError) as e:
+            logger.warning(f"Listing API failed, fall back to browser: {e}")
+            return await self._scroll_listing(self.url)
+
+        logger.info(f"🐳 Collected {collected} job postings from API")
+
+    async def _fetch_api_page(
+        self, session: httpx.AsyncClient, offset: int
+    ) -> List[Dict[str, Any]]:
+        params = {
+            **self.params,
+            "job_group_id": self.api_config["job_group_id"],
+            "job_ids": self.job_id,
+            "limit": self.api_config["limit"],
+            "offset": offset,
+        }
+        url = self.base_url + self.api_config["listing_path"]
+
+        async def request() -> List[Dict[str, Any]]:
+            response = await session.get(
+                url, params=params, headers=self.headers, timeout=10
+            )
+            response.raise_for_status()
+            self._record_page("api", len(response.content))
+            return response.json()["data"]
+
+        return await self.resilience.call(url, request)
+
+    async def _enqueue_api_items(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Queue listing API items, returning how many were new.
+
+        Items missing a field are skipped one by one, so a single malformed
+        item does not drop the rest of the page.
+        """
+        queued = 0
+        for item in items:
+            try:
+                posting = self.posting_from_api(item)
+            except (KeyError, TypeError, AttributeError) as e:
+                metrics.counter(
+                    "listing_items_skipped_total",
+                    "Listing items that could not be read",
+                ).inc()
+                logger.warning(
+                    f"Skipping malformed listing item: {e!r}",
+                    extra=rate_limited("malformed_listing_item"),
+                )
+                continue
+            if await self.enqueue_posting(posting):
+                queued += 1
+        return queued
+
+    def posting_from_api(self, item: Dict[str, Any]) -> Dict[str, Dict]:
+        """
+        Convert a listing API item into the record built by
+        `scrape_job_postings`, keyed by the posting href.
+        """
+        category_tag = item.get("category_tag") or {}
+        return {
+            f"/wd/{item['id']}": {
+                "position": item["position"],
+                "company": item["company"]["name"],
+                "company_id": str(item["company"]["id"]),
+                "posting_id": str(item["id"]),
+                "job_category": self.api_config["job_group_name"],
+                "job_category_id": str(
+                    category_tag.get(
+                        "parent_id", self.api_config["job_group_id"]
+                    )
+                ),
+            }
+        }
+
+    async def fetch_job_details(self, num_workers: int = None):
+        """
+        Drain `work_queue` with a pool of concurrent detail workers.
+
+        Each worker leases its own page from the browser pool, and every
+        navigation is paced by the shared per-host rate limiter. Workers
+        keep running until `QUEUE_DONE` is put into the queue, so they can
+        start while `auto_scroll` is still adding postings.
+
+        Args:
+            num_workers (int): Number of workers. Defaults to
+                `DETAIL_CONFIG["workers"]`.
+        """
+        num_workers = num_workers or DETAIL_CONFIG["workers"]
+        with metrics.histogram(
+            "fetch_job_details_seconds", "Duration of the detail phase"
+        ).time():
+            workers = [
+                asyncio.create_task(self._detail_worker())
+                for _ in range(num_workers)
+            ]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                # 한 worker가 실패하면 나머지도 멈춘 뒤 예외를 전달
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+        logger.info(f"Rate limiter stats: {self.rate_limiter.stats()}")
+        logger.info(f"Resilience stats: {self.resilience.stats()}")
+        if self.crawl_state is not None:
+            logger.info(
+                f"Skipped {self.crawl_state.skipped} unchanged job postings"
+            )
+
+    async def _detail_worker(self):
+        while True:
+            job_data = await self.work_queue.get()
+            self._record_queue_depth()
+            if job_data is QUEUE_DONE:
+                await self.work_queue.put(QUEUE_DONE)
+                return
+
+            # 처리할 공고가 있는 동안에만 페이지를 점유한다 (다른 job과 공유)
+            async with self.browser_pool.page() as page:
+                while True:
+                    await self._fetch_job_detail(page, job_data)
+                    if (
+                        self.browser_pool.is_exhausted(page)
+                        or self.work_queue.empty()
+                    ):
+                        break
+
+                    job_data = self.work_queue.get_nowait()
+                    self._record_queue_depth()
+                    if job_data is QUEUE_DONE:
+                        await self.work_queue.put(QUEUE_DONE)
+                        return
 
+    async def _fetch_job_detail(self, page, job_data: Dict[str, Dict]):
+        for href, metadata in job_data.items():
+            job_url = self.base_url + href
+            try:
+                status = await self._fetch_posting(page, href, metadata)
+            except Exception as e:
+                # 상태 DB나 저장 오류는 이 공고만 실패로 남기고 worker는 계속
+                self.handle_error(e, job_url)
+                status = "failed"
+            metrics.counter(
+                "details_total", "Job postings by detail result", status=status
+            ).inc()
+            if status in ("ok", "skipped"):
+                self.claimed.discard(metadata["posting_id"])
+
+    async def _fetch_posting(
+        self, page, href: str, metadata: Dict[str, Any]
+    ) -> str:
+        """
+        Fetch, save and journal the details of one posting.
+
+        Returns:
+            str: "ok", "skipped", "failed" or "circuit_open".
+        """
+        job_url = self.base_url + href
+        if (
+            self.crawl_state is not None
+            and not await self.crawl_state.should_fetch(metadata)
+        ):
+            logger.debug(f"Skip unchanged job posting: {job_url}")
+            await self.save({href: metadata})
+            await self._mark_work(metadata["posting_id"], DONE)
+            return "skipped"
+        logger.debug(f"Fetching job details: {job_url}")
+        await self._mark_work(metadata["posting_id"], IN_PROGRESS)
+
+        status = "failed"
+        try:
+            with metrics.gauge(
+                "details_in_flight", "Detail pages being fetched"
+            ).track(), metrics.histogram(
+                "detail_seconds", "Latency of one detail page"
+            ).time():
+                await self._fetch_job_detail_page(page, job_url, metadata)
+            status = "ok"
         except Exception as e:
-            logger.info(f"Dynamic page Fetch failed... {e}")
-        finally:
-            await browser.close()
-
-    async def fetch_job_details(self):
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                extra_http_headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)  \
-                                AppleWebKit/537.36 (KHTML, like Gecko) \
-                                Chrome/58.0.3029.110 Safari/537.3"
-                }
-            )  # create a new context
-            page = await context.new_page()  # create a new page
-
-            while not self.work_queue.empty():
-                job_data = await self.work_queue.get()
-
-                for href, metadata in job_data.items():
-                    job_url = self.base_url + href
-                    logger.info(f"Fetching job details: {job_url}")
-
-                    try:
-                        await asyncio.sleep(random.uniform(1, 3))
-
-                        # Browser request filter
-                        await page.route(
-                            "**/*", self.filter_resource
-                        )  # block images, media, fonts ,and ads
-                        await page.goto(
-                            job_url, timeout=10000
-                        )  # delay for 10 seconds
-
-                        await page.locator(
-                            "button:has(span:text('상세 정보 더 보기'))"
-                        ).click()
-                        job_details = await self.scrape_job_details(page)
-
-                        # Extract posted date
-                        ld_json = await page.evaluate(
-                            """
-                            () => {
-                                const script = document.querySelector(
-                                    'script[type="application/ld+json"]'
-                                );
-                                return script ? script.innerText : null;
-                            }
-                        """
-                        )
-                        ld_json = json.loads(ld_json)
-                        posted_date = ld_json["datePosted"]
-                        job_details["게시일"] = posted_date
-                        metadata["job_details"] = job_details
-                        logger.info(f"Job details fetched: {metadata}")
-                    except Exception as e:
-                        logger.exception(
-                            f"Failed to fetch job details: {job_url}: {e}"
-                        )
+            error = self.handle_error(e, job_url)
+            if isinstance(error, CircuitOpenError):
+                status = "circuit_open"
 
-            await browser.close()
+        await self.save({href: metadata})
+        await self._mark_work(
+            metadata["posting_id"], DONE if status == "ok" else FAILED
+        )
+        return status
 
-    async def auto_scroll(
-        self, page, max_scrolls=50, scroll_delay=2000, callback=None
+    async def _mark_work(self, posting_id: str, status: str):
+        if self.durable_queue is not None:
+            await self.durable_queue.mark(self.queue_name, posting_id, status)
+
+    async def _fetch_job_detail_page(
+        self, page, job_url: str, metadata: Dict[str, Any]
     ):
-        previous_count = len(
-            await page.query_selector_all("li.Card_Card__WdaEk")
+        # 이동만 재시도하고 host의 circuit에 반영한다. 버튼이나 본문이 없는
+        # 것은 공고 내용의 문제이므로 host 실패로 세지 않는다
+        await self.resilience.call(
+            job_url, lambda: self._goto(page, job_url)
         )
-        logger.info(f"🔢 Initial job postings count: {previous_count}")
+        await self._expand_job_details(page, job_url)
 
-        previous_height = await page.evaluate("document.body.scrollHeight")
+        job_details = await self.scrape_job_details(page)
+        metadata["job_details"] = job_details
+        if self.crawl_state is not None and job_details is not None:
+            await self.crawl_state.mark_fetched(metadata, job_details)
+        logger.info(
+            f"Job details fetched: {job_url}",
+            extra=rate_limited("job_details_fetched"),
+        )
+
+    async def _goto(self, page, url: str):
+        """
+        Navigate to a page through the rate limiter.
+
+        Raises:
+            TransientError: For timeouts, 429 and 5xx responses.
+            PermanentError: For other 4xx responses.
+        """
+        async with self.rate_limiter.limit(url) as permit:
+            response = await page.goto(
+                url, timeout=10000
+            )  # delay for 10 seconds
+            if response is not None:
+                permit.observe(
+                    response.status,
+                    response.headers.get("retry-after"),
+                )
+                self._record_browser_page(response)
+        if response is not None:
+            check_status(
+                response.status, url, response.headers.get("retry-after")
+            )
+
+    async def _expand_job_details(self, page, job_url: str):
+        """Click "상세 정보 더 보기" if the page has it (short postings don't)"""
+        from playwright.async_api import Error as PlaywrightError
+
+        try:
+            await page.locator(EXPAND_BUTTON_SELECTOR).click(
+                timeout=DETAIL_CONFIG["expand_timeout"] * 1000
+            )
+        except PlaywrightError as e:
+            logger.debug(
+                f"No expand button on {job_url}: {e}",
+                extra=rate_limited("expand_button_missing"),
+            )
+
+    async def auto_scroll(
+        self,
+        page,
+        max_scrolls: int = None,
+        idle_timeout: float = None,
+        max_duration: float = None,
+        callback=None,
+        traffic: "ListingTraffic" = None,
+    ):
+        """
+        Scroll to the bottom until the card count stops growing.
+
+        Instead of sleeping for a fixed time, each scroll waits for the card
+        count to increase, observed in the page with a MutationObserver. If
+        it does not grow within `idle_timeout` while no listing XHR is in
+        flight, the list is complete. The whole scroll is bounded by
+        `max_duration` seconds.
+        """
+        max_scrolls = max_scrolls or SCROLL_CONFIG["max_scrolls"]
+        idle_timeout = idle_timeout or SCROLL_CONFIG["idle_timeout"]
+        max_duration = max_duration or SCROLL_CONFIG["max_duration"]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_duration
+
+        count = await page.locator(CARD_SELECTOR).count()
+        responses = traffic.responses if traffic is not None else 0
+        logger.info(f"🔢 Initial job postings count: {count}")
+        if callback:
+            await callback(page)
 
         for _ in range(max_scrolls):
             await page.evaluate(
                 "window.scrollTo(0, document.body.scrollHeight)"
             )
-            await page.wait_for_timeout(scroll_delay)
-
-            if callback:
-                await callback(page)
+            metrics.counter(
+                "scroll_iterations_total", "Scrolls of list pages"
+            ).inc()
 
-            current_count = len(
-                await page.query_selector_all("li.Card_Card__WdaEk")
+            new_count = await self._wait_for_more_cards(
+                page, count, min(idle_timeout, deadline - loop.time())
             )
-            logger.info(f"🐳 Updated job postings count: {current_count}")
+            if new_count is None and traffic is not None:
+                # 목록 XHR이 아직 진행 중이면 응답 후 한 번 더 확인
+                if await traffic.wait_idle(deadline - loop.time()):
+                    new_count = await self._wait_for_more_cards(
+                        page, count, min(idle_timeout, deadline - loop.time())
+                    )
+                if new_count is None and traffic.responses > responses:
+                    # 카드가 보이지 않아도 목록 JSON이 더 왔다면 계속 스크롤
+                    new_count = count
+                responses = traffic.responses
 
-            new_height = await page.evaluate("document.body.scrollHeight")
-            if new_height == previous_height:
+            if new_count is None:
                 logger.info("🚧 No new job postings found. Stopping scroll.")
                 break
-            previous_height = new_height
+
+            count = new_count
+            logger.debug(f"🐳 Updated job postings count: {count}")
+            if callback:
+                await callback(page)
+
+            if loop.time() >= deadline:
+                logger.info("⏱️ Scroll time limit reached. Stopping scroll.")
+                break
+
+    async def _wait_for_more_cards(
+        self, page, count: int, timeout: float
+    ) -> Optional[int]:
+        """New card count once it exceeds `count`, or None on timeout"""
+        if timeout <= 0:
+            return None
+        # wait_for_function은 "raf"/숫자 polling만 지원하므로 페이지 안에서
+        # MutationObserver로 기다린다
+        return await page.evaluate(
+            WAIT_FOR_MORE_CARDS_JS, [CARD_SELECTOR, count, timeout * 1000]
+        )
 
     async def scrape_job_postings(self, page):
+        """
+        Queue the job cards added since the previous call.
+
+        All attributes of the new cards are read in a single `page.evaluate`,
+        which also marks the cards as scraped so they are skipped next time.
+        """
         try:
-            jobs = await page.query_selector_all("li.Card_Card__WdaEk")
+            cards = await page.evaluate(EXTRACT_NEW_CARDS_JS, CARD_SELECTOR)
+        except Exception as e:
+            logger.error(f"Error scraping job postings: {e}")
+            return
 
-            for job in jobs:
+        for card in cards:
+            href = card.pop("href")
+            if await self.enqueue_posting({href: card}):
+                logger.debug(
+                    f"Scraped: {href} - {card['position']} at {card['company']}"
+                )
+
+    async def _list_remaining_pages(
+        self,
+        session: httpx.AsyncClient,
+        first_batch: Callable[[], Awaitable[None]],
+    ):
+        """
+        Queue the server-rendered postings, then the rest of the listing.
+
+        The list is infinite-scroll, so its HTML or embedded JSON only holds
+        the first batch. The remaining pages come from the listing API
+        (which falls back to scrolling in the browser); postings of the
+        first batch are not queued twice.
+        """
+        await first_batch()
+        await self._fetch_api(session)
+
+    async def _scrape_static_postings(self, content: str):
+        """Queue the job cards of a list page served as static HTML"""
+        tree = self.parser.parse(content)
+        for link in self.parser.select(tree, JOB_LINK_SELECTOR):
+            await self.enqueue_posting(self.posting_from_link(link))
+
+    async def _scrape_embedded_postings(self, content: str):
+        """
+        Queue the postings of a list page that embeds them as JSON.
+
+        The embedded items have the shape of the listing API, so they go
+        through `posting_from_api`.
+        """
+        for data in embedded_json(content):
+            for item in find_json_objects(data, ("id", "position", "company")):
                 try:
-                    href_element = await job.query_selector(
-                        'div[data-cy="job-card"] a'
-                    )
-                    href = await href_element.get_attribute("href")
-                    position = await href_element.get_attribute(
-                        "data-position-name"
-                    )
-                    posting_id = await href_element.get_attribute(
-                        "data-position-id"
-                    )
-                    company = await href_element.get_attribute(
-                        "data-company-name"
-                    )
-                    company_id = await href_element.get_attribute(
-                        "data-company-id"
-                    )
-                    job_category = await href_element.get_attribute(
-                        "data-job-category"
-                    )
-                    job_category_id = await href_element.get_attribute(
-                        "data-job-category-id"
-                    )
+                    posting = self.posting_from_api(item)
+                except (KeyError, TypeError) as e:
+                    logger.debug(f"Skipping embedded item: {e!r}")
+                    continue
+                await self.enqueue_posting(posting)
 
-                    data = {
-                        href: {
-                            "position": position,
-                            "company": company,
-                            "company_id": company_id,
-                            "posting_id": posting_id,
-                            "job_category": job_category,
-                            "job_category_id": job_category_id,
-                        }
-                    }
-                    logger.info(f"Scraped: {href} - {position} at {company}")
-
-                    await self.work_queue.put(data)
-                except Exception as e:
-                    logger.error(f"Error scraping job postings: {e}")
-        except Exception as e:
-            logger.error(f"Error scraping job postings: {e}")
+    async def _stream_static_postings(
+        self, session: httpx.AsyncClient, url: str
+    ):
+        """
+        Queue the job cards of a static list page while it downloads.
 
-    async def scrape_job_details(self, page) -> Dict[str, str]:
-        try:
-            job_details_divs = await page.query_selector_all(
-                "div.JobDescription_JobDescription__paragraph__wrapper__G4CNd > div"
+        Cards are parsed from the response bytes as they arrive, so detail
+        workers can start on the first postings before the page has been
+        fully received.
+        """
+        async with session.stream(
+            "GET", url, params=self.params, timeout=10
+        ) as response:
+            response.raise_for_status()
+            async for link in aiter_elements(
+                response.aiter_bytes(), JOB_LINK_SELECTOR
+            ):
+                await self.enqueue_posting(self.posting_from_link(link))
+            self._record_page("http", response.num_bytes_downloaded)
+
+    @staticmethod
+    def posting_from_link(link) -> Dict[str, Dict]:
+        """Posting record from the data attributes of a job card link"""
+        return {
+            link.get("href"): {
+                "position": link.get("data-position-name"),
+                "posting_id": link.get("data-position-id"),
+                "company": link.get("data-company-name"),
+                "company_id": link.get("data-company-id"),
+                "job_category": link.get("data-job-category"),
+                "job_category_id": link.get("data-job-category-id"),
+            }
+        }
+
+    async def enqueue_posting(self, posting: Dict[str, Dict]) -> bool:
+        """
+        Put a posting record into `work_queue` unless its `posting_id` was
+        already queued, here or by another query of the grid.
+
+        A posting owned by another query is saved right away without its
+        details, so every query still records the postings it lists.
+
+        Returns:
+            bool: Whether the posting was queued.
+        """
+        href, metadata = next(iter(posting.items()))
+        posting_id = metadata["posting_id"]
+        if not posting_id:
+            logger.warning(f"Job posting without posting_id: {href}")
+            return False
+        if posting_id in self.seen_postings:
+            return False
+
+        self.seen_postings.add(posting_id)
+        if not await self._claim(posting):
+            # 상세 정보만 owner가 가져가고, 목록 레코드는 이 query로 저장
+            await self.save(posting)
+            return False
+        await self._queue_posting(posting)
+        return True
+
+    async def fetch_postings(self, postings: List[Dict[str, Dict]]):
+        """
+        Fetch the details of postings without crawling the list.
+
+        Used for postings another query claimed but released when its
+        crawl failed (see `PostingRegistry.orphans`).
+
+        Raises:
+            Exception: Whatever made the detail phase fail.
+        """
+
+        async def queue_postings():
+            for posting in postings:
+                (metadata,) = posting.values()
+                self.seen_postings.add(metadata["posting_id"])
+                self.claimed.add(metadata["posting_id"])
+                await self._queue_posting(posting)
+
+        await self._crawl(queue_postings)
+
+    async def _queue_posting(self, posting: Dict[str, Dict]):
+        await self.work_queue.put(posting)
+        self._record_queue_depth()
+        if self.durable_queue is not None:
+            await self.durable_queue.add(self.queue_name, posting)
+
+    async def _claim(self, posting: Dict[str, Dict]) -> bool:
+        """Whether this query owns the posting in the shared registry"""
+        (metadata,) = posting.values()
+        posting_id = metadata["posting_id"]
+        if self.posting_registry is not None and not (
+            await self.posting_registry.claim(
+                posting_id, self.queue_name, posting
             )
-            logger.info(f"Found {len(job_details_divs)} div elements.")
+        ):
+            return False
+        self.claimed.add(posting_id)
+        return True
 
-            job_details = dict()
+    async def _release_claims(self):
+        """Hand the unfinished postings back to the other queries"""
+        if self.posting_registry is None or not self.claimed:
+            return
+        released = await self.posting_registry.release(
+            self.queue_name, self.claimed
+        )
+        logger.warning(
+            f"Released {released} unfinished postings of {self.queue_name}"
+        )
+        self.claimed.clear()
 
-            for div in job_details_divs:
-                title_elem = await div.query_selector("h3")
-                description_elem = await div.query_selector_all("span")
+    def _record_queue_depth(self):
+        metrics.gauge(
+            "work_queue_depth", "Postings waiting for details", job=self.job_id
+        ).set(self.work_queue.qsize())
 
-                title = (
-                    await title_elem.text_content()
-                    if title_elem
-                    else "No title"
-                )
-                description = (
-                    "\n".join(
-                        [await span.text_content() for span in description_elem]
-                    )
-                    if description_elem
-                    else "No description"
-                )
+    @staticmethod
+    def _record_page(kind: str, size: int):
+        metrics.counter(
+            "pages_fetched_total", "Pages and API responses fetched", kind=kind
+        ).inc()
+        metrics.counter(
+            "bytes_downloaded_total", "Response bytes downloaded", kind=kind
+        ).inc(size)
 
-                job_details[title] = description
-                logger.info(f"Scraped job details: {title} - {description}")
+    def _record_browser_page(self, response):
+        # 본문을 다시 읽으면 round trip이 늘어나므로 Content-Length만 사용
+        self._record_page(
+            "browser", int(response.headers.get("content-length") or 0)
+        )
+
+    async def scrape_job_details(self, page) -> Dict[str, str]:
+        """
+        Read every description section and the posted date of a job page.
 
-            return job_details
+        Everything is collected in a single browser call. Use
+        `job_details.parse_job_details` for saved HTML.
+        """
+        try:
+            return await extract_job_details(page)
         except Exception as e:
             logger.error(f"Error scraping job details: {e}")
 
     async def filter_resource(self, route):
-        request = route.request
-        if request.resource_type in ["media", "font", "iframe", "stylesheet"]:
-            await route.abort()
-        else:
-            await route.continue_()
+        await filter_resource(route)
 
     async def parse(
         self, content: HTMLContent, incremental: bool = False
     ) -> ParsedContent:
+        """
+        Parse HTML with the configured parser backend.
+
+        Args:
+            content (HTMLContent): HTML as str or bytes.
+            incremental (bool): Parse with a pull parser instead and return
+                an iterator of the job card links, each yielded as soon as
+                it is complete. `content` may also be an iterable of byte
+                chunks, e.g. `response.iter_bytes()`.
+        """
         if incremental:
-            parser = etree.HTMLParser()
-            tree = etree.iterparse(
-                content, parser=parser, html=True, encoding="utf-8"
-            )
-            return tree
-        else:
-            soup = BeautifulSoup(content, "html.parser")
-            return soup
+            chunks = [content] if isinstance(content, (str, bytes)) else content
+            return iter_elements(chunks, JOB_LINK_SELECTOR)
+        return self.parser.parse(content)
 
     def set_headers(self, headers):
         return super().set_headers(headers)
@@ -355,8 +1189,27 @@ class WantedScraper(WebScraper):
     def manipulate_dom(self, dom_tree):
         return super().manipulate_dom(dom_tree)
 
-    def save(self, data, file_format):
-        return super().save(data, file_format)
+    async def save(self, data: Dict[str, Dict]):
+        """
+        Send a posting record, and its job details if fetched, to the
+        database sink and the streaming exporter.
 
-    def handle_error(self, error):
-        return super().handle_error(error)
+        Args:
+            data (Dict[str, Dict]): `{href: metadata}` record built by
+                `scrape_job_postings` or `posting_from_api`.
+        """
+        now = utcnow()
+        with metrics.histogram("save_seconds", "Duration of save").time():
+            for href, metadata in data.items():
+                record = {
+                    "href": href,
+                    "job_id": self.job_id,
+                    "query": self.queue_name,
+                    "scraped_at": now,
+                    **metadata,
+                }
+                if self.exporter is not None:
+                    await self.exporter.put(record)
+                if self.sink is not None:
+                    await self.sink.put_record(record)
+                metrics.counter("records_saved_total", "Records saved").inc()
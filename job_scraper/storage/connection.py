@@ -0,0 +1,47 @@
+import sqlite3
+
+from sqlalchemy import create_engine as sqlalchemy_create_engine
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from job_scraper.config.settings import SQLITE_CONFIG
+
+
+def apply_pragmas(connection):
+    """
+    Put a SQLite connection in WAL mode with a busy timeout.
+
+    Shards of a sharded crawl are separate processes sharing the same
+    database files. WAL lets them read while another one writes, and the
+    busy timeout makes a writer wait for the lock instead of failing with
+    "database is locked".
+    """
+    busy_timeout_ms = int(SQLITE_CONFIG["busy_timeout"] * 1000)
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout={busy_timeout_ms}")
+        cursor.execute("PRAGMA journal_mode=WAL")
+    finally:
+        cursor.close()
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """sqlite3 connection usable from worker threads (see `apply_pragmas`)"""
+    connection = sqlite3.connect(
+        path, timeout=SQLITE_CONFIG["busy_timeout"], check_same_thread=False
+    )
+    apply_pragmas(connection)
+    return connection
+
+
+def create_engine(url: str) -> Engine:
+    """SQLAlchemy engine whose SQLite connections use `apply_pragmas`"""
+    engine = sqlalchemy_create_engine(url)
+    if engine.dialect.name == "sqlite":
+        # pool이 새 DBAPI connection을 만들 때마다 적용
+        event.listen(
+            engine,
+            "connect",
+            lambda dbapi_connection, record: apply_pragmas(dbapi_connection),
+        )
+    return engine
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+import hashlib
+import json
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import CRAWL_STATE_CONFIG
+from job_scraper.storage.connection import create_engine
+from job_scraper.storage.models import Base
+from job_scraper.storage.models import CrawlState
+
+logger = setup_logger(__name__)
+
+
+def content_hash(data: Any) -> str:
+    """Stable SHA-256 hash of a JSON-serializable record"""
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def listing_hash(metadata: Dict[str, Any]) -> str:
+    """Hash of the listing card of a posting (everything but the details)"""
+    return content_hash(
+        {k: v for k, v in metadata.items() if k != "job_details"}
+    )
+
+
+def utcnow() -> datetime:
+    # SQLite는 timezone 정보를 저장하지 않으므로 naive UTC로 통일
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class CrawlStateStore:
+    """
+    Persistent crawl state keyed by `posting_id`.
+
+    Remembers when each posting was first and last seen, when its details
+    were last fetched, and hashes of the listing card and of the details.
+    A posting only needs its details fetched again when it is new, when its
+    listing card changed, or when `recheck_interval` has passed.
+
+    Database calls run in a worker thread so they never block the event loop.
+    """
+
+    def __init__(self, url: str = None, recheck_interval: timedelta = None):
+        self.engine = create_engine(url or CRAWL_STATE_CONFIG["url"])
+        self.recheck_interval = recheck_interval or timedelta(
+            hours=CRAWL_STATE_CONFIG["recheck_interval_hours"]
+        )
+        self.skipped = 0
+        Base.metadata.create_all(self.engine)
+
+    async def should_fetch(self, metadata: Dict[str, Any]) -> bool:
+        """
+        Record that the posting was seen and decide whether to fetch it.
+
+        Args:
+            metadata (Dict[str, Any]): Posting record without `job_details`.
+        """
+        should_fetch = await asyncio.to_thread(self._should_fetch, metadata)
+        if not should_fetch:
+            self.skipped += 1
+        return should_fetch
+
+    async def mark_fetched(
+        self, metadata: Dict[str, Any], job_details: Dict[str, str]
+    ):
+        """
+        Record freshly fetched details of a posting.
+
+        The listing hash is only stored here, so a changed card whose fetch
+        failed is still fetched on the next run.
+        """
+        await asyncio.to_thread(self._mark_fetched, metadata, job_details)
+
+    def close(self):
+        self.engine.dispose()
+
+    def _should_fetch(self, metadata: Dict[str, Any]) -> bool:
+        now = utcnow()
+        with Session(self.engine) as session, session.begin():
+            state = session.get(CrawlState, metadata["posting_id"])
+            if state is None:
+                session.add(
+                    CrawlState(
+                        posting_id=metadata["posting_id"],
+                        first_seen=now,
+                        last_seen=now,
+                    )
+                )
+                return True
+
+            state.last_seen = now
+            return (
+                state.listing_hash != listing_hash(metadata)
+                or state.last_fetched is None
+                or now - state.last_fetched >= self.recheck_interval
+            )
+
+    def _mark_fetched(
+        self, metadata: Dict[str, Any], job_details: Dict[str, str]
+    ):
+        now = utcnow()
+        posting_id = metadata["posting_id"]
+        with Session(self.engine) as session, session.begin():
+            state = session.get(CrawlState, posting_id)
+            if state is None:
+                state = CrawlState(
+                    posting_id=posting_id, first_seen=now, last_seen=now
+                )
+                session.add(state)
+
+            new_hash = content_hash(job_details)
+            if state.content_hash is not None and state.content_hash != new_hash:
+                logger.debug(f"Job details changed: {posting_id}")
+            state.last_fetched = now
+            state.listing_hash = listing_hash(metadata)
+            state.content_hash = new_hash
+            state.date_posted = job_details.get("게시일")
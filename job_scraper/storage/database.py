@@ -0,0 +1,231 @@
+import asyncio
+from typing import Any, Dict, List, Tuple, Type
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import PERSISTENCE_CONFIG
+from job_scraper.storage.connection import create_engine
+from job_scraper.storage.models import Base
+from job_scraper.storage.models import JobDetail
+from job_scraper.storage.models import JobPosting
+from job_scraper.storage.models import PostingQuery
+
+logger = setup_logger(__name__)
+
+# 같은 트랜잭션 안에서 이 순서대로 기록한다
+RECORD_MODELS: Dict[str, Type[Base]] = {
+    "posting": JobPosting,
+    "query": PostingQuery,
+    "detail": JobDetail,
+}
+
+UPSERT_DIALECTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+class DatabaseSink:
+    """
+    Async sink that writes scraped records in batched upserts.
+
+    Records are buffered per table and written inside one transaction when
+    `batch_size` records are pending or every `flush_interval` seconds,
+    whichever comes first. The engine URL is pluggable; SQLite and
+    PostgreSQL use native `ON CONFLICT DO UPDATE`, other databases fall
+    back to `Session.merge`.
+
+    Usage:
+        async with DatabaseSink() as sink:
+            await sink.put("posting", {"posting_id": "1", ...})
+    """
+
+    def __init__(
+        self,
+        url: str = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+    ):
+        self.engine = create_engine(url or PERSISTENCE_CONFIG["url"])
+        self.batch_size = batch_size or PERSISTENCE_CONFIG["batch_size"]
+        self.flush_interval = (
+            flush_interval or PERSISTENCE_CONFIG["flush_interval"]
+        )
+        self.written = 0
+
+        self._buffers: Dict[str, Dict[Tuple, Dict[str, Any]]] = {
+            record_type: {} for record_type in RECORD_MODELS
+        }
+        self._pending = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_task = None
+        Base.metadata.create_all(self.engine)
+
+    async def __aenter__(self) -> "DatabaseSink":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Start the periodic flush loop"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def put(self, record_type: str, record: Dict[str, Any]):
+        """
+        Buffer a record for writing.
+
+        Args:
+            record_type (str): "posting", "query" or "detail".
+            record (Dict[str, Any]): Column values including the primary
+                key. A later record with the same key replaces an earlier
+                one that has not been written yet.
+        """
+        table = RECORD_MODELS[record_type].__table__
+        key = tuple(record[column.name] for column in table.primary_key)
+        buffer = self._buffers[record_type]
+        if key not in buffer:
+            self._pending += 1
+        buffer[key] = record
+
+        if self._pending >= self.batch_size:
+            await self.flush()
+
+    async def put_record(self, record: Dict[str, Any]):
+        """
+        Buffer a flat posting record built by `WebScraper.save`.
+
+        The posting columns, the query that listed it and, if present, its
+        `job_details` are written to their own tables.
+        """
+        await self.put(
+            "posting",
+            {
+                column.name: record.get(column.name)
+                for column in JobPosting.__table__.columns
+            },
+        )
+        if record.get("query"):
+            await self.put(
+                "query",
+                {
+                    column.name: record.get(column.name)
+                    for column in PostingQuery.__table__.columns
+                },
+            )
+
+        job_details = record.get("job_details")
+        if job_details:
+            await self.put(
+                "detail",
+                {
+                    "posting_id": record["posting_id"],
+                    "details": job_details,
+                    "date_posted": job_details.get("게시일"),
+                    "fetched_at": record["scraped_at"],
+                },
+            )
+
+    async def flush(self):
+        """
+        Write every buffered record in a single transaction.
+
+        If the write fails, the records go back into the buffers (unless
+        newer versions were put meanwhile) and are retried by the next
+        flush.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return
+
+            # 쓰는 동안 들어오는 레코드는 새 버퍼에 쌓인다
+            buffers, self._buffers = self._buffers, {
+                record_type: {} for record_type in RECORD_MODELS
+            }
+            count, self._pending = self._pending, 0
+
+            try:
+                await asyncio.to_thread(
+                    self._write,
+                    {
+                        record_type: list(buffer.values())
+                        for record_type, buffer in buffers.items()
+                        if buffer
+                    },
+                )
+            except BaseException:
+                for record_type, buffer in buffers.items():
+                    buffer.update(self._buffers[record_type])
+                self._buffers = buffers
+                self._pending = sum(map(len, buffers.values()))
+                raise
+            self.written += count
+            logger.debug(f"Flushed {count} records")
+
+    async def close(self):
+        """Flush the remaining records and release the engine"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        try:
+            await self.flush()
+        finally:
+            self.engine.dispose()
+        logger.info(f"Saved {self.written} records")
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush records: {e}", exc_info=True)
+
+    def _write(self, batches: Dict[str, List[Dict[str, Any]]]):
+        upsert = UPSERT_DIALECTS.get(self.engine.dialect.name)
+        if upsert is None:
+            return self._merge(batches)
+
+        with self.engine.begin() as connection:
+            for record_type, model in RECORD_MODELS.items():
+                if record_type in batches:
+                    self._upsert(
+                        connection, upsert, model, batches[record_type]
+                    )
+
+    @staticmethod
+    def _upsert(
+        connection: Connection,
+        upsert,
+        model: Type[Base],
+        rows: List[Dict[str, Any]],
+    ):
+        table = model.__table__
+        statement = upsert(table).values(rows)
+        primary_keys = [column.name for column in table.primary_key]
+        statement = statement.on_conflict_do_update(
+            index_elements=primary_keys,
+            set_={
+                column.name: statement.excluded[column.name]
+                for column in table.columns
+                if column.name not in primary_keys
+            },
+        )
+        connection.execute(statement)
+
+    def _merge(self, batches: Dict[str, List[Dict[str, Any]]]):
+        with Session(self.engine) as session, session.begin():
+            for record_type, model in RECORD_MODELS.items():
+                for row in batches.get(record_type, []):
+                    session.merge(model(**row))
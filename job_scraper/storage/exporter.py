@@ -0,0 +1,285 @@
+import asyncio
+from datetime import datetime
+import gzip
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import EXPORT_CONFIG
+
+logger = setup_logger(__name__)
+
+FILE_FORMATS = ("jsonl", "jsonl.gz", "parquet")
+
+# Parquet 열과 pyarrow 타입 (첫 batch가 아니라 여기서 schema를 고정)
+PARQUET_COLUMNS = (
+    ("href", "string"),
+    ("posting_id", "string"),
+    ("position", "string"),
+    ("company", "string"),
+    ("company_id", "string"),
+    ("job_category", "string"),
+    ("job_category_id", "string"),
+    ("job_id", "int64"),
+    ("query", "string"),
+    ("scraped_at", "timestamp"),
+    ("job_details", "string"),
+)
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+class _JsonlWriter:
+    """Line-delimited JSON (optionally gzip) file that can be tailed"""
+
+    def __init__(self, path: str, compress: bool):
+        self.path = path
+        self._file = (
+            gzip.open(path, "at", encoding="utf-8")
+            if compress
+            else open(path, "a", encoding="utf-8")
+        )
+
+    def write(self, records: List[Dict[str, Any]]):
+        for record in records:
+            self._file.write(
+                json.dumps(record, ensure_ascii=False, default=_json_default)
+                + "\n"
+            )
+        self._file.flush()
+
+    def size(self) -> int:
+        return os.path.getsize(self.path)
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetWriter:
+    """
+    zstd-compressed Parquet file written one row group per batch.
+
+    Every file has the columns of `PARQUET_COLUMNS`, so a first batch of
+    postings without `job_details` does not drop the details of the later
+    ones. Unknown keys are dropped with a warning.
+    """
+
+    def __init__(self, path: str):
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required for the parquet export format"
+            ) from e
+
+        types = {
+            "string": pa.string(),
+            "int64": pa.int64(),
+            "timestamp": pa.timestamp("us"),
+        }
+        self.path = path
+        self.schema = pa.schema(
+            [(name, types[type_name]) for name, type_name in PARQUET_COLUMNS]
+        )
+        self._dropped = set()
+        self._writer = None
+
+    def write(self, records: List[Dict[str, Any]]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # 공고마다 섹션 제목이 달라 중첩 dict는 JSON 문자열로 저장
+        rows = [
+            {
+                key: (
+                    json.dumps(value, ensure_ascii=False, default=_json_default)
+                    if isinstance(value, (dict, list))
+                    else value
+                )
+                for key, value in record.items()
+            }
+            for record in records
+        ]
+        dropped = set().union(*rows) - set(self.schema.names) - self._dropped
+        if dropped:
+            self._dropped |= dropped
+            logger.warning(
+                f"Dropping keys missing from the parquet schema: {dropped}"
+            )
+
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self.path, self.schema, compression="zstd"
+            )
+        self._writer.write_table(
+            pa.Table.from_pylist(rows, schema=self.schema)
+        )
+
+    def size(self) -> int:
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class StreamExporter:
+    """
+    Streaming export stage fed by a bounded queue.
+
+    Records are written as soon as they are finished, so memory stays flat
+    regardless of the crawl size. When the writer falls behind, `put` blocks
+    until there is room in the queue, which slows the producers down. Files
+    are rotated once they reach `max_file_bytes`.
+
+    Formats:
+        - "jsonl" / "jsonl.gz": flushed after every batch, so other jobs can
+          tail the current file while the crawl runs.
+        - "parquet": zstd-compressed columnar file (requires pyarrow).
+    """
+
+    def __init__(
+        self,
+        directory: str = None,
+        file_format: str = None,
+        max_file_bytes: int = None,
+        queue_size: int = None,
+        batch_size: int = None,
+        prefix: str = "postings",
+    ):
+        self.directory = directory or EXPORT_CONFIG["directory"]
+        self.file_format = file_format or EXPORT_CONFIG["file_format"]
+        if self.file_format not in FILE_FORMATS:
+            raise ValueError(f"Unsupported export format: {self.file_format}")
+        self.max_file_bytes = (
+            max_file_bytes or EXPORT_CONFIG["max_file_bytes"]
+        )
+        self.batch_size = batch_size or EXPORT_CONFIG["batch_size"]
+        self.prefix = prefix
+        self.exported = 0
+        self.files: List[str] = []
+
+        self._queue = asyncio.Queue(
+            maxsize=queue_size or EXPORT_CONFIG["queue_size"]
+        )
+        self._writer = None
+        self._writer_task = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    async def __aenter__(self) -> "StreamExporter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Start the background writer"""
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def put(self, record: Dict[str, Any]):
+        """
+        Queue a record, waiting while the writer is behind.
+
+        Raises:
+            Exception: The error that stopped the writer, if it failed.
+        """
+        await self._enqueue(record)
+
+    async def close(self):
+        """
+        Write the queued records and close the current file.
+
+        Raises:
+            Exception: The error that stopped the writer, if it failed.
+        """
+        if self._writer_task is not None:
+            try:
+                await self._enqueue(None)
+                await self._writer_task
+            finally:
+                self._writer_task = None
+        logger.info(
+            f"Exported {self.exported} records to {len(self.files)} file(s)"
+        )
+
+    async def _enqueue(self, item: Optional[Dict[str, Any]]):
+        writer_task = self._writer_task
+        if writer_task is None:
+            await self._queue.put(item)
+            return
+        if writer_task.done():
+            self._raise_writer_error(writer_task)
+
+        try:
+            self._queue.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        # 큐가 가득 찬 동안 writer가 죽으면 영원히 기다리지 않도록 같이 기다린다
+        put_task = asyncio.ensure_future(self._queue.put(item))
+        try:
+            await asyncio.wait(
+                {put_task, writer_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            if not put_task.done():
+                put_task.cancel()
+        if put_task.done() and not put_task.cancelled():
+            return
+        self._raise_writer_error(writer_task)
+
+    @staticmethod
+    def _raise_writer_error(writer_task: asyncio.Task):
+        # writer가 실패했다면 원인 예외를 그대로 전달
+        writer_task.result()
+        raise RuntimeError("The export writer has stopped")
+
+    async def _write_loop(self):
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                while len(batch) < self.batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+                done = batch[-1] is None
+                records = [record for record in batch if record is not None]
+                if records:
+                    await asyncio.to_thread(self._write, records)
+                    self.exported += len(records)
+                if done:
+                    break
+        finally:
+            if self._writer is not None:
+                await asyncio.to_thread(self._writer.close)
+                self._writer = None
+
+    def _write(self, records: List[Dict[str, Any]]):
+        if self._writer is None:
+            self._writer = self._open_next()
+
+        self._writer.write(records)
+        if self._writer.size() >= self.max_file_bytes:
+            self._writer.close()
+            self._writer = None
+
+    def _open_next(self):
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(
+            self.directory,
+            f"{self.prefix}-{timestamp}-{len(self.files):04d}"
+            f".{self.file_format}",
+        )
+        self.files.append(path)
+        logger.info(f"Exporting records to {path}")
+
+        if self.file_format == "parquet":
+            return _ParquetWriter(path)
+        return _JsonlWriter(path, compress=self.file_format == "jsonl.gz")
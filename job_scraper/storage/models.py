@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import JSON
+from sqlalchemy import String
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class CrawlState(Base):
+    """Crawl history of a single posting"""
+
+    __tablename__ = "crawl_state"
+
+    posting_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    first_seen: Mapped[datetime] = mapped_column(DateTime)
+    last_seen: Mapped[datetime] = mapped_column(DateTime)
+    last_fetched: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    listing_hash: Mapped[Optional[str]] = mapped_column(String(64))
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))
+    date_posted: Mapped[Optional[str]] = mapped_column(String(32))
+
+
+class JobPosting(Base):
+    """Listing card of a posting"""
+
+    __tablename__ = "job_posting"
+
+    posting_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    href: Mapped[str] = mapped_column(String(255))
+    position: Mapped[Optional[str]] = mapped_column(String(255))
+    company: Mapped[Optional[str]] = mapped_column(String(255))
+    company_id: Mapped[Optional[str]] = mapped_column(String(32))
+    job_category: Mapped[Optional[str]] = mapped_column(String(64))
+    job_category_id: Mapped[Optional[str]] = mapped_column(String(32))
+    job_id: Mapped[Optional[int]] = mapped_column(Integer)
+    scraped_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+class PostingQuery(Base):
+    """Query of the grid (job x location x years) that listed a posting"""
+
+    __tablename__ = "posting_query"
+
+    posting_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    query: Mapped[str] = mapped_column(String(255), primary_key=True)
+    job_id: Mapped[Optional[int]] = mapped_column(Integer)
+    scraped_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+class JobDetail(Base):
+    """Description sections of a posting"""
+
+    __tablename__ = "job_detail"
+
+    posting_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    details: Mapped[Dict[str, Any]] = mapped_column(JSON)
+    date_posted: Mapped[Optional[str]] = mapped_column(String(32))
+    fetched_at: Mapped[datetime] = mapped_column(DateTime)
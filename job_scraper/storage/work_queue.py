@@ -0,0 +1,233 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Set, Tuple
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import WORK_QUEUE_CONFIG
+from job_scraper.storage.connection import connect
+
+logger = setup_logger(__name__)
+
+PENDING = "pending"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+FAILED = "failed"
+
+WORK_QUEUE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_item (
+    queue TEXT NOT NULL,
+    posting_id TEXT NOT NULL,
+    posting TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (queue, posting_id)
+);
+CREATE TABLE IF NOT EXISTS work_checkpoint (
+    queue TEXT PRIMARY KEY,
+    listed_at REAL NOT NULL
+);
+"""
+
+ADD_SQL = """
+INSERT INTO work_item (queue, posting_id, posting, status, updated_at)
+VALUES (?, ?, ?, 'pending', ?)
+ON CONFLICT (queue, posting_id) DO UPDATE SET
+    posting = excluded.posting, updated_at = excluded.updated_at
+WHERE work_item.status != 'done'
+"""
+
+MARK_SQL = """
+UPDATE work_item
+SET status = ?, attempts = attempts + ?, updated_at = ?
+WHERE queue = ? AND posting_id = ?
+"""
+
+
+class DurableWorkQueue:
+    """
+    Crash-safe journal of the postings queued for detail fetching.
+
+    Every queued posting and its pending / in_progress / done / failed
+    marker is written to SQLite (WAL mode), keyed by the queue of one
+    job x location crawl. Writes are buffered and committed together every
+    `batch_size` operations or `flush_interval` seconds, so journaling adds
+    one small transaction per batch instead of one per posting. A crash
+    loses at most the last batch, whose postings are simply fetched again.
+
+    A rerun with resume restores the unfinished postings and, if the
+    listing had completed, skips the list phase entirely.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+        max_attempts: int = None,
+    ):
+        self.path = path or WORK_QUEUE_CONFIG["path"]
+        self.batch_size = batch_size or WORK_QUEUE_CONFIG["batch_size"]
+        self.flush_interval = (
+            flush_interval or WORK_QUEUE_CONFIG["flush_interval"]
+        )
+        self.max_attempts = max_attempts or WORK_QUEUE_CONFIG["max_attempts"]
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = connect(self.path)
+        # WAL에서는 NORMAL이어도 DB가 깨지지 않으며 commit마다 fsync하지 않는다
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(WORK_QUEUE_SCHEMA)
+        self._connection.commit()
+
+        self._buffer: List[Tuple[str, Tuple]] = []
+        self._last_flush = time.monotonic()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task = None
+
+    async def add(self, queue: str, posting: Dict[str, Dict]):
+        """Journal a queued `{href: metadata}` posting as pending"""
+        (metadata,) = posting.values()
+        await self._write(
+            ADD_SQL,
+            (
+                queue,
+                metadata["posting_id"],
+                json.dumps(posting, ensure_ascii=False),
+                time.time(),
+            ),
+        )
+
+    async def mark(self, queue: str, posting_id: str, status: str):
+        """Record the progress of a posting (in_progress, done or failed)"""
+        await self._write(
+            MARK_SQL,
+            (
+                status,
+                int(status == IN_PROGRESS),
+                time.time(),
+                queue,
+                posting_id,
+            ),
+        )
+
+    async def mark_listed(self, queue: str):
+        """Checkpoint that the list phase of `queue` finished"""
+        await self._write(
+            "INSERT OR REPLACE INTO work_checkpoint VALUES (?, ?)",
+            (queue, time.time()),
+        )
+        await self.flush()
+
+    async def restore(
+        self, queue: str
+    ) -> Tuple[List[Dict[str, Dict]], Set[str], bool]:
+        """
+        Load the state of an interrupted crawl.
+
+        Returns:
+            Tuple[List[Dict[str, Dict]], Set[str], bool]:
+                - Postings still to fetch (pending, in_progress, and failed
+                  ones with attempts left), in queued order.
+                - `posting_id`s that are already finished.
+                - Whether the list phase had completed.
+        """
+        await self.flush()
+        return await asyncio.to_thread(self._restore, queue)
+
+    async def reset(self, queue: str):
+        """Forget the journal of `queue` before a fresh crawl"""
+        await self.flush()
+        await asyncio.to_thread(self._reset, queue)
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            operations, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+            await asyncio.to_thread(self._execute, operations)
+
+    async def close(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush()
+        with self._lock:
+            self._connection.close()
+
+    def stats(self, queue: str) -> Dict[str, int]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT status, COUNT(*) FROM work_item WHERE queue = ? "
+                "GROUP BY status",
+                (queue,),
+            ).fetchall()
+        return dict(rows)
+
+    async def _write(self, sql: str, params: Tuple):
+        self._buffer.append((sql, params))
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            # 쓰기가 멈춰도 flush_interval 안에는 commit되도록 예약
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush the work queue: {e}", exc_info=True)
+
+    def _execute(self, operations: List[Tuple[str, Tuple]]):
+        with self._lock:
+            with self._connection:  # 하나의 트랜잭션으로 commit
+                for sql, params in operations:
+                    self._connection.execute(sql, params)
+
+    def _restore(
+        self, queue: str
+    ) -> Tuple[List[Dict[str, Dict]], Set[str], bool]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT posting_id, posting, status, attempts FROM work_item "
+                "WHERE queue = ? ORDER BY rowid",
+                (queue,),
+            ).fetchall()
+            listed = self._connection.execute(
+                "SELECT 1 FROM work_checkpoint WHERE queue = ?", (queue,)
+            ).fetchone()
+
+        postings, finished = [], set()
+        for posting_id, posting, status, attempts in rows:
+            if status == DONE or (
+                status == FAILED and attempts >= self.max_attempts
+            ):
+                finished.add(posting_id)
+            else:
+                postings.append(json.loads(posting))
+        return postings, finished, listed is not None
+
+    def _reset(self, queue: str):
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM work_item WHERE queue = ?", (queue,)
+                )
+                self._connection.execute(
+                    "DELETE FROM work_checkpoint WHERE queue = ?", (queue,)
+                )
@@ -0,0 +1,162 @@
+import base64
+from collections import defaultdict
+import json
+import os
+from typing import Any, Dict, List, Tuple
+
+import httpx
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.scrapers.browser_pool import BrowserPool
+from job_scraper.utils.http_client import pooled_transport
+
+logger = setup_logger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that appends every exchange to a JSONL fixture file.
+
+    Bodies are stored exactly as received (still compressed), so a replay
+    goes through the same decoding as the original crawl.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, path: str):
+        self.transport = transport
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8")
+        self.recorded = 0
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        try:
+            body = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+
+        self._file.write(
+            json.dumps(
+                {
+                    "method": request.method,
+                    "url": str(request.url),
+                    "status": response.status_code,
+                    "headers": [
+                        (name.decode("latin-1"), value.decode("latin-1"))
+                        for name, value in response.headers.raw
+                    ],
+                    "body": base64.b64encode(body).decode("ascii"),
+                }
+            )
+            + "\n"
+        )
+        self._file.flush()
+        self.recorded += 1
+
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(body),
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self):
+        self._file.close()
+        logger.info(f"Recorded {self.recorded} HTTP exchanges to {self.path}")
+        await self.transport.aclose()
+
+
+def load_fixtures(path: str) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """Recorded exchanges grouped by (method, url), in recording order"""
+    fixtures = defaultdict(list)
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                exchange = json.loads(line)
+                fixtures[(exchange["method"], exchange["url"])].append(
+                    exchange
+                )
+    return fixtures
+
+
+def replay_transport(path: str) -> httpx.MockTransport:
+    """
+    Mock transport answering requests from a fixture file.
+
+    Repeated requests get the recorded responses in order, and the last one
+    again once they run out. Unknown requests get a 504, like the offline
+    HTTP cache.
+    """
+    fixtures = load_fixtures(path)
+    served: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = (request.method, str(request.url))
+        exchanges = fixtures.get(key)
+        if not exchanges:
+            logger.warning(f"No fixture for {request.method} {request.url}")
+            return httpx.Response(504, request=request)
+
+        exchange = exchanges[min(served[key], len(exchanges) - 1)]
+        served[key] += 1
+        return httpx.Response(
+            exchange["status"],
+            headers=[tuple(header) for header in exchange["headers"]],
+            stream=httpx.ByteStream(base64.b64decode(exchange["body"])),
+            request=request,
+        )
+
+    return httpx.MockTransport(handler)
+
+
+class FixtureBundle:
+    """
+    Recorded traffic of one crawl, saved in a directory.
+
+    Layout:
+        meta.json   - what was crawled (job, params, ...)
+        har/*.har   - browser traffic, one file per browser context
+        http.jsonl  - httpx traffic
+
+    Usage:
+        bundle = FixtureBundle("fixtures/wanted")
+        browser_pool = bundle.browser_pool(REPLAY)
+        session = httpx.AsyncClient(transport=bundle.transport(REPLAY))
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.har_dir = os.path.join(directory, "har")
+        self.http_path = os.path.join(directory, "http.jsonl")
+        self.meta_path = os.path.join(directory, "meta.json")
+
+    def browser_pool(self, mode: str, **kwargs) -> BrowserPool:
+        return BrowserPool(har_dir=self.har_dir, har_mode=mode, **kwargs)
+
+    def transport(
+        self, mode: str, transport: httpx.AsyncBaseTransport = None
+    ) -> httpx.AsyncBaseTransport:
+        if mode == RECORD:
+            return RecordingTransport(
+                transport or pooled_transport(),
+                self.http_path,
+            )
+        if mode == REPLAY:
+            return replay_transport(self.http_path)
+        raise ValueError(f"Unsupported fixture mode: {mode}")
+
+    def save_meta(self, meta: Dict[str, Any]):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.meta_path, "w", encoding="utf-8") as file:
+            json.dump(meta, file, ensure_ascii=False, indent=2)
+
+    def load_meta(self) -> Dict[str, Any]:
+        with open(self.meta_path, encoding="utf-8") as file:
+            return json.load(file)
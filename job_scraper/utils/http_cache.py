@@ -0,0 +1,281 @@
+import asyncio
+from fnmatch import fnmatch
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import HTTP_CACHE_CONFIG
+from job_scraper.storage.connection import connect
+
+logger = setup_logger(__name__)
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    size INTEGER NOT NULL
+)
+"""
+
+
+class CacheEntry:
+    def __init__(
+        self,
+        status: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        stored_at: float,
+    ):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.body),
+            request=request,
+        )
+
+
+class HttpCache:
+    """
+    On-disk response store backed by SQLite.
+
+    Entries are evicted in least-recently-used order once the total body
+    size exceeds `max_bytes`.
+    """
+
+    def __init__(self, path: str = None, max_bytes: int = None):
+        self.path = path or HTTP_CACHE_CONFIG["path"]
+        self.max_bytes = max_bytes or HTTP_CACHE_CONFIG["max_bytes"]
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = connect(self.path)
+        self._connection.execute(CACHE_SCHEMA)
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, headers, body, etag, last_modified, stored_at "
+                "FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE http_cache SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._connection.commit()
+
+        status, headers, body, etag, last_modified, stored_at = row
+        return CacheEntry(
+            status,
+            [tuple(header) for header in json.loads(headers)],
+            body,
+            etag,
+            last_modified,
+            stored_at,
+        )
+
+    def put(self, key: str, response: httpx.Response, body: bytes):
+        now = time.time()
+        headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in response.headers.raw
+        ]
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    response.headers.get("etag"),
+                    response.headers.get("last-modified"),
+                    now,
+                    now,
+                    len(body),
+                ),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def touch(self, key: str):
+        """Mark a revalidated entry as fresh again"""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE http_cache SET stored_at = ?, last_access = ? "
+                "WHERE key = ?",
+                (now, now, key),
+            )
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self):
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM http_cache"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        rows = self._connection.execute(
+            "SELECT key, size FROM http_cache ORDER BY last_access"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany(
+            "DELETE FROM http_cache WHERE key = ?", evicted
+        )
+        logger.debug(f"Evicted {len(evicted)} cached responses")
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that caches GET responses on disk.
+
+    A fresh entry (younger than the TTL of its URL pattern) is served
+    without touching the network. A stale entry is revalidated with
+    `If-None-Match` / `If-Modified-Since`, and a 304 reply is answered from
+    the cache. In offline mode cached entries are always served and misses
+    return 504, so recorded responses can be replayed without a network.
+
+    Without `cache`, the transport opens its own `HttpCache` and closes it
+    in `aclose`; a cache that is passed in is left to its owner.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        cache: HttpCache = None,
+        ttls: Dict[str, float] = None,
+        default_ttl: float = None,
+        offline: bool = None,
+    ):
+        self.transport = transport
+        self._owns_cache = cache is None
+        self.cache = HttpCache() if cache is None else cache
+        self.ttls = HTTP_CACHE_CONFIG["ttls"] if ttls is None else ttls
+        self.default_ttl = (
+            HTTP_CACHE_CONFIG["default_ttl"]
+            if default_ttl is None
+            else default_ttl
+        )
+        self.offline = (
+            HTTP_CACHE_CONFIG["offline"] if offline is None else offline
+        )
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def ttl_for(self, url: str) -> float:
+        for pattern, ttl in self.ttls.items():
+            if fnmatch(url, pattern):
+                return ttl
+        return self.default_ttl
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        if request.method != "GET":
+            return await self.transport.handle_async_request(request)
+
+        key = str(request.url)
+        entry = await asyncio.to_thread(self.cache.get, key)
+
+        if entry is not None and (
+            self.offline or time.time() - entry.stored_at < self.ttl_for(key)
+        ):
+            self.hits += 1
+            return entry.to_response(request)
+        if self.offline:
+            self.misses += 1
+            return httpx.Response(504, request=request)
+
+        if entry is not None:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = await self.transport.handle_async_request(request)
+        if entry is not None and response.status_code == 304:
+            await response.aclose()
+            await asyncio.to_thread(self.cache.touch, key)
+            self.revalidated += 1
+            return entry.to_response(request)
+
+        self.misses += 1
+        if response.status_code != 200 or "no-store" in response.headers.get(
+            "cache-control", ""
+        ):
+            return response
+
+        try:
+            # 압축을 풀지 않은 원본 body를 저장 (decode는 client가 담당)
+            body = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        await asyncio.to_thread(self.cache.put, key, response, body)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(body),
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+        }
+
+    async def aclose(self):
+        logger.info(f"HTTP cache stats: {self.stats()}")
+        try:
+            await self.transport.aclose()
+        finally:
+            if self._owns_cache:
+                self.cache.close()
+
+
+def cached_transport(
+    transport: httpx.AsyncBaseTransport, cache: HttpCache = None
+) -> httpx.AsyncBaseTransport:
+    """Wrap `transport` with the disk cache when it is enabled in settings"""
+    if not HTTP_CACHE_CONFIG["enabled"]:
+        return transport
+    return CachingTransport(transport, cache=cache)
@@ -0,0 +1,152 @@
+import asyncio
+from asyncio import Queue
+from functools import lru_cache
+import importlib.util
+from typing import Any, AsyncIterator, Awaitable, Callable, Tuple, TypeVar
+
+import httpx
+
+from job_scraper.config.logging_config import rate_limited
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import HTTP_CLIENT_CONFIG
+from job_scraper.utils.http_cache import cached_transport
+from job_scraper.utils.http_cache import HttpCache
+from job_scraper.utils.metrics import metrics
+from job_scraper.utils.rate_limiter import RateLimitedTransport
+from job_scraper.utils.rate_limiter import RateLimiter
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+_DONE = object()  # worker 종료 표시
+
+
+@lru_cache(maxsize=1)
+def http2_enabled() -> bool:
+    """HTTP/2 is used when configured and the optional `h2` package exists"""
+    if not HTTP_CLIENT_CONFIG["http2"]:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("h2 is not installed, falling back to HTTP/1.1")
+        return False
+    return True
+
+
+def client_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=HTTP_CLIENT_CONFIG["max_connections"],
+        max_keepalive_connections=HTTP_CLIENT_CONFIG[
+            "max_keepalive_connections"
+        ],
+        keepalive_expiry=HTTP_CLIENT_CONFIG["keepalive_expiry"],
+    )
+
+
+def client_timeout() -> httpx.Timeout:
+    return httpx.Timeout(
+        HTTP_CLIENT_CONFIG["timeout"],
+        connect=HTTP_CLIENT_CONFIG["connect_timeout"],
+    )
+
+
+def pooled_transport(**kwargs) -> httpx.AsyncHTTPTransport:
+    """Connection pool with the configured limits, multiplexed over HTTP/2"""
+    return httpx.AsyncHTTPTransport(
+        http2=http2_enabled(), limits=client_limits(), **kwargs
+    )
+
+
+def create_client(
+    rate_limiter: RateLimiter = None,
+    http_cache: HttpCache = None,
+    transport: httpx.AsyncBaseTransport = None,
+    **kwargs,
+) -> httpx.AsyncClient:
+    """
+    Client shared by every scraper of a run.
+
+    Requests go through the disk cache, then the per-host rate limiter, then
+    one pooled transport. Keep-alive connections and HTTP/2 streams are
+    reused across scrapers, so each host costs a single TLS handshake.
+
+    Args:
+        rate_limiter (RateLimiter): Per-host limiter. Defaults to a new one.
+        http_cache (HttpCache): Disk cache, used when it is enabled in
+            `HTTP_CACHE_CONFIG`.
+        transport (httpx.AsyncBaseTransport): Replaces the whole transport
+            chain, e.g. a fixture replay.
+        **kwargs: Passed on to `httpx.AsyncClient`.
+    """
+    if transport is None:
+        transport = cached_transport(
+            RateLimitedTransport(
+                rate_limiter or RateLimiter(), pooled_transport()
+            ),
+            cache=http_cache,
+        )
+    kwargs.setdefault("timeout", client_timeout())
+    kwargs.setdefault("follow_redirects", True)
+    kwargs.setdefault("max_redirects", HTTP_CLIENT_CONFIG["max_redirects"])
+    return httpx.AsyncClient(transport=transport, **kwargs)
+
+
+async def stream_fetch(
+    fetch: Callable[[str], Awaitable[T]],
+    urls: Queue,
+    workers: int = None,
+) -> AsyncIterator[Tuple[str, T]]:
+    """
+    Fetch the URLs of `urls` with a fixed number of workers.
+
+    `(url, result)` pairs are yielded as soon as each fetch finishes, in
+    completion order. At most `workers` fetches run at once and at most
+    `workers` finished results wait for the consumer, so memory and sockets
+    stay bounded however many URLs are queued. Failed URLs are logged and
+    skipped. Leaving the loop early cancels the remaining fetches.
+
+    Usage:
+        async for url, html in stream_fetch(fetch, urls):
+            ...
+    """
+    workers = workers or HTTP_CLIENT_CONFIG["fetch_workers"]
+    results: Queue = Queue(maxsize=workers)
+
+    async def worker():
+        while True:
+            try:
+                url = urls.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            try:
+                result = await fetch(url)
+            except Exception as e:
+                metrics.counter(
+                    "fetch_errors_total", "URLs that failed in fetch_all"
+                ).inc()
+                logger.warning(
+                    f"Failed to fetch {url}: {e}",
+                    extra=rate_limited("stream_fetch_failed"),
+                )
+            else:
+                await results.put((url, result))
+            finally:
+                urls.task_done()
+        await results.put(_DONE)
+
+    tasks = [
+        asyncio.create_task(worker())
+        for _ in range(min(workers, urls.qsize()))
+    ]
+    running = len(tasks)
+    try:
+        while running:
+            item: Any = await results.get()
+            if item is _DONE:
+                running -= 1
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,327 @@
+import bisect
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import METRICS_CONFIG
+
+logger = setup_logger(__name__)
+
+# 초 단위 latency bucket
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+MAX_SAMPLES = 10000  # percentile 계산에 쓰는 reservoir 크기
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def state(self) -> Dict[str, Any]:
+        return {"value": self.value}
+
+    def merge(self, state: Dict[str, Any]):
+        self.value += state["value"]
+
+    def summary(self) -> float:
+        return self.value
+
+
+class Gauge:
+    """Current value, e.g. in-flight requests, plus the highest value seen"""
+
+    kind = "gauge"
+
+    def __init__(self):
+        self.value = 0.0
+        self.max = 0.0
+
+    def set(self, value: float):
+        self.value = value
+        self.max = max(self.max, value)
+
+    def inc(self, amount: float = 1):
+        self.set(self.value + amount)
+
+    def dec(self, amount: float = 1):
+        self.set(self.value - amount)
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count the block as in flight while it runs"""
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+    def state(self) -> Dict[str, Any]:
+        return {"value": self.value, "max": self.max}
+
+    def merge(self, state: Dict[str, Any]):
+        self.value += state["value"]
+        self.max = max(self.max, state["max"])
+
+    def summary(self) -> Dict[str, float]:
+        return {"value": self.value, "max": self.max}
+
+
+class Histogram:
+    """
+    Bucketed observations for Prometheus, plus a bounded random sample of
+    the raw values for percentiles in the JSON summary.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.samples: List[float] = []
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(value)
+        else:
+            index = random.randrange(self.count)
+            if index < MAX_SAMPLES:
+                self.samples[index] = value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def state(self) -> Dict[str, Any]:
+        return {
+            "buckets": list(self.buckets),
+            "counts": self.counts,
+            "sum": self.sum,
+            "count": self.count,
+            "samples": self.samples,
+        }
+
+    def merge(self, state: Dict[str, Any]):
+        self.counts = [a + b for a, b in zip(self.counts, state["counts"])]
+        self.sum += state["sum"]
+        self.count += state["count"]
+        self.samples = (self.samples + state["samples"])[-MAX_SAMPLES:]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": max(self.samples) if self.samples else None,
+        }
+
+
+METRIC_TYPES = {cls.kind: cls for cls in (Counter, Gauge, Histogram)}
+
+
+class MetricsRegistry:
+    """
+    Process-wide counters, gauges and latency histograms.
+
+    Metrics are created on first use, one series per label set:
+
+        metrics.counter("pages_fetched_total", "Pages fetched", kind="api").inc()
+        with metrics.histogram("detail_seconds", "Detail page latency").time():
+            ...
+
+    The registry can be written as a JSON summary (with p50/p95) or in the
+    Prometheus text format, either to a file or from a small HTTP endpoint.
+    Worker processes send `state()` to the parent, which `merge`s it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help: Dict[str, str] = {}
+        self._kinds: Dict[str, str] = {}
+        self._series: Dict[str, Dict[Labels, Any]] = {}
+
+    def counter(self, name: str, description: str = "", **labels) -> Counter:
+        return self._get(Counter.kind, name, description, labels)
+
+    def gauge(self, name: str, description: str = "", **labels) -> Gauge:
+        return self._get(Gauge.kind, name, description, labels)
+
+    def histogram(
+        self, name: str, description: str = "", **labels
+    ) -> Histogram:
+        return self._get(Histogram.kind, name, description, labels)
+
+    def _get(
+        self, kind: str, name: str, description: str, labels: Dict[str, Any]
+    ):
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        series = self._series.get(name)
+        if series is not None and key in series:
+            return series[key]
+
+        with self._lock:
+            if self._kinds.setdefault(name, kind) != kind:
+                raise ValueError(f"{name} is already a {self._kinds[name]}")
+            if description:
+                self._help.setdefault(name, description)
+            series = self._series.setdefault(name, {})
+            if key not in series:
+                series[key] = METRIC_TYPES[kind]()
+            return series[key]
+
+    def state(self) -> Dict[str, Any]:
+        """Picklable snapshot that can be merged into another registry"""
+        with self._lock:
+            return {
+                name: {
+                    "kind": self._kinds[name],
+                    "help": self._help.get(name, ""),
+                    "series": [
+                        (list(labels), metric.state())
+                        for labels, metric in series.items()
+                    ],
+                }
+                for name, series in self._series.items()
+            }
+
+    def reset(self):
+        """Drop every series, e.g. before a reused worker runs a new shard"""
+        with self._lock:
+            self._help.clear()
+            self._kinds.clear()
+            self._series.clear()
+
+    def merge(self, state: Dict[str, Any]):
+        for name, family in state.items():
+            for labels, metric_state in family["series"]:
+                self._get(
+                    family["kind"], name, family["help"], dict(labels)
+                ).merge(metric_state)
+
+    def summary(self) -> Dict[str, Any]:
+        """Every series as plain values, keyed by name and then labels"""
+        with self._lock:
+            return {
+                name: {
+                    ",".join(f"{k}={v}" for k, v in labels): metric.summary()
+                    for labels, metric in series.items()
+                }
+                for name, series in sorted(self._series.items())
+            }
+
+    def to_prometheus(self) -> str:
+        """Render the registry in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._series.items()):
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} {self._kinds[name]}")
+                for labels, metric in series.items():
+                    lines.extend(_prometheus_lines(name, labels, metric))
+        return "\n".join(lines) + "\n"
+
+    def export(self, json_path: str = None, prometheus_path: str = None):
+        """Write the JSON summary and the Prometheus text file"""
+        json_path = json_path or METRICS_CONFIG["json_path"]
+        prometheus_path = prometheus_path or METRICS_CONFIG["prometheus_path"]
+
+        for path in (json_path, prometheus_path):
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, ensure_ascii=False, indent=2)
+        with open(prometheus_path, "w", encoding="utf-8") as file:
+            file.write(self.to_prometheus())
+        logger.info(f"Metrics exported to {json_path} and {prometheus_path}")
+
+    def serve(
+        self, port: int = None, host: str = None
+    ) -> ThreadingHTTPServer:
+        """
+        Serve `/metrics` in the Prometheus format from a daemon thread.
+
+        Binds to `METRICS_CONFIG["host"]` (localhost) unless `host` is given.
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", "text/plain; version=0.0.4; charset=utf-8"
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        if port is None:
+            port = METRICS_CONFIG["port"]
+        if host is None:
+            host = METRICS_CONFIG["host"]
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logger.info(
+            f"Serving metrics on http://{host}:{server.server_address[1]}"
+            "/metrics"
+        )
+        return server
+
+
+def _format_labels(labels: Labels, **extra) -> str:
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+def _prometheus_lines(name: str, labels: Labels, metric) -> List[str]:
+    if metric.kind != Histogram.kind:
+        return [f"{name}{_format_labels(labels)} {metric.value}"]
+
+    lines = []
+    cumulative = 0
+    for bound, count in zip(metric.buckets + ("+Inf",), metric.counts):
+        cumulative += count
+        lines.append(
+            f"{name}_bucket{_format_labels(labels, le=bound)} {cumulative}"
+        )
+    lines.append(f"{name}_sum{_format_labels(labels)} {metric.sum}")
+    lines.append(f"{name}_count{_format_labels(labels)} {metric.count}")
+    return lines
+
+
+metrics = MetricsRegistry()
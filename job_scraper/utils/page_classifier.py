@@ -0,0 +1,118 @@
+import json
+import re
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import PAGE_CLASSIFIER_CONFIG
+
+logger = setup_logger(__name__)
+
+STATIC = "static"  # 찾는 데이터가 HTML에 그대로 있음
+EMBEDDED_JSON = "embedded_json"  # HTML 안의 JSON (e.g. __NEXT_DATA__)에 있음
+DYNAMIC = "dynamic"  # 브라우저에서 렌더링해야 보임
+
+NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+JSON_SCRIPT_XPATH = (
+    "//script[@type='application/json' or @id='__NEXT_DATA__' "
+    "or contains(text(), '__INITIAL_STATE__')]"
+)
+
+
+def url_pattern(url: str) -> str:
+    """Host and path with numeric ids replaced, e.g. `host/wd/{id}`"""
+    parts = urlsplit(url)
+    return parts.netloc + NUMERIC_SEGMENT.sub("/{id}", parts.path)
+
+
+def embedded_json(content: str) -> Iterator[Any]:
+    """
+    Decode the JSON scripts of a page (`__NEXT_DATA__`, application/json
+    and `__INITIAL_STATE__` assignments).
+    """
+    from lxml import html as lxml_html  # api 모드에서는 필요 없으므로 여기서
+
+    tree = lxml_html.fromstring(content)
+    for script in tree.xpath(JSON_SCRIPT_XPATH):
+        text = script.text_content().strip()
+        if not text.startswith(("{", "[")):
+            # window.__INITIAL_STATE__ = {...}; 처럼 대입문 안에 있는 경우
+            text = text[text.find("{") : text.rfind("}") + 1]
+        try:
+            yield json.loads(text)
+        except ValueError as e:
+            logger.debug(f"Skipping a script that is not JSON: {e}")
+
+
+def find_json_objects(
+    data: Any, keys: Iterable[str]
+) -> Iterator[Dict[str, Any]]:
+    """Objects nested anywhere in `data` that have every key of `keys`"""
+    keys = tuple(keys)
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if all(key in value for key in keys):
+                yield value
+                continue
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+
+
+class PageClassifier:
+    """
+    Decide whether a page needs a browser, and remember the answer.
+
+    A page is static when the target elements are already in the HTML, and
+    embedded JSON when the target fields are inside a JSON script. Only when
+    neither holds is it dynamic. Results are cached per URL pattern for
+    `ttl` seconds, so later pages of the same kind skip the check (and, for
+    dynamic pages, the plain GET) entirely.
+    """
+
+    def __init__(self, ttl: float = None):
+        self.ttl = ttl or PAGE_CLASSIFIER_CONFIG["ttl"]
+        self._cache: Dict[str, Tuple[str, float]] = {}
+
+    def get(self, url: str) -> Optional[str]:
+        """Cached page kind of the URL pattern, if still valid"""
+        kind, expires = self._cache.get(url_pattern(url), (None, 0))
+        return kind if time.monotonic() < expires else None
+
+    def classify(
+        self, url: str, content: str, selector: str, json_keys: Iterable[str]
+    ) -> str:
+        """
+        Classify a fetched page and cache the result for its URL pattern.
+
+        Args:
+            url (str): URL of the page.
+            content (str): HTML returned by a plain GET.
+            selector (str): CSS selector of the target elements.
+            json_keys (Iterable[str]): Keys that must all appear in an
+                embedded JSON script for it to hold the target data.
+        """
+        from lxml import html as lxml_html  # api 모드에서는 필요 없으므로 여기서
+
+        kind = DYNAMIC
+        try:
+            tree = lxml_html.fromstring(content)
+            if tree.cssselect(selector):
+                kind = STATIC
+            elif any(
+                all(f'"{key}"' in script.text_content() for key in json_keys)
+                for script in tree.xpath(JSON_SCRIPT_XPATH)
+            ):
+                kind = EMBEDDED_JSON
+        except Exception as e:
+            logger.warning(f"Failed to classify {url}: {e}")
+
+        self._cache[url_pattern(url)] = (kind, time.monotonic() + self.ttl)
+        logger.info(f"Classified {url_pattern(url)} as {kind}")
+        return kind
+
+
+page_classifier = PageClassifier()
@@ -0,0 +1,257 @@
+import asyncio
+from contextlib import asynccontextmanager
+import sys
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import RATE_LIMIT_CONFIG
+
+logger = setup_logger(__name__)
+
+TIMEOUT_ERRORS = (
+    asyncio.TimeoutError,
+    httpx.TimeoutException,
+)
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Whether `error` is a request timeout (httpx, asyncio or Playwright)"""
+    if isinstance(error, TIMEOUT_ERRORS):
+        return True
+    # Playwright는 브라우저 모드에서만 import되므로, 로드된 경우에만 확인
+    playwright = sys.modules.get("playwright.async_api")
+    return playwright is not None and isinstance(error, playwright.TimeoutError)
+
+
+def is_congestion_status(status: int) -> bool:
+    """429 Too Many Requests와 5xx 응답은 서버 과부하 신호로 본다"""
+    return status == 429 or 500 <= status < 600
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더의 초 단위 값만 해석한다 (HTTP-date 형식은 무시)"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket that refills at `rate` tokens per second"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = None
+        self._paused_until = 0.0
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            self._refill(now)
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+            elif self._tokens >= 1:
+                self._tokens -= 1
+                return
+            else:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Hold every request for `seconds` (e.g. from Retry-After)"""
+        now = asyncio.get_running_loop().time()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0
+
+    def _refill(self, now: float):
+        if self._updated is not None:
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate,
+            )
+        self._updated = now
+
+
+class HostLimiter:
+    """
+    Pacing for a single host.
+
+    Requests are admitted by a token bucket and by an adaptive concurrency
+    limit. Healthy responses raise both the limit and the rate additively,
+    while 429/5xx responses and timeouts cut them multiplicatively (AIMD).
+    Cuts are spaced by `cooldown` seconds so a single burst of errors is
+    only counted once.
+    """
+
+    def __init__(self, host: str, config: Dict = None):
+        config = {**RATE_LIMIT_CONFIG, **(config or {})}
+        self.host = host
+        self.min_rate = config["min_rate"]
+        self.max_rate = config["max_rate"]
+        self.min_concurrency = config["min_concurrency"]
+        self.max_concurrency = config["max_concurrency"]
+        self.increase = config["increase"]
+        self.decrease = config["decrease"]
+        self.cooldown = config["cooldown"]
+
+        self.bucket = TokenBucket(config["rate"], config["burst"])
+        self.concurrency = float(config["concurrency"])
+        self.in_flight = 0
+        self.successes = 0
+        self.congestions = 0
+
+        self._condition = asyncio.Condition()
+        self._last_cut = None
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self.in_flight < int(self.concurrency)
+            )
+            self.in_flight += 1
+        try:
+            await self.bucket.acquire()
+        except BaseException:
+            await self.release()
+            raise
+
+    async def release(self):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self):
+        self.successes += 1
+        # 응답 하나마다 1/limit 씩 증가 -> limit 만큼 응답을 받으면 +increase
+        self.concurrency = min(
+            self.max_concurrency,
+            self.concurrency + self.increase / self.concurrency,
+        )
+        self.bucket.rate = min(
+            self.max_rate, self.bucket.rate + self.increase / self.bucket.rate
+        )
+
+    def on_congestion(self, retry_after: Optional[float] = None):
+        self.congestions += 1
+        if retry_after:
+            self.bucket.pause(retry_after)
+
+        now = asyncio.get_running_loop().time()
+        if self._last_cut is not None and now - self._last_cut < self.cooldown:
+            return
+        self._last_cut = now
+
+        self.concurrency = max(
+            self.min_concurrency, self.concurrency * self.decrease
+        )
+        self.bucket.rate = max(self.min_rate, self.bucket.rate * self.decrease)
+        logger.warning(
+            f"Throttling {self.host}: rate={self.rate:.2f}/s, "
+            f"concurrency={int(self.concurrency)}"
+        )
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "rate": round(self.rate, 3),
+            "concurrency": int(self.concurrency),
+            "in_flight": self.in_flight,
+            "successes": self.successes,
+            "congestions": self.congestions,
+        }
+
+
+class Permit:
+    """Handle yielded by `RateLimiter.limit` to report the response status"""
+
+    def __init__(self, host_limiter: HostLimiter):
+        self.host_limiter = host_limiter
+        self.observed = False
+
+    def observe(self, status: int, retry_after: Optional[str] = None):
+        self.observed = True
+        if is_congestion_status(status):
+            self.host_limiter.on_congestion(parse_retry_after(retry_after))
+        else:
+            self.host_limiter.on_success()
+
+
+class RateLimiter:
+    """
+    Per-host rate limiting shared by httpx requests and Playwright
+    navigations.
+
+    Usage:
+        async with rate_limiter.limit(url) as permit:
+            response = await page.goto(url)
+            permit.observe(response.status)
+    """
+
+    def __init__(self, config: Dict = None):
+        self.config = config
+        self._hosts: Dict[str, HostLimiter] = {}
+
+    def for_host(self, host: str) -> HostLimiter:
+        if host not in self._hosts:
+            self._hosts[host] = HostLimiter(host, self.config)
+        return self._hosts[host]
+
+    @asynccontextmanager
+    async def limit(self, url: str) -> AsyncIterator[Permit]:
+        host_limiter = self.for_host(urlsplit(url).netloc)
+        await host_limiter.acquire()
+        permit = Permit(host_limiter)
+        try:
+            yield permit
+        except Exception as e:
+            if is_timeout(e):
+                host_limiter.on_congestion()
+            raise
+        else:
+            if not permit.observed:
+                host_limiter.on_success()
+        finally:
+            await host_limiter.release()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Current rate and concurrency of every host"""
+        return {
+            host: limiter.stats() for host, limiter in self._hosts.items()
+        }
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that sends every request through a `RateLimiter`"""
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        transport: httpx.AsyncBaseTransport = None,
+        **transport_kwargs,
+    ):
+        self.rate_limiter = rate_limiter
+        self.transport = transport or httpx.AsyncHTTPTransport(
+            **transport_kwargs
+        )
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        async with self.rate_limiter.limit(str(request.url)) as permit:
+            response = await self.transport.handle_async_request(request)
+            permit.observe(
+                response.status_code, response.headers.get("Retry-After")
+            )
+            return response
+
+    async def aclose(self):
+        await self.transport.aclose()
@@ -0,0 +1,335 @@
+import asyncio
+import random
+import sys
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from job_scraper.config.logging_config import rate_limited
+from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import RESILIENCE_CONFIG
+from job_scraper.utils.metrics import metrics
+from job_scraper.utils.rate_limiter import is_congestion_status
+from job_scraper.utils.rate_limiter import is_timeout
+from job_scraper.utils.rate_limiter import parse_retry_after
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ScraperError(Exception):
+    """
+    Failure of a request, classified by whether it is worth retrying.
+
+    `status` is the HTTP status when the host did answer, and None when the
+    error happened before or after the response (e.g. a parsing bug).
+    """
+
+    kind = "error"
+    retryable = False
+
+    def __init__(self, message: str, url: str = None, status: int = None):
+        super().__init__(message)
+        self.url = url
+        self.status: Optional[int] = status
+
+
+class TransientError(ScraperError):
+    """Timeouts, dropped connections, 429 and 5xx: the host may recover"""
+
+    kind = "transient"
+    retryable = True
+
+    def __init__(
+        self,
+        message: str,
+        url: str = None,
+        retry_after: float = None,
+        status: int = None,
+    ):
+        super().__init__(message, url, status)
+        self.retry_after = retry_after
+
+
+class PermanentError(ScraperError):
+    """Other 4xx responses and unexpected content: retrying will not help"""
+
+    kind = "permanent"
+
+
+class CircuitOpenError(ScraperError):
+    """The host's circuit breaker is open, so the request was not sent"""
+
+    kind = "circuit_open"
+
+
+def classify(error: BaseException, url: str = None) -> ScraperError:
+    """Map an httpx, asyncio or Playwright exception to a `ScraperError`"""
+    if isinstance(error, ScraperError):
+        return error
+    if is_timeout(error):
+        return TransientError(f"Timed out: {error}", url)
+    if isinstance(error, httpx.HTTPStatusError):
+        response = error.response
+        if is_congestion_status(response.status_code):
+            return TransientError(
+                f"HTTP {response.status_code}",
+                url,
+                parse_retry_after(response.headers.get("retry-after")),
+                response.status_code,
+            )
+        return PermanentError(
+            f"HTTP {response.status_code}", url, response.status_code
+        )
+    if isinstance(error, (httpx.TransportError, ConnectionError)):
+        return TransientError(f"Connection failed: {error}", url)
+
+    # Playwright는 브라우저 모드에서만 import되므로, 로드된 경우에만 확인
+    playwright = sys.modules.get("playwright.async_api")
+    if (
+        playwright is not None
+        and isinstance(error, playwright.Error)
+        and "net::ERR_" in str(error)
+    ):
+        return TransientError(f"Navigation failed: {error}", url)
+    return PermanentError(f"{type(error).__name__}: {error}", url)
+
+
+def check_status(status: int, url: str, retry_after: str = None):
+    """
+    Raise for a failed browser navigation, like `raise_for_status` in httpx.
+
+    Raises:
+        TransientError: For 429 and 5xx responses.
+        PermanentError: For other 4xx responses.
+    """
+    if is_congestion_status(status):
+        raise TransientError(
+            f"HTTP {status}", url, parse_retry_after(retry_after), status
+        )
+    if status >= 400:
+        raise PermanentError(f"HTTP {status}", url, status)
+
+
+class RetryBudget:
+    """
+    Caps retries at `ratio` of the requests sent, plus `min_retries`.
+
+    While a host is failing, every request would otherwise be retried
+    `max_attempts` times and multiply the load on it. The budget lets a few
+    unlucky requests retry but stops retry storms.
+    """
+
+    def __init__(self, ratio: float, min_retries: int):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+
+    def record_request(self):
+        self.requests += 1
+
+    def try_spend(self) -> bool:
+        if self.retries >= self.min_retries + self.ratio * self.requests:
+            return False
+        self.retries += 1
+        return True
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a single host.
+
+    - closed: requests flow. `failure_threshold` transient failures in a row
+      open the circuit.
+    - open: requests fail at once with `CircuitOpenError` for
+      `reset_timeout` seconds.
+    - half_open: up to `half_open_probes` requests probe the host. A success
+      closes the circuit; a failure opens it again with a doubled timeout
+      (at most `max_reset_timeout`).
+    """
+
+    def __init__(self, host: str, config: Dict = None):
+        config = {**RESILIENCE_CONFIG, **(config or {})}
+        self.host = host
+        self.failure_threshold = config["failure_threshold"]
+        self.base_reset_timeout = config["reset_timeout"]
+        self.max_reset_timeout = config["max_reset_timeout"]
+        self.half_open_probes = config["half_open_probes"]
+
+        self.reset_timeout = self.base_reset_timeout
+        self.failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def before_call(self) -> bool:
+        """
+        Admit a request, returning whether it is a half-open probe.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or every probe slot of
+                the half-open circuit is taken.
+        """
+        state = self.state
+        if state == CLOSED:
+            return False
+        if state == HALF_OPEN and self._probes < self.half_open_probes:
+            self._probes += 1
+            return True
+        metrics.counter(
+            "circuit_rejections_total",
+            "Requests refused by an open circuit",
+            host=self.host,
+        ).inc()
+        raise CircuitOpenError(f"Circuit open for {self.host}")
+
+    def end_probe(self):
+        self._probes = max(0, self._probes - 1)
+
+    def on_success(self):
+        self.failures = 0
+        if self._state != CLOSED:
+            self._state = CLOSED
+            self.reset_timeout = self.base_reset_timeout
+            self._set_gauge()
+            logger.info(f"Circuit closed for {self.host}")
+
+    def on_failure(self):
+        self.failures += 1
+        if self._state == HALF_OPEN:
+            self.reset_timeout = min(
+                self.max_reset_timeout, self.reset_timeout * 2
+            )
+            self._open()
+        elif self._state == CLOSED and self.failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self):
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._set_gauge()
+        logger.warning(
+            f"Circuit opened for {self.host} after {self.failures} failures, "
+            f"probing again in {self.reset_timeout:.0f}s"
+        )
+
+    def _set_gauge(self):
+        metrics.gauge(
+            "circuit_open", "1 while the host's circuit is open", host=self.host
+        ).set(int(self._state != CLOSED))
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "reset_timeout": self.reset_timeout,
+        }
+
+
+class Resilience:
+    """
+    Retries and per-host circuit breakers shared by the scrapers of a run.
+
+    Transient errors are retried with full-jitter exponential backoff
+    (honouring Retry-After) while the shared retry budget allows. Every
+    request goes through the circuit breaker of its host, so a host that
+    keeps failing is skipped quickly instead of timing out on every page.
+
+    Usage:
+        html = await resilience.call(url, lambda: fetch(url))
+    """
+
+    def __init__(self, config: Dict = None):
+        self.config = {**RESILIENCE_CONFIG, **(config or {})}
+        self.max_attempts = self.config["max_attempts"]
+        self.base_delay = self.config["base_delay"]
+        self.max_delay = self.config["max_delay"]
+        self.budget = RetryBudget(
+            self.config["retry_budget_ratio"], self.config["retry_budget_min"]
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(host, self.config)
+        return self._breakers[host]
+
+    def backoff(self, attempt: int, retry_after: float = None) -> float:
+        """Delay before retry number `attempt` (1-based), in seconds"""
+        delay = random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+        return max(delay, min(retry_after or 0.0, self.max_delay))
+
+    async def call(self, url: str, request: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `request` for `url` with retries behind the host's breaker.
+
+        Raises:
+            ScraperError: The classified error of the last attempt.
+        """
+        host = urlsplit(url).netloc
+        breaker = self.breaker(host)
+        self.budget.record_request()
+
+        for attempt in range(1, self.max_attempts + 1):
+            probe = breaker.before_call()
+            try:
+                result = await request()
+            except Exception as e:
+                error = classify(e, url)
+                if not error.retryable:
+                    # 4xx 응답을 받았다면 host 자체는 정상으로 본다. 응답과
+                    # 무관한 오류(파싱 버그 등)는 breaker에 반영하지 않는다
+                    if error.status is not None:
+                        breaker.on_success()
+                    raise error from e
+                breaker.on_failure()
+                if attempt == self.max_attempts or not self.budget.try_spend():
+                    raise error from e
+
+                delay = self.backoff(attempt, error.retry_after)
+                metrics.counter(
+                    "retries_total", "Retried requests", host=host
+                ).inc()
+                logger.debug(
+                    f"Retrying {url} in {delay:.2f}s "
+                    f"(attempt {attempt}/{self.max_attempts}): {error}",
+                    extra=rate_limited("retry"),
+                )
+                await asyncio.sleep(delay)
+            else:
+                breaker.on_success()
+                return result
+            finally:
+                if probe:
+                    breaker.end_probe()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Circuit state of every host and the retry budget use"""
+        return {
+            "breakers": {
+                host: breaker.stats()
+                for host, breaker in self._breakers.items()
+            },
+            "retries": self.budget.retries,
+            "requests": self.budget.requests,
+        }
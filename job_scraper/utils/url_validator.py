@@ -1,6 +1,12 @@
-import requests
+import asyncio
+import time
+from typing import Dict, Iterable, Optional, Tuple
 from urllib.parse import urlparse
+
+import httpx
+
 from job_scraper.config.logging_config import setup_logger
+from job_scraper.config.settings import URL_VALIDATION_CONFIG
 
 logger= setup_logger(__name__)
 
@@ -15,6 +21,8 @@ def is_https_url(url):
 
 def can_parse_url(url):
     """파싱이 가능한 url인가 판단하는 함수 🛠️개선 필요"""
+    import requests  # 동기 검사에서만 사용하므로 필요할 때 import
+
     try:
         response = requests.head(url, timeout=5, allow_redirects=True)
         if 200 <= response.status_code < 400:
@@ -52,8 +60,112 @@ def is_valid_url(url):
         return False
     normalized_url = normalize_url(url)
     if is_https_url(normalized_url):
-        logger.info(f"Valid URL: {url}")
+        logger.debug(f"Valid URL: {url}")
         return can_parse_url(normalized_url)
     else:
         logger.error(f"Invalid URL: {url}")
         return False
+
+
+class ReachabilityCache:
+    """
+    TTL cache of reachability results.
+
+    Results are kept per URL. A host that could not be reached at all is
+    also remembered, so other URLs on the same host fail fast. Failures are
+    only kept for `negative_ttl` seconds, so one dropped connection does not
+    block the host for the whole `ttl`.
+    """
+
+    def __init__(self, ttl: float = None, negative_ttl: float = None):
+        self.ttl = ttl or URL_VALIDATION_CONFIG["ttl"]
+        self.negative_ttl = (
+            negative_ttl or URL_VALIDATION_CONFIG["negative_ttl"]
+        )
+        self._urls: Dict[str, Tuple[bool, float]] = {}
+        self._unreachable_hosts: Dict[str, float] = {}
+
+    def get(self, url: str) -> Optional[bool]:
+        now = time.monotonic()
+        host = urlparse(url).netloc
+        if now < self._unreachable_hosts.get(host, 0):
+            return False
+
+        reachable, expires = self._urls.get(url, (None, 0))
+        return reachable if now < expires else None
+
+    def set(self, url: str, reachable: bool, host_down: bool = False):
+        expires = time.monotonic() + (
+            self.ttl if reachable else self.negative_ttl
+        )
+        self._urls[url] = (reachable, expires)
+        if host_down:
+            self._unreachable_hosts[urlparse(url).netloc] = expires
+
+
+reachability_cache = ReachabilityCache()
+
+
+async def can_parse_url_async(
+    url: str,
+    client: httpx.AsyncClient,
+    cache: ReachabilityCache = reachability_cache,
+) -> bool:
+    """`can_parse_url`과 같지만 event loop를 막지 않고 결과를 캐시하는 함수"""
+    cached = cache.get(url)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await client.head(
+            url,
+            timeout=URL_VALIDATION_CONFIG["timeout"],
+            follow_redirects=True,
+        )
+    except httpx.RequestError as e:
+        logger.warning(f"요청 실패: {e}")
+        cache.set(url, False, host_down=True)
+        return False
+
+    reachable = 200 <= response.status_code < 400
+    cache.set(url, reachable)
+    return reachable
+
+
+async def is_valid_url_async(
+    url: str,
+    client: httpx.AsyncClient = None,
+    cache: ReachabilityCache = reachability_cache,
+) -> bool:
+    """`is_valid_url`의 비동기 버전 (shared client 사용)"""
+    if not is_valid_protocol(url):
+        logger.info("Invalid URL protocol")
+        return False
+    normalized_url = normalize_url(url)
+    if not is_https_url(normalized_url):
+        logger.error(f"Invalid URL: {url}")
+        return False
+
+    logger.debug(f"Valid URL: {url}")
+    if client is not None:
+        return await can_parse_url_async(normalized_url, client, cache)
+    async with httpx.AsyncClient() as client:
+        return await can_parse_url_async(normalized_url, client, cache)
+
+
+async def validate_urls(
+    urls: Iterable[str],
+    client: httpx.AsyncClient,
+    concurrency: int = None,
+    cache: ReachabilityCache = reachability_cache,
+) -> Dict[str, bool]:
+    """여러 URL을 최대 `concurrency`개씩 동시에 검증하는 함수"""
+    semaphore = asyncio.Semaphore(
+        concurrency or URL_VALIDATION_CONFIG["concurrency"]
+    )
+
+    async def validate(url):
+        async with semaphore:
+            return url, await is_valid_url_async(url, client, cache)
+
+    return dict(await asyncio.gather(*(validate(url) for url in set(urls))))
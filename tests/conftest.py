@@ -0,0 +1,123 @@
+from contextlib import asynccontextmanager
+import os
+from typing import AsyncIterator
+
+import pytest
+
+from job_scraper.config import settings
+from job_scraper.scrapers.browser_pool import BrowserPool
+
+
+@pytest.fixture(autouse=True)
+def isolated_storage(monkeypatch, tmp_path):
+    """Keep every store of the crawl in a temporary directory"""
+    monkeypatch.setitem(settings.CRAWL_STATE_CONFIG, "enabled", False)
+    monkeypatch.setitem(settings.HTTP_CACHE_CONFIG, "enabled", False)
+    monkeypatch.setitem(settings.METRICS_CONFIG, "enabled", False)
+    monkeypatch.setitem(
+        settings.WORK_QUEUE_CONFIG, "path", str(tmp_path / "work_queue.db")
+    )
+    monkeypatch.setitem(
+        settings.PERSISTENCE_CONFIG,
+        "url",
+        f"sqlite:///{tmp_path / 'job_scraper.db'}",
+    )
+    monkeypatch.setitem(
+        settings.EXPORT_CONFIG, "directory", str(tmp_path / "output")
+    )
+
+
+@asynccontextmanager
+async def browser_page() -> AsyncIterator:
+    """Chromium page, or skip the test when no browser is installed"""
+    playwright_api = pytest.importorskip("playwright.async_api")
+    async with playwright_api.async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch()
+        except playwright_api.Error as e:
+            pytest.skip(f"Chromium is not available: {e}")
+        try:
+            yield await browser.new_page()
+        finally:
+            await browser.close()
+
+
+@pytest.fixture(scope="session")
+def chromium():
+    """Skip the test when Playwright's Chromium is not installed"""
+    playwright_api = pytest.importorskip("playwright.sync_api")
+    with playwright_api.sync_playwright() as playwright:
+        if not os.path.exists(playwright.chromium.executable_path):
+            pytest.skip("Chromium is not available")
+
+
+class FakeLocator:
+    async def click(self, **kwargs):
+        pass
+
+    async def count(self) -> int:
+        return 3
+
+
+class FakePage:
+    """Page that only records what the pool and scraper do with it"""
+
+    def __init__(self, context: "FakeContext"):
+        self.context = context
+        self.main_frame = object()
+        self.closed = False
+        self._handlers = []
+
+    def on(self, event, handler):
+        if event == "framenavigated":
+            self._handlers.append(handler)
+
+    async def goto(self, url, **kwargs):
+        for handler in self._handlers:
+            handler(self.main_frame)
+
+    async def evaluate(self, expression, arg=None):
+        return None
+
+    def locator(self, selector) -> FakeLocator:
+        return FakeLocator()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    async def route(self, url, handler):
+        pass
+
+    async def new_page(self) -> FakePage:
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **options) -> FakeContext:
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        pass
+
+
+def fake_browser_pool(**kwargs) -> BrowserPool:
+    """BrowserPool whose pages are `FakePage`s, so no Chromium is needed"""
+    pool = BrowserPool(**kwargs)
+    pool._browser = FakeBrowser()  # start()가 Chromium을 띄우지 않음
+    return pool
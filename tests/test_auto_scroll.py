@@ -0,0 +1,68 @@
+import asyncio
+
+from job_scraper.scrapers.wanted_scraper import CARD_SELECTOR
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+from tests.conftest import browser_page
+
+LIST_URL = "https://www.wanted.co.kr/wdlist/518/899"
+CARD_CLASS = CARD_SELECTOR.split(".", 1)[1]
+
+# 스크롤할 때마다 100ms 뒤에 카드 5개를 더 붙이는 무한 스크롤 목록 (최대 15개)
+LIST_PAGE = f"""
+<html><body>
+<style>li {{ height: 600px; }}</style>
+<ul id="cards"></ul>
+<script>
+const addCards = (count) => {{
+    const list = document.getElementById("cards");
+    for (let i = 0; i < count; i++) {{
+        const card = document.createElement("li");
+        card.className = "{CARD_CLASS}";
+        list.appendChild(card);
+    }}
+}};
+addCards(5);
+window.addEventListener("scroll", () => {{
+    if (document.querySelectorAll("li").length < 15) {{
+        setTimeout(() => addCards(5), 100);
+    }}
+}});
+</script>
+</body></html>
+"""
+
+
+async def open_list(page):
+    async def fulfill(route):
+        await route.fulfill(body=LIST_PAGE, content_type="text/html")
+
+    await page.route(LIST_URL, fulfill)
+    await page.goto(LIST_URL)
+
+
+def test_auto_scroll_waits_for_cards_added_after_scrolling():
+    async def scenario():
+        async with browser_page() as page:
+            await open_list(page)
+            scraper = WantedScraper(899, LIST_URL)
+            counts = []
+
+            async def callback(page):
+                counts.append(await page.locator(CARD_SELECTOR).count())
+
+            await scraper.auto_scroll(
+                page, idle_timeout=1, max_duration=10, callback=callback
+            )
+            return counts
+
+    assert asyncio.run(scenario()) == [5, 10, 15]
+
+
+def test_wait_for_more_cards_returns_none_when_the_list_stops_growing():
+    async def scenario():
+        async with browser_page() as page:
+            await open_list(page)
+            scraper = WantedScraper(899, LIST_URL)
+            return await scraper._wait_for_more_cards(page, 5, 0.3)
+
+    assert asyncio.run(scenario()) is None
@@ -0,0 +1,66 @@
+import asyncio
+import os
+
+import pytest
+
+from job_scraper import benchmarks
+from job_scraper.benchmarks import BenchmarkScraper
+from job_scraper.utils.fixtures import FixtureBundle
+from job_scraper.utils.fixtures import REPLAY
+from job_scraper.utils.http_client import create_client
+
+BUNDLE = FixtureBundle(
+    os.path.join(os.path.dirname(__file__), "fixtures", "wanted")
+)
+POSTINGS = ["/wd/1001", "/wd/1002", "/wd/1003"]
+
+
+@pytest.fixture(autouse=True)
+def list_url(monkeypatch):
+    monkeypatch.setenv(
+        "WantedScraper", "https://www.wanted.co.kr/wdlist/518/{job_id}"
+    )
+
+
+def test_phases_are_wall_clock_spans():
+    scraper = BenchmarkScraper("10231", "https://www.wanted.co.kr/wdlist")
+
+    async def worker():
+        async with scraper.timed("details"):
+            await asyncio.sleep(0.1)
+
+    async def scenario():
+        await asyncio.gather(*(worker() for _ in range(4)))
+
+    asyncio.run(scenario())
+    phases = scraper.phases()
+    # 4개의 worker가 동시에 0.1초씩 -> 합인 0.4초가 아니라 약 0.1초
+    assert 0.1 <= phases["details"] < 0.2
+    assert phases["save"] == 0.0
+
+
+def test_listing_is_replayed_from_the_bundle():
+    meta = BUNDLE.load_meta()
+
+    async def scenario():
+        async with create_client(transport=BUNDLE.transport(REPLAY)) as session:
+            scraper = await BenchmarkScraper.create(
+                meta["job"], params=meta["params"], session=session
+            )
+            assert scraper is not None
+            await scraper._fetch_api(session)
+            return scraper
+
+    scraper = asyncio.run(scenario())
+    queued = []
+    while not scraper.work_queue.empty():
+        queued.extend(scraper.work_queue.get_nowait())
+    assert queued == POSTINGS
+
+
+def test_crawl_replays_the_bundle(chromium):
+    report = asyncio.run(benchmarks.run(BUNDLE, repeat=1))
+
+    (result,) = report["runs"]
+    assert result["postings"] == len(POSTINGS)
+    assert set(result["phase_seconds"]) == {"list", "details", "save"}
@@ -0,0 +1,68 @@
+import asyncio
+
+from tests.conftest import fake_browser_pool
+
+
+def test_round_trips_count_browser_calls_of_leased_pages():
+    pool = fake_browser_pool()
+
+    async def scenario():
+        async with pool.page() as page:
+            await page.goto("https://www.wanted.co.kr/wd/1")
+            await page.evaluate("() => 1")
+            assert await page.locator("li").count() == 3
+            await page.locator("button").click(timeout=100)
+        await pool.close()
+
+    assert pool.round_trips() == 0
+    asyncio.run(scenario())
+    assert pool.round_trips() == 4
+
+
+def test_leases_share_one_context_and_close_their_pages():
+    pool = fake_browser_pool(max_pages=2)
+    leased = []
+    active = [0, 0]  # 현재, 최대
+
+    async def lease():
+        async with pool.page() as page:
+            leased.append(page)
+            active[0] += 1
+            active[1] = max(active)
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+
+    async def scenario():
+        await asyncio.gather(*(lease() for _ in range(4)))
+        browser = pool._browser
+        await pool.close()
+        return browser
+
+    browser = asyncio.run(scenario())
+    assert len(browser.contexts) == 1
+    assert len(leased) == 4
+    assert active[1] == 2
+    assert all(page.closed for page in leased)
+    assert browser.contexts[0].closed
+
+
+def test_context_is_recycled_after_max_navigations():
+    pool = fake_browser_pool(max_navigations_per_context=2)
+
+    async def scenario():
+        async with pool.page() as page:
+            await page.goto("https://www.wanted.co.kr/wd/1")
+            assert not pool.is_exhausted(page)
+            await page.goto("https://www.wanted.co.kr/wd/2")
+            assert pool.is_exhausted(page)
+            first = page.context
+            # 아직 빌려준 페이지가 있으므로 닫지 않는다
+            async with pool.page() as second:
+                assert second.context is not first
+                assert not first.closed
+        assert first.closed
+        assert not second.context.closed
+        await pool.close()
+        assert second.context.closed
+
+    asyncio.run(scenario())
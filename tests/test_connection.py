@@ -0,0 +1,41 @@
+import pytest
+
+from job_scraper.config import settings
+from job_scraper.storage.crawl_state import CrawlStateStore
+from job_scraper.storage.database import DatabaseSink
+from job_scraper.storage.work_queue import DurableWorkQueue
+from job_scraper.utils.http_cache import HttpCache
+
+
+def pragmas(connection):
+    return (
+        connection.execute("PRAGMA journal_mode").fetchone()[0],
+        connection.execute("PRAGMA busy_timeout").fetchone()[0],
+    )
+
+
+def engine_pragmas(engine):
+    with engine.connect() as connection:
+        return pragmas(connection.connection.dbapi_connection)
+
+
+@pytest.mark.parametrize(
+    "open_store, read_pragmas",
+    [
+        (
+            lambda path: CrawlStateStore(f"sqlite:///{path}"),
+            lambda store: engine_pragmas(store.engine),
+        ),
+        (
+            lambda path: DatabaseSink(f"sqlite:///{path}"),
+            lambda store: engine_pragmas(store.engine),
+        ),
+        (DurableWorkQueue, lambda store: pragmas(store._connection)),
+        (HttpCache, lambda store: pragmas(store._connection)),
+    ],
+    ids=["crawl_state", "database", "work_queue", "http_cache"],
+)
+def test_stores_share_files_in_wal_mode(tmp_path, open_store, read_pragmas):
+    store = open_store(tmp_path / "store.db")
+    busy_timeout_ms = settings.SQLITE_CONFIG["busy_timeout"] * 1000
+    assert read_pragmas(store) == ("wal", busy_timeout_ms)
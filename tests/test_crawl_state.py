@@ -0,0 +1,79 @@
+import asyncio
+
+from job_scraper.config import settings
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+from job_scraper.storage.crawl_state import CrawlStateStore
+
+DETAILS = {"주요업무": "...", "게시일": "2026.01.01"}
+
+
+def card(position):
+    return {"posting_id": "1", "position": position, "company": "원티드"}
+
+
+def test_listing_hash_is_stored_only_after_a_fetch(tmp_path):
+    store = CrawlStateStore(f"sqlite:///{tmp_path / 'crawl_state.db'}")
+
+    async def scenario():
+        assert await store.should_fetch(card("DBA"))
+        await store.mark_fetched(card("DBA"), DETAILS)
+        assert not await store.should_fetch(card("DBA"))
+
+        # 카드가 바뀌었지만 상세 수집이 실패하면 다음 실행에서 다시 가져온다
+        assert await store.should_fetch(card("Senior DBA"))
+        assert await store.should_fetch(card("Senior DBA"))
+        await store.mark_fetched(card("Senior DBA"), DETAILS)
+        assert not await store.should_fetch(card("Senior DBA"))
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        store.close()
+    assert store.skipped == 2
+
+
+class FlakyCrawlState:
+    """Crawl state whose database fails for one posting"""
+
+    skipped = 0
+
+    async def should_fetch(self, metadata):
+        if metadata["posting_id"] == "2":
+            raise OSError("database is locked")
+        return True
+
+    async def mark_fetched(self, metadata, job_details):
+        pass
+
+
+class DetailScraper(WantedScraper):
+    async def _fetch_job_detail_page(self, page, job_url, metadata):
+        metadata["job_details"] = DETAILS
+
+
+def test_state_errors_fail_only_their_posting():
+    scraper = DetailScraper(
+        "DBA", "https://www.wanted.co.kr/wdlist", crawl_state=FlakyCrawlState()
+    )
+    saved = []
+
+    async def save(data):
+        saved.extend(metadata["posting_id"] for metadata in data.values())
+
+    scraper.save = save
+    job_data = {
+        f"/wd/{posting_id}": {"posting_id": posting_id}
+        for posting_id in ("1", "2", "3")
+    }
+
+    asyncio.run(scraper._fetch_job_detail(None, job_data))
+    assert saved == ["1", "3"]
+
+
+def test_scraper_does_not_open_a_store_of_its_own(monkeypatch, tmp_path):
+    monkeypatch.setitem(settings.CRAWL_STATE_CONFIG, "enabled", True)
+    monkeypatch.chdir(tmp_path)
+
+    scraper = WantedScraper("DBA", "https://www.wanted.co.kr/wdlist")
+    assert scraper.crawl_state is None
+    assert not list(tmp_path.iterdir())
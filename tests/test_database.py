@@ -0,0 +1,71 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from job_scraper.storage.database import DatabaseSink
+from job_scraper.storage.models import JobDetail
+from job_scraper.storage.models import JobPosting
+from job_scraper.storage.models import PostingQuery
+
+
+def record(posting_id, query="DBA", **extra):
+    return {
+        "href": f"/wd/{posting_id}",
+        "posting_id": posting_id,
+        "position": "DBA",
+        "job_id": 10231,
+        "query": query,
+        "scraped_at": datetime(2026, 1, 1),
+        **extra,
+    }
+
+
+def rows(sink, model):
+    with sink.engine.connect() as connection:
+        return connection.execute(select(model)).all()
+
+
+@pytest.fixture
+def sink(tmp_path):
+    return DatabaseSink(
+        f"sqlite:///{tmp_path / 'job_scraper.db'}", batch_size=100
+    )
+
+
+def test_records_are_upserted_per_table(sink):
+    async def scenario():
+        await sink.put_record(record("1"))
+        await sink.put_record(record("1", query="데이터 엔지니어"))
+        await sink.put_record(record("1", job_details={"게시일": "2026.01.01"}))
+        await sink.close()
+
+    asyncio.run(scenario())
+    assert len(rows(sink, JobPosting)) == 1
+    assert len(rows(sink, PostingQuery)) == 2
+    (detail,) = rows(sink, JobDetail)
+    assert detail.date_posted == "2026.01.01"
+
+
+def test_failed_write_keeps_the_batch(sink, monkeypatch):
+    write = sink._write
+
+    def fail(batches):
+        raise OSError("database is locked")
+
+    async def scenario():
+        await sink.put_record(record("1"))
+        monkeypatch.setattr(sink, "_write", fail)
+        with pytest.raises(OSError):
+            await sink.flush()
+
+        monkeypatch.setattr(sink, "_write", write)
+        await sink.put_record(record("2"))
+        await sink.close()
+
+    asyncio.run(scenario())
+    assert sorted(row.posting_id for row in rows(sink, JobPosting)) == [
+        "1",
+        "2",
+    ]
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+from job_scraper.utils.resilience import CLOSED
+from job_scraper.utils.resilience import Resilience
+
+playwright = pytest.importorskip("playwright.async_api")
+
+HOST = "www.wanted.co.kr"
+
+
+class FakeResponse:
+    def __init__(self, status: int):
+        self.status = status
+        self.headers = {}
+
+
+class FakeLocator:
+    def __init__(self, page):
+        self.page = page
+
+    async def click(self, timeout: float = None):
+        self.page.click_timeouts.append(timeout)
+        raise playwright.TimeoutError(f"Timeout {timeout}ms exceeded")
+
+
+class FakePage:
+    """Detail page whose "상세 정보 더 보기" button never shows up"""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.gotos = 0
+        self.click_timeouts = []
+
+    async def goto(self, url, timeout=None):
+        self.gotos += 1
+        return FakeResponse(self.statuses.pop(0))
+
+    def locator(self, selector):
+        return FakeLocator(self)
+
+
+def make_scraper(resilience):
+    return WantedScraper(
+        "DBA", "https://www.wanted.co.kr/wdlist", resilience=resilience
+    )
+
+
+def metadata(posting_id):
+    return {"posting_id": posting_id, "href": f"/wd/{posting_id}"}
+
+
+def test_missing_expand_button_does_not_open_circuit():
+    resilience = Resilience({"failure_threshold": 2, "base_delay": 0})
+    scraper = make_scraper(resilience)
+    page = FakePage([200] * 5)
+
+    async def scenario():
+        for posting_id in map(str, range(5)):
+            await scraper._fetch_job_detail(
+                page, {f"/wd/{posting_id}": metadata(posting_id)}
+            )
+
+    asyncio.run(scenario())
+    # 버튼이 없어도 한 번씩만 이동하고, 짧은 timeout으로 기다린다
+    assert page.gotos == 5
+    assert all(timeout <= 5000 for timeout in page.click_timeouts)
+    assert resilience.breaker(HOST).state == CLOSED
+    assert resilience.budget.retries == 0
+
+
+def test_navigation_errors_are_retried():
+    resilience = Resilience({"base_delay": 0})
+    scraper = make_scraper(resilience)
+    page = FakePage([503, 200])
+
+    asyncio.run(scraper._fetch_job_detail(page, {"/wd/1": metadata("1")}))
+    assert page.gotos == 2
+    assert resilience.budget.retries == 1
+    assert resilience.breaker(HOST).state == CLOSED
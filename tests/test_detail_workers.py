@@ -0,0 +1,83 @@
+import asyncio
+
+from job_scraper.config import settings
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+from tests.conftest import fake_browser_pool
+
+
+def posting(posting_id):
+    return {f"/wd/{posting_id}": {"posting_id": posting_id}}
+
+
+class DetailScraper(WantedScraper):
+    """Scraper whose detail pages only navigate the leased fake page"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fetched = {}  # posting_id -> asyncio.Event
+        self.pages = set()
+        self.saved = []
+
+    def fetched_event(self, posting_id) -> asyncio.Event:
+        return self.fetched.setdefault(posting_id, asyncio.Event())
+
+    async def _fetch_job_detail_page(self, page, job_url, metadata):
+        await page.goto(job_url)
+        self.pages.add(page)
+        metadata["job_details"] = {"주요업무": "..."}
+        self.fetched_event(metadata["posting_id"]).set()
+
+    async def save(self, data):
+        self.saved.extend(metadata["posting_id"] for metadata in data.values())
+
+
+def make_scraper(**pool_options) -> DetailScraper:
+    return DetailScraper(
+        "DBA",
+        "https://www.wanted.co.kr/wdlist",
+        browser_pool=fake_browser_pool(**pool_options),
+    )
+
+
+def test_details_are_fetched_while_the_listing_scrolls(monkeypatch):
+    monkeypatch.setitem(settings.DETAIL_CONFIG, "overlap_scroll", True)
+    monkeypatch.setitem(settings.DETAIL_CONFIG, "workers", 2)
+    scraper = make_scraper()
+
+    async def scroll():
+        for posting_id in ("1", "2", "3"):
+            await scraper.enqueue_posting(posting(posting_id))
+            # 다음 "스크롤" 전에 worker가 이미 상세 페이지를 가져갔어야 한다
+            await asyncio.wait_for(
+                scraper.fetched_event(posting_id).wait(), timeout=1
+            )
+
+    async def scenario():
+        await scraper._crawl(scroll)
+        await scraper.browser_pool.close()
+
+    asyncio.run(scenario())
+    assert sorted(scraper.saved) == ["1", "2", "3"]
+    # 큐가 비면 worker는 페이지를 반납한다
+    assert all(page.closed for page in scraper.pages)
+
+
+def test_worker_releases_its_page_when_the_context_is_exhausted(monkeypatch):
+    monkeypatch.setitem(settings.DETAIL_CONFIG, "overlap_scroll", False)
+    scraper = make_scraper(max_navigations_per_context=2)
+
+    async def listing():
+        for posting_id in ("1", "2", "3", "4", "5"):
+            await scraper.enqueue_posting(posting(posting_id))
+
+    async def scenario():
+        await scraper._crawl(listing)
+        browser = scraper.browser_pool._browser
+        await scraper.browser_pool.close()
+        return browser
+
+    browser = asyncio.run(scenario())
+    assert sorted(scraper.saved) == ["1", "2", "3", "4", "5"]
+    # 2번 이동할 때마다 새 context의 새 페이지
+    assert len(browser.contexts) == 3
+    assert all(context.closed for context in browser.contexts)
@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime
+import json
+
+import pytest
+
+from job_scraper.storage.exporter import StreamExporter
+
+
+def record(posting_id, **extra):
+    return {
+        "href": f"/wd/{posting_id}",
+        "posting_id": posting_id,
+        "job_id": 10231,
+        "scraped_at": datetime(2026, 1, 1),
+        **extra,
+    }
+
+
+def test_jsonl_export(tmp_path):
+    async def scenario():
+        async with StreamExporter(tmp_path, "jsonl", batch_size=2) as exporter:
+            for posting_id in map(str, range(5)):
+                await exporter.put(record(posting_id))
+        return exporter
+
+    exporter = asyncio.run(scenario())
+    (path,) = exporter.files
+    with open(path, encoding="utf-8") as file:
+        rows = [json.loads(line) for line in file]
+    assert [row["posting_id"] for row in rows] == list("01234")
+    assert rows[0]["scraped_at"] == "2026-01-01T00:00:00"
+
+
+def test_dead_writer_does_not_block_producers(tmp_path):
+    async def scenario():
+        exporter = StreamExporter(
+            tmp_path, "jsonl", queue_size=1, batch_size=1
+        )
+        await exporter.start()
+        # json으로 바꿀 수 없는 값이 writer를 멈춘다
+        await exporter.put(record("0", job_details=object()))
+        with pytest.raises(TypeError):
+            for posting_id in map(str, range(1, 10)):
+                await asyncio.wait_for(exporter.put(record(posting_id)), 2)
+        with pytest.raises(TypeError):
+            await asyncio.wait_for(exporter.close(), 2)
+
+    asyncio.run(scenario())
+
+
+def test_parquet_schema_keeps_later_columns(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    async def scenario():
+        async with StreamExporter(
+            tmp_path, "parquet", batch_size=1
+        ) as exporter:
+            await exporter.put(record("1"))
+            await asyncio.sleep(0.1)  # 첫 batch에는 job_details가 없다
+            await exporter.put(record("2", job_details={"본문": "..."}))
+        return exporter
+
+    exporter = asyncio.run(scenario())
+    (path,) = exporter.files
+    rows = pq.read_table(path).to_pylist()
+    assert rows[0]["job_details"] is None
+    assert json.loads(rows[1]["job_details"]) == {"본문": "..."}
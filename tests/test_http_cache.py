@@ -0,0 +1,139 @@
+import asyncio
+import sqlite3
+
+import httpx
+import pytest
+
+from job_scraper.config import settings
+from job_scraper.utils import http_cache
+from job_scraper.utils.http_cache import CachingTransport
+from job_scraper.utils.http_cache import HttpCache
+
+API_URL = "https://www.wanted.co.kr/api/chaos/navigation/v1/results"
+DETAIL_URL = "https://www.wanted.co.kr/wd/1"
+TTLS = {"*/api/chaos/navigation/*": 600}
+
+
+class Origin:
+    """Mock server that records the requests reaching the network"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HttpCache(str(tmp_path / "http_cache.db"))
+    yield cache
+    cache.close()
+
+
+def get_all(transport, *urls):
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return [await client.get(url) for url in urls]
+
+    return asyncio.run(scenario())
+
+
+def test_fresh_entry_is_served_without_the_network(cache):
+    origin = Origin(httpx.Response(200, json={"data": [1]}))
+    transport = CachingTransport(
+        httpx.MockTransport(origin), cache=cache, ttls=TTLS, default_ttl=0
+    )
+
+    first, second = get_all(transport, API_URL, API_URL)
+    assert first.json() == second.json() == {"data": [1]}
+    assert len(origin.requests) == 1
+    assert transport.stats() == {"hits": 1, "misses": 1, "revalidated": 0}
+
+
+def test_stale_entry_is_revalidated(cache):
+    validators = {
+        "ETag": '"v1"',
+        "Last-Modified": "Thu, 01 Jan 2026 00:00:00 GMT",
+    }
+    origin = Origin(
+        httpx.Response(200, text="<html>공고</html>", headers=validators),
+        httpx.Response(304),
+    )
+    # 상세 페이지는 TTL pattern에 없으므로 default_ttl(0) -> 매번 재검증
+    transport = CachingTransport(
+        httpx.MockTransport(origin), cache=cache, ttls=TTLS, default_ttl=0
+    )
+
+    _, second = get_all(transport, DETAIL_URL, DETAIL_URL)
+    assert second.status_code == 200
+    assert second.text == "<html>공고</html>"
+    revalidation = origin.requests[1]
+    assert revalidation.headers["If-None-Match"] == '"v1"'
+    assert revalidation.headers["If-Modified-Since"] == (
+        validators["Last-Modified"]
+    )
+    assert transport.revalidated == 1
+
+
+def test_no_store_responses_are_not_cached(cache):
+    origin = Origin(
+        httpx.Response(200, text="a", headers={"Cache-Control": "no-store"}),
+        httpx.Response(200, text="b"),
+    )
+    transport = CachingTransport(
+        httpx.MockTransport(origin), cache=cache, ttls=TTLS
+    )
+
+    first, second = get_all(transport, API_URL, API_URL)
+    assert (first.text, second.text) == ("a", "b")
+    assert cache.get(API_URL) is not None  # 두 번째 응답만 저장된다
+
+
+def test_offline_misses_get_504(cache):
+    origin = Origin(httpx.Response(200, text="cached"))
+    online = CachingTransport(httpx.MockTransport(origin), cache=cache)
+    get_all(online, DETAIL_URL)
+
+    offline = CachingTransport(
+        httpx.MockTransport(origin), cache=cache, offline=True
+    )
+    hit, miss = get_all(offline, DETAIL_URL, API_URL)
+    assert (hit.status_code, hit.text) == (200, "cached")
+    assert miss.status_code == 504
+    assert len(origin.requests) == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(http_cache.time, "time", lambda: next(clock))
+    cache = HttpCache(str(tmp_path / "http_cache.db"), max_bytes=10)
+    response = httpx.Response(200)
+
+    cache.put("a", response, b"1234")
+    cache.put("b", response, b"1234")
+    cache.get("a")  # b가 가장 오래 쓰이지 않은 항목이 된다
+    cache.put("c", response, b"1234")
+
+    assert [cache.get(key) is not None for key in "abc"] == [True, False, True]
+    cache.close()
+
+
+def test_transport_closes_only_its_own_cache(cache, tmp_path, monkeypatch):
+    monkeypatch.setitem(
+        settings.HTTP_CACHE_CONFIG, "path", str(tmp_path / "own.db")
+    )
+    mock = httpx.MockTransport(Origin())
+    owned = CachingTransport(mock)
+    shared = CachingTransport(mock, cache=cache)
+
+    async def scenario():
+        await owned.aclose()
+        await shared.aclose()
+
+    asyncio.run(scenario())
+    with pytest.raises(sqlite3.ProgrammingError):
+        owned.cache.get(API_URL)
+    assert cache.get(API_URL) is None
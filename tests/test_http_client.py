@@ -0,0 +1,126 @@
+import asyncio
+from asyncio import Queue
+
+import httpx
+
+from job_scraper.config import settings
+from job_scraper.utils.http_cache import CachingTransport
+from job_scraper.utils.http_cache import HttpCache
+from job_scraper.utils.http_client import create_client
+from job_scraper.utils.http_client import stream_fetch
+from job_scraper.utils.rate_limiter import RateLimitedTransport
+from job_scraper.utils.rate_limiter import RateLimiter
+
+URLS = [f"https://www.wanted.co.kr/wd/{i}" for i in range(10)]
+
+
+def url_queue(urls) -> Queue:
+    queue = Queue()
+    for url in urls:
+        queue.put_nowait(url)
+    return queue
+
+
+class SlowSite:
+    """MockTransport handler that tracks how many requests are in flight"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.active = 0
+        self.max_active = 0
+        self.started = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.started += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.active -= 1
+        if str(request.url) in self.failing:
+            return httpx.Response(500)
+        return httpx.Response(200, text=request.url.path)
+
+
+def fetcher(client: httpx.AsyncClient):
+    async def fetch(url):
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.text
+
+    return fetch
+
+
+def test_stream_fetch_runs_at_most_workers_fetches_at_once():
+    site = SlowSite(failing=[URLS[3]])
+
+    async def scenario():
+        async with create_client(
+            transport=httpx.MockTransport(site)
+        ) as client:
+            return [
+                url
+                async for url, _ in stream_fetch(
+                    fetcher(client), url_queue(URLS), workers=3
+                )
+            ]
+
+    fetched = asyncio.run(scenario())
+    assert site.max_active == 3
+    # 실패한 URL은 건너뛰고 나머지는 모두 나온다
+    assert sorted(fetched) == sorted(set(URLS) - {URLS[3]})
+
+
+def test_leaving_stream_fetch_early_cancels_the_remaining_fetches():
+    site = SlowSite()
+    urls = url_queue(URLS)
+
+    async def scenario():
+        async with create_client(
+            transport=httpx.MockTransport(site)
+        ) as client:
+            async for url, path in stream_fetch(
+                fetcher(client), urls, workers=2
+            ):
+                assert url.endswith(path)
+                break
+            # 취소된 worker는 더 이상 URL을 가져가지 않는다
+            started = site.started
+            await asyncio.sleep(0.05)
+            return started
+
+    started = asyncio.run(scenario())
+    assert site.started == started < len(URLS)
+    assert site.active == 0
+    assert not urls.empty()
+
+
+def test_client_sends_requests_through_the_cache_then_the_rate_limiter(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setitem(settings.HTTP_CACHE_CONFIG, "enabled", True)
+    cache = HttpCache(str(tmp_path / "http_cache.db"))
+    rate_limiter = RateLimiter()
+
+    async def scenario():
+        async with create_client(
+            rate_limiter=rate_limiter, http_cache=cache
+        ) as client:
+            return client._transport
+
+    transport = asyncio.run(scenario())
+    cache.close()
+    assert isinstance(transport, CachingTransport)
+    assert transport.cache is cache
+    assert isinstance(transport.transport, RateLimitedTransport)
+    assert transport.transport.rate_limiter is rate_limiter
+    assert isinstance(transport.transport.transport, httpx.AsyncHTTPTransport)
+
+
+def test_client_skips_the_cache_when_it_is_disabled():
+    async def scenario():
+        async with create_client() as client:
+            return client._transport
+
+    assert isinstance(asyncio.run(scenario()), RateLimitedTransport)
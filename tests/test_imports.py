@@ -0,0 +1,6 @@
+from job_scraper.benchmarks import imports
+
+
+def test_main_does_not_load_lazy_backends():
+    report = imports("job_scraper.main", repeat=1)
+    assert report["lazy_backends_loaded"] == []
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from job_scraper.scrapers.job_details import build_job_details
+from job_scraper.scrapers.job_details import parse_job_details
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "job_detail.html")
+
+
+def test_saved_page_is_parsed_with_structured_fields():
+    pytest.importorskip("lxml")
+    pytest.importorskip("cssselect")
+    with open(FIXTURE, encoding="utf-8") as file:
+        job_details = parse_job_details(file.read())
+
+    assert job_details == {
+        "주요업무": "데이터베이스 운영\n쿼리 튜닝",
+        "자격요건": "SQL",
+        # 같은 이름의 섹션은 ld+json 값으로 덮어쓰지 않는다
+        "근무지": "판교 (재택 가능)",
+        "게시일": "2026-01-02",
+        "마감일": "2026-03-31",
+        "회사": "원티드랩",
+        "고용형태": "FULL_TIME, CONTRACTOR",
+        "급여": "KRW 50000000-70000000 / YEAR",
+    }
+
+
+def test_missing_fields_are_left_out():
+    ld_json = (
+        '{"@type": "JobPosting", "datePosted": "2026-01-02",'
+        ' "jobLocation": [{"address": "서울 강남구"}],'
+        ' "baseSalary": {"currency": "KRW", "value": null}}'
+    )
+    assert build_job_details([(None, [])], ld_json) == {
+        "No title": "No description",
+        "게시일": "2026-01-02",
+        "근무지": "서울 강남구",
+    }
@@ -0,0 +1,160 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from job_scraper.config import settings
+from job_scraper.scrapers.wanted_scraper import QUEUE_DONE
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+from job_scraper.utils.page_classifier import page_classifier
+
+LIST_URL = "https://www.wanted.co.kr/wdlist/518/10231"
+LISTING_PATH = "/api/chaos/navigation/v1/results"
+LIMIT = settings.WANTED_API_CONFIG["limit"]
+POSTINGS = 45  # 20 + 20 + 5 -> 세 번째 페이지가 짧다
+
+
+def api_item(posting_id):
+    """Listing API item with the fields of a recorded response"""
+    return {
+        "id": posting_id,
+        "status": "active",
+        "due_time": None,
+        "position": f"DBA {posting_id}",
+        "company": {
+            "id": 1000 + posting_id % 7,
+            "name": f"회사 {posting_id % 7}",
+            "industry_name": "IT, 컨텐츠",
+        },
+        "category_tag": {"parent_id": 518, "id": 10231},
+        "address": {"country": "한국", "location": "서울"},
+    }
+
+
+def job_card(posting_id):
+    """The same posting as a job card of the list page"""
+    item = api_item(posting_id)
+    return (
+        "<div data-cy='job-card'>"
+        f"<a href='/wd/{posting_id}' data-position-id='{posting_id}'"
+        f" data-position-name='{item['position']}'"
+        f" data-company-id='{item['company']['id']}'"
+        f" data-company-name='{item['company']['name']}'"
+        " data-job-category='개발' data-job-category-id='518'>"
+        f"{item['position']}</a></div>"
+    )
+
+
+def queued_records(scraper):
+    records = {}
+    while not scraper.work_queue.empty():
+        records.update(scraper.work_queue.get_nowait())
+    return records
+
+
+def embedded_page(ids):
+    jobs = {"data": [api_item(posting_id) for posting_id in ids]}
+    data = {"props": {"pageProps": {"jobs": jobs}}}
+    return (
+        "<html><body><div id='__next'></div>"
+        "<script id='__NEXT_DATA__' type='application/json'>"
+        + json.dumps(data, ensure_ascii=False)
+        + "</script></body></html>"
+    )
+
+
+def static_page(ids):
+    return "<html><body>" + "".join(map(job_card, ids)) + "</body></html>"
+
+
+@pytest.fixture
+def listing_server(monkeypatch):
+    """
+    Mock listing API that serves `POSTINGS` items page by page, and the
+    list page set in `pages` (the server-rendered first batch).
+    """
+    monkeypatch.setitem(settings.WANTED_API_CONFIG, "concurrency", 2)
+    offsets = []
+    pages = {}
+
+    def handler(request):
+        if request.url.path != LISTING_PATH:
+            return httpx.Response(200, text=pages[request.url.path])
+
+        assert request.url.params["job_ids"] == "10231"
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        offsets.append(offset)
+        ids = range(offset + 1, min(offset + limit, POSTINGS) + 1)
+        return httpx.Response(200, json={"data": [api_item(i) for i in ids]})
+
+    transport = httpx.MockTransport(handler)
+    transport.pages = pages
+    return transport, offsets
+
+
+def test_api_pages_until_a_short_page(listing_server):
+    transport, offsets = listing_server
+    scraper = WantedScraper("10231", LIST_URL)
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport) as session:
+            await scraper._fetch_api(session)
+
+    asyncio.run(scenario())
+    # 두 페이지씩 요청: 0, 20 / 40(짧음), 60 -> 80은 요청하지 않는다
+    assert sorted(offsets) == [0, LIMIT, 2 * LIMIT, 3 * LIMIT]
+    assert len(queued_records(scraper)) == POSTINGS
+
+
+def test_api_records_match_the_job_cards(listing_server):
+    transport, _ = listing_server
+    from_api = WantedScraper("10231", LIST_URL)
+    from_cards = WantedScraper("10231", LIST_URL)
+    page = (
+        "<html><body>"
+        + "".join(job_card(i) for i in range(1, POSTINGS + 1))
+        + "</body></html>"
+    )
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport) as session:
+            await from_api._fetch_api(session)
+        await from_cards._scrape_static_postings(page)
+
+    asyncio.run(scenario())
+    assert queued_records(from_api) == queued_records(from_cards)
+
+
+@pytest.mark.parametrize("render", [embedded_page, static_page])
+def test_server_rendered_list_continues_past_the_first_batch(
+    listing_server, monkeypatch, render
+):
+    transport, offsets = listing_server
+    monkeypatch.setitem(settings.WANTED_API_CONFIG, "fetch_mode", "browser")
+    monkeypatch.setattr(page_classifier, "_cache", {})
+    transport.pages["/wdlist/518/10231"] = render(range(1, LIMIT + 1))
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport) as session:
+            scraper = WantedScraper("10231", LIST_URL, session=session)
+            queued = []
+
+            async def fetch_job_details(num_workers=None):
+                # 첫 batch 뒤의 페이지도 상세 수집까지 넘어온다
+                while True:
+                    posting = await scraper.work_queue.get()
+                    if posting is QUEUE_DONE:
+                        return
+                    queued.extend(posting)
+
+            scraper.fetch_job_details = fetch_job_details
+            await scraper.fetch(session, LIST_URL)
+            return queued
+
+    queued = asyncio.run(scenario())
+    assert sorted(queued, key=lambda href: int(href[4:])) == [
+        f"/wd/{posting_id}" for posting_id in range(1, POSTINGS + 1)
+    ]
+    assert offsets
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from job_scraper.scrapers.wanted_scraper import ListingTraffic
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+
+pytest.importorskip("playwright.async_api")
+
+LISTING_PATH = "/api/chaos/navigation/v1/results"
+
+
+class FakePage:
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+
+class FakeResponse:
+    url = f"https://www.wanted.co.kr{LISTING_PATH}?offset=0"
+    ok = True
+
+    def __init__(self, items):
+        self.items = items
+
+    async def json(self):
+        return {"data": self.items}
+
+
+def item(posting_id, **fields):
+    return {
+        "id": posting_id,
+        "position": "DBA",
+        "company": {"id": 7, "name": "원티드랩"},
+        **fields,
+    }
+
+
+def test_malformed_items_are_skipped_one_by_one():
+    scraper = WantedScraper("10231", "https://www.wanted.co.kr/wdlist")
+
+    async def scenario():
+        page = FakePage()
+        traffic = ListingTraffic(
+            page, LISTING_PATH, on_items=scraper._enqueue_api_items
+        )
+        items = [item(1), item(2, company=None), {"id": 3}, item(4)]
+        page.handlers["response"](FakeResponse(items))
+        await traffic.drain()
+        return traffic
+
+    traffic = asyncio.run(scenario())
+    assert traffic.captured == 4
+    queued = []
+    while not scraper.work_queue.empty():
+        queued.extend(scraper.work_queue.get_nowait())
+    assert queued == ["/wd/1", "/wd/4"]
+
+
+def test_failing_handler_does_not_stop_drain():
+    handled = []
+
+    async def on_items(items):
+        handled.append(len(items))
+        if len(handled) == 1:
+            raise RuntimeError("queue closed")
+
+    async def scenario():
+        page = FakePage()
+        traffic = ListingTraffic(page, LISTING_PATH, on_items=on_items)
+        page.handlers["response"](FakeResponse([item(1)]))
+        page.handlers["response"](FakeResponse([item(2), item(3)]))
+        await traffic.drain()
+
+    asyncio.run(scenario())
+    assert handled == [1, 2]
@@ -0,0 +1,80 @@
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from job_scraper.config import logging_config
+from job_scraper.config.logging_config import rate_limited
+from job_scraper.config.logging_config import RateLimitFilter
+
+LOGGER = "job_scraper.tests.logging"
+
+
+@pytest.fixture
+def log_dir(monkeypatch, tmp_path):
+    """Logging configured to write its module files into `tmp_path`"""
+    logging_config.shutdown_logging()
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    logging_config.configure_logging()
+    yield tmp_path
+    logging_config.shutdown_logging()
+    monkeypatch.delenv("LOG_DIR")
+    logging_config.configure_logging()
+
+
+def queue_handlers():
+    return [
+        handler
+        for handler in logging.getLogger().handlers
+        if isinstance(handler, QueueHandler)
+    ]
+
+
+def test_configure_logging_installs_its_handler_once(log_dir):
+    listener = logging_config._listener
+
+    logging_config.configure_logging()
+    logging_config.setup_logger(LOGGER)
+
+    assert logging_config._listener is listener
+    assert len(queue_handlers()) == 1
+
+
+def test_module_records_are_written_by_the_listener(log_dir):
+    logger = logging_config.setup_logger(LOGGER)
+    logger.info("first")
+    logging_config.setup_logger("job_scraper.tests.other").info("second")
+
+    # listener 스레드가 남은 레코드를 모두 쓰고 파일을 닫는다
+    logging_config.shutdown_logging()
+
+    assert "first" in (log_dir / f"{LOGGER}.log").read_text(encoding="utf-8")
+    other = log_dir / "job_scraper.tests.other.log"
+    assert "second" in other.read_text(encoding="utf-8")
+
+
+def test_rate_limited_records_are_suppressed_within_the_window(
+    caplog, monkeypatch
+):
+    now = [100.0]
+    monkeypatch.setattr(logging_config.time, "monotonic", lambda: now[0])
+    caplog.handler.addFilter(RateLimitFilter(rate=1.0, burst=2))
+    caplog.set_level(logging.INFO, logger=LOGGER)
+    logger = logging.getLogger(LOGGER)
+
+    for i in range(5):
+        logger.info(f"posting {i}", extra=rate_limited("posting"))
+    logger.info("not limited")
+    assert [record.getMessage() for record in caplog.records] == [
+        "posting 0",
+        "posting 1",
+        "not limited",
+    ]
+
+    caplog.clear()
+    now[0] += 1.0
+    logger.info("posting 5", extra=rate_limited("posting"))
+    logger.info("posting 6", extra=rate_limited("posting"))
+    assert [record.getMessage() for record in caplog.records] == [
+        "posting 5 (3 similar messages suppressed)"
+    ]
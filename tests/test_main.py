@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from job_scraper.main import load_config
+from job_scraper.main import parse_opt
+
+TOML = """
+jobs = ["DBA", "데이터 엔지니어"]
+locations = "seoul.all"
+years = [0, 3]
+output = "out"
+concurrency = 4
+resume = true
+"""
+
+
+def test_toml_config_fills_unset_flags(tmp_path):
+    path = tmp_path / "crawl.toml"
+    path.write_text(TOML, encoding="utf-8")
+
+    opt = parse_opt(["--config", str(path), "--concurrency", "2"])
+    assert opt.job == ["DBA", "데이터 엔지니어"]
+    assert opt.location == ["seoul.all"]
+    assert opt.years == [0, 3]
+    assert opt.output == "out"
+    assert opt.concurrency == 2  # flag가 config보다 우선
+    assert opt.processes is None
+    assert opt.resume
+
+
+def test_json_config_and_flags_are_merged(tmp_path):
+    path = tmp_path / "crawl.json"
+    path.write_text(json.dumps({"jobs": "DBA", "years": -1}), encoding="utf-8")
+
+    opt = parse_opt(["--config", str(path), "--location", "busan.all"])
+    assert (opt.job, opt.location, opt.years) == (["DBA"], ["busan.all"], [-1])
+    assert not opt.resume
+
+
+def test_unknown_config_keys_are_rejected(tmp_path, capsys):
+    path = tmp_path / "crawl.json"
+    path.write_text(json.dumps({"jobs": ["DBA"], "job": "DBA"}))
+
+    with pytest.raises(SystemExit):
+        parse_opt(["--config", str(path)])
+    assert "Unknown config keys: job" in capsys.readouterr().err
+
+
+def test_config_must_be_a_table(tmp_path):
+    path = tmp_path / "crawl.json"
+    path.write_text(json.dumps(["DBA"]))
+
+    with pytest.raises(ValueError):
+        load_config(str(path))
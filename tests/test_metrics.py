@@ -0,0 +1,61 @@
+import urllib.request
+
+from job_scraper.utils.metrics import MetricsRegistry
+
+
+def test_worker_state_merges_into_the_parent():
+    worker = MetricsRegistry()
+    worker.counter("pages_fetched_total", "Pages fetched", kind="api").inc(2)
+    worker.gauge("fetches_in_flight").set(3)
+    worker.histogram("fetch_seconds").observe(0.2)
+
+    parent = MetricsRegistry()
+    parent.counter("pages_fetched_total", kind="api").inc()
+    parent.gauge("fetches_in_flight").set(1)
+    parent.merge(worker.state())
+
+    summary = parent.summary()
+    assert summary["pages_fetched_total"] == {"kind=api": 3.0}
+    assert summary["fetches_in_flight"] == {"": {"value": 4.0, "max": 3.0}}
+    assert summary["fetch_seconds"][""]["count"] == 1
+
+
+def test_reset_drops_every_series():
+    registry = MetricsRegistry()
+    registry.counter("jobs_total", status="ok").inc()
+    registry.reset()
+
+    assert registry.state() == {}
+    # 초기화 후에는 다른 종류로 다시 등록할 수 있다
+    registry.gauge("jobs_total").set(1)
+
+
+def test_prometheus_histogram_is_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("detail_seconds", "Detail page latency")
+    for value in (0.01, 0.3, 100.0):
+        histogram.observe(value)
+
+    lines = registry.to_prometheus().splitlines()
+    assert lines[:2] == [
+        "# HELP detail_seconds Detail page latency",
+        "# TYPE detail_seconds histogram",
+    ]
+    assert 'detail_seconds_bucket{le="0.05"} 1' in lines
+    assert 'detail_seconds_bucket{le="0.5"} 2' in lines
+    assert 'detail_seconds_bucket{le="+Inf"} 3' in lines
+    assert "detail_seconds_count 3" in lines
+
+
+def test_serve_binds_to_localhost():
+    registry = MetricsRegistry()
+    registry.counter("jobs_total").inc()
+    server = registry.serve(port=0)
+    try:
+        host, port = server.server_address
+        assert host == "127.0.0.1"
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as r:
+            assert "jobs_total 1.0" in r.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,118 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from job_scraper.config import settings
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+from job_scraper.utils.page_classifier import DYNAMIC
+from job_scraper.utils.page_classifier import EMBEDDED_JSON
+from job_scraper.utils.page_classifier import page_classifier
+from job_scraper.utils.page_classifier import PageClassifier
+from job_scraper.utils.page_classifier import STATIC
+
+LIST_URL = "https://www.wanted.co.kr/wdlist/518/10231"
+DETAIL_URL = "https://www.wanted.co.kr/wd/1"
+SELECTOR = 'div[data-cy="job-card"] a[data-position-id]'
+
+ITEMS = [
+    {
+        "id": posting_id,
+        "position": f"DBA {posting_id}",
+        "company": {"id": 7, "name": "원티드랩"},
+        "category_tag": {"parent_id": 518, "id": 10231},
+    }
+    for posting_id in (1, 2)
+]
+NEXT_DATA_PAGE = (
+    "<html><body><div id='__next'></div>"
+    "<script id='__NEXT_DATA__' type='application/json'>"
+    + json.dumps({"props": {"pageProps": {"jobs": {"data": ITEMS}}}})
+    + "</script></body></html>"
+)
+STATIC_PAGE = (
+    "<html><body><div data-cy='job-card'>"
+    "<a href='/wd/1' data-position-id='1'>DBA</a></div></body></html>"
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(page_classifier, "_cache", {})
+
+
+@pytest.mark.parametrize(
+    "content, kind",
+    [
+        (STATIC_PAGE, STATIC),
+        (NEXT_DATA_PAGE, EMBEDDED_JSON),
+        ("<html><body><div id='__next'></div></body></html>", DYNAMIC),
+    ],
+)
+def test_classify(content, kind):
+    classifier = PageClassifier(ttl=60)
+    assert classifier.classify(LIST_URL, content, SELECTOR, ("position",))
+    assert classifier.get(LIST_URL) == kind
+    # 숫자 id만 다른 URL은 같은 pattern으로 캐시된다
+    assert classifier.get("https://www.wanted.co.kr/wdlist/518/899") == kind
+
+
+class RoutingScraper(WantedScraper):
+    """Records which path `_fetch` takes instead of crawling"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = []
+
+    async def _crawl(self, list_phase):
+        self.calls.append("crawl")
+        await list_phase()
+
+    async def _fetch_dynamic(self, url):
+        self.calls.append("fetch_dynamic")
+
+    async def _fetch_api(self, session):
+        self.calls.append("api")
+
+    async def _render(self, url):
+        self.calls.append("render")
+        return "<html>rendered</html>"
+
+
+def make_scraper(monkeypatch, pages):
+    monkeypatch.setitem(settings.WANTED_API_CONFIG, "fetch_mode", "browser")
+
+    def handler(request):
+        url = str(request.url.copy_with(query=None))
+        return httpx.Response(200, text=pages[url])
+
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return RoutingScraper("10231", LIST_URL, session=session), session
+
+
+def test_embedded_json_listing_is_extracted(monkeypatch):
+    scraper, session = make_scraper(monkeypatch, {LIST_URL: NEXT_DATA_PAGE})
+
+    asyncio.run(scraper.fetch(session, LIST_URL))
+    assert scraper.calls == ["crawl", "api"]
+    queued = []
+    while not scraper.work_queue.empty():
+        queued.extend(scraper.work_queue.get_nowait())
+    assert queued == ["/wd/1", "/wd/2"]
+
+
+def test_only_the_listing_url_is_crawled(monkeypatch):
+    scraper, session = make_scraper(monkeypatch, {})
+    for url in (DETAIL_URL, LIST_URL):
+        page_classifier.classify(url, "<html></html>", SELECTOR, ("id",))
+
+    async def scenario():
+        html = await scraper.fetch(session, DETAIL_URL)
+        assert html == "<html>rendered</html>"
+        # 같은 pattern의 다른 목록은 렌더링만 하고 목록 수집은 하지 않는다
+        await scraper.fetch(session, LIST_URL.replace("10231", "655"))
+        await scraper.fetch(session, LIST_URL)
+
+    asyncio.run(scenario())
+    assert scraper.calls == ["render", "render", "fetch_dynamic"]
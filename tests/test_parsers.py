@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from job_scraper.scrapers.parsers import aiter_elements
+from job_scraper.scrapers.parsers import iter_elements
+from job_scraper.scrapers.wanted_scraper import JOB_LINK_SELECTOR
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+PAGE = (
+    "<html><body><ul>"
+    + "".join(
+        f"<li><div data-cy='job-card'><a href='/wd/{posting_id}'"
+        f" data-position-id='{posting_id}' data-company-name='원티드랩'>"
+        f"<strong>DBA {posting_id}</strong></a></div></li>"
+        for posting_id in (1, 2, 3)
+    )
+    + "</ul></body></html>"
+).encode("utf-8")
+
+
+def chunks(size=7):
+    return [PAGE[i : i + size] for i in range(0, len(PAGE), size)]
+
+
+def cards(links):
+    return [
+        (
+            link.get("href"),
+            link.get("data-position-id"),
+            link.get("data-company-name"),
+            "".join(link.itertext()),
+        )
+        for link in links
+    ]
+
+
+EXPECTED = [
+    (f"/wd/{posting_id}", str(posting_id), "원티드랩", f"DBA {posting_id}")
+    for posting_id in (1, 2, 3)
+]
+
+
+def test_collected_elements_keep_their_content():
+    assert cards(list(iter_elements(chunks(), JOB_LINK_SELECTOR))) == EXPECTED
+
+
+def test_async_elements_keep_their_content():
+    async def feed():
+        for chunk in chunks():
+            yield chunk
+
+    async def scenario():
+        return [
+            link async for link in aiter_elements(feed(), JOB_LINK_SELECTOR)
+        ]
+
+    assert cards(asyncio.run(scenario())) == EXPECTED
+
+
+def test_incremental_parse_can_be_collected():
+    scraper = WantedScraper("10231", "https://www.wanted.co.kr/wdlist")
+    links = asyncio.run(scraper.parse(PAGE.decode("utf-8"), incremental=True))
+    assert cards(list(links)) == EXPECTED
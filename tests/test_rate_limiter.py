@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+
+from job_scraper.utils.rate_limiter import RateLimitedTransport
+from job_scraper.utils.rate_limiter import RateLimiter
+
+URL = "https://www.wanted.co.kr/api/chaos/navigation/v1/results"
+# burst를 크게 잡아 token bucket 대기 없이 AIMD만 본다
+CONFIG = {
+    "rate": 4.0,
+    "max_rate": 8.0,
+    "burst": 100,
+    "concurrency": 4,
+    "max_concurrency": 8,
+    "increase": 1.0,
+    "decrease": 0.5,
+    "cooldown": 2.0,
+}
+
+
+def client(rate_limiter, handler):
+    return httpx.AsyncClient(
+        transport=RateLimitedTransport(
+            rate_limiter, httpx.MockTransport(handler)
+        )
+    )
+
+
+def test_congestion_cuts_rate_and_concurrency_until_recovery():
+    rate_limiter = RateLimiter(CONFIG)
+    statuses = [429, 503] + [200] * 8
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0))
+
+    async def scenario():
+        async with client(rate_limiter, handler) as session:
+            await session.get(URL)
+            host = rate_limiter.stats()["www.wanted.co.kr"]
+            assert (host["rate"], host["concurrency"]) == (2.0, 2)
+
+            # cooldown 안의 두 번째 5xx는 같은 burst로 보고 다시 줄이지 않는다
+            await session.get(URL)
+            host = rate_limiter.stats()["www.wanted.co.kr"]
+            assert (host["rate"], host["concurrency"]) == (2.0, 2)
+            assert host["congestions"] == 2
+
+            for _ in range(8):
+                await session.get(URL)
+
+    asyncio.run(scenario())
+    host = rate_limiter.stats()["www.wanted.co.kr"]
+    assert host["rate"] > 4.0
+    assert host["concurrency"] >= 4
+    assert host["successes"] == 8
+
+
+def test_concurrency_is_capped_after_a_cut():
+    rate_limiter = RateLimiter({**CONFIG, "concurrency": 2, "increase": 0.1})
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        if request.url.params.get("first"):
+            return httpx.Response(429)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    async def scenario():
+        async with client(rate_limiter, handler) as session:
+            await session.get(URL, params={"first": 1})
+            await asyncio.gather(*(session.get(URL) for _ in range(4)))
+
+    asyncio.run(scenario())
+    assert peak == 1
+
+
+def test_retry_after_holds_the_next_request():
+    rate_limiter = RateLimiter(CONFIG)
+    sent = []
+
+    def handler(request):
+        sent.append(asyncio.get_running_loop().time())
+        if len(sent) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.3"})
+        return httpx.Response(200)
+
+    async def scenario():
+        async with client(rate_limiter, handler) as session:
+            assert (await session.get(URL)).status_code == 429
+            assert (await session.get(URL)).status_code == 200
+
+    asyncio.run(scenario())
+    assert sent[1] - sent[0] >= 0.3
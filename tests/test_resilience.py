@@ -0,0 +1,54 @@
+import asyncio
+
+import httpx
+import pytest
+
+from job_scraper.utils import resilience as resilience_module
+from job_scraper.utils.resilience import CLOSED
+from job_scraper.utils.resilience import HALF_OPEN
+from job_scraper.utils.resilience import PermanentError
+from job_scraper.utils.resilience import Resilience
+from job_scraper.utils.resilience import TransientError
+
+URL = "https://www.wanted.co.kr/wd/1"
+HOST = "www.wanted.co.kr"
+
+
+def respond(status):
+    async def request():
+        response = httpx.Response(status, request=httpx.Request("GET", URL))
+        response.raise_for_status()
+
+    return request
+
+
+@pytest.fixture
+def half_open(monkeypatch):
+    """Resilience whose breaker for `HOST` is waiting for a probe"""
+    now = [0.0]
+    monkeypatch.setattr(resilience_module.time, "monotonic", lambda: now[0])
+    resilience = Resilience(
+        {"max_attempts": 1, "failure_threshold": 1, "reset_timeout": 10.0}
+    )
+    with pytest.raises(TransientError):
+        asyncio.run(resilience.call(URL, respond(503)))
+    now[0] = 11.0
+    assert resilience.breaker(HOST).state == HALF_OPEN
+    return resilience
+
+
+def test_errors_without_a_response_leave_the_breaker_alone(half_open):
+    async def broken_parser():
+        raise KeyError("position")
+
+    with pytest.raises(PermanentError) as error:
+        asyncio.run(half_open.call(URL, broken_parser))
+    assert error.value.status is None
+    assert half_open.breaker(HOST).state == HALF_OPEN
+
+
+def test_client_errors_show_the_host_is_up(half_open):
+    with pytest.raises(PermanentError) as error:
+        asyncio.run(half_open.call(URL, respond(404)))
+    assert error.value.status == 404
+    assert half_open.breaker(HOST).state == CLOSED
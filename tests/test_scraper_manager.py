@@ -0,0 +1,170 @@
+import asyncio
+from contextlib import asynccontextmanager
+import queue
+
+import pytest
+
+from job_scraper.config import settings
+from job_scraper.scrapers.browser_pool import BrowserPool
+from job_scraper.scrapers.scraper_manager import run_shard
+from job_scraper.scrapers.scraper_manager import ScraperManager
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+from job_scraper.utils.metrics import metrics
+from job_scraper.utils.metrics import MetricsRegistry
+
+LIST_URL = "https://www.wanted.co.kr/wdlist/518/{job_id}"
+
+
+class OfflineScraper(WantedScraper):
+    """WantedScraper whose list and detail pages are given by the test"""
+
+    list_phase = None
+    detail_page = None
+
+    @classmethod
+    async def create(cls, job, params=None, **shared):
+        job_id = settings.JOB_CONFIG["job_id"][job]
+        return cls(job_id, LIST_URL.format(job_id=job_id), params, **shared)
+
+    async def _fetch_api(self, session):
+        await type(self).list_phase(self)
+
+    async def _fetch_job_detail_page(self, page, job_url, metadata):
+        await type(self).detail_page(self, metadata)
+
+
+class ListExporter:
+    def __init__(self):
+        self.records = []
+
+    async def put(self, record):
+        self.records.append(record)
+
+
+def posting(posting_id):
+    href = f"/wd/{posting_id}"
+    return {href: {"posting_id": posting_id, "position": f"공고 {posting_id}"}}
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = ListExporter()
+
+    async def open_outputs(stack):
+        return None, exporter
+
+    @asynccontextmanager
+    async def page(self):
+        yield None
+
+    monkeypatch.setattr(
+        ScraperManager, "_open_outputs", staticmethod(open_outputs)
+    )
+    monkeypatch.setattr(BrowserPool, "page", page)
+    monkeypatch.setattr(BrowserPool, "is_exhausted", lambda self, page: False)
+    return exporter
+
+
+@pytest.fixture
+def manager(monkeypatch, exporter):
+    monkeypatch.setitem(settings.WANTED_API_CONFIG, "fetch_mode", "api")
+    monkeypatch.setitem(settings.WORK_QUEUE_CONFIG, "enabled", False)
+    return ScraperManager(
+        [OfflineScraper, OfflineScraper],
+        ["DBA", "데이터 엔지니어"],
+        max_concurrency=2,
+    )
+
+
+def test_failed_crawl_is_recorded(manager, monkeypatch):
+    async def list_phase(scraper):
+        if scraper.job_id == settings.JOB_CONFIG["job_id"]["DBA"]:
+            raise RuntimeError("list page broke")
+
+    monkeypatch.setattr(OfflineScraper, "list_phase", list_phase)
+    failed = metrics.counter(
+        "jobs_total",
+        "Finished jobs",
+        scraper="OfflineScraper",
+        status="failed",
+    )
+    before = failed.value
+
+    asyncio.run(manager._run_local())
+
+    errors = {key[0]: error for key, error in manager.results.items()}
+    assert isinstance(errors["DBA"], RuntimeError)
+    assert errors["데이터 엔지니어"] is None
+    assert manager.stats["failed"] == 1
+    assert failed.value == before + 1
+
+
+def test_failed_owner_releases_its_postings(manager, exporter, monkeypatch):
+    dba = settings.JOB_CONFIG["job_id"]["DBA"]
+    dba_listed, other_listed = asyncio.Event(), asyncio.Event()
+
+    async def list_phase(scraper):
+        if scraper.job_id == dba:
+            for posting_id in ("1", "2", "3"):
+                await scraper.enqueue_posting(posting(posting_id))
+            dba_listed.set()
+            await other_listed.wait()
+            raise RuntimeError("list page broke")
+
+        await dba_listed.wait()
+        for posting_id in ("2", "3", "4"):
+            await scraper.enqueue_posting(posting(posting_id))
+        other_listed.set()
+
+    async def detail_page(scraper, metadata):
+        if scraper.job_id == dba:
+            await asyncio.Event().wait()  # 실패할 때까지 끝나지 않는다
+        metadata["job_details"] = {"본문": metadata["posting_id"]}
+
+    monkeypatch.setattr(OfflineScraper, "list_phase", list_phase)
+    monkeypatch.setattr(OfflineScraper, "detail_page", detail_page)
+
+    asyncio.run(manager._run_local())
+
+    (other,) = (
+        query for query, task in manager.queries.items() if task[1] != "DBA"
+    )
+    saved = {}
+    for record in exporter.records:
+        assert record["query"] == other
+        saved.setdefault(record["posting_id"], []).append(
+            bool(record.get("job_details"))
+        )
+    # 2, 3은 목록 레코드를 먼저 저장하고, DBA가 실패한 뒤 상세까지 가져온다
+    assert saved == {"2": [False, True], "3": [False, True], "4": [True]}
+    assert manager.stats["failed"] == 1
+    assert manager.stats["orphans"] == {"postings": 2, "failed": 0}
+
+
+def test_reused_worker_reports_each_shard_once(exporter, monkeypatch):
+    monkeypatch.setitem(settings.WORK_QUEUE_CONFIG, "enabled", False)
+
+    async def list_phase(scraper):
+        await scraper.enqueue_posting(posting(scraper.params["locations"]))
+
+    async def detail_page(scraper, metadata):
+        metadata["job_details"] = {"본문": metadata["posting_id"]}
+
+    monkeypatch.setattr(OfflineScraper, "list_phase", list_phase)
+    monkeypatch.setattr(OfflineScraper, "detail_page", detail_page)
+
+    # worker 하나가 3개의 shard를 차례로 실행 (ProcessPoolExecutor의 재사용)
+    parent = MetricsRegistry()
+    results = queue.Queue()
+    for location in ("seoul.all", "busan.all", "daegu.all"):
+        stats = run_shard(
+            OfflineScraper,
+            "DBA",
+            {"locations": location, "years": -1},
+            results,
+        )
+        parent.merge(stats["metrics"])
+
+    finished = parent.summary()["jobs_total"]
+    assert finished == {"scraper=OfflineScraper,status=ok": 3.0}
+    assert results.qsize() == 3
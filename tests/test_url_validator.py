@@ -0,0 +1,38 @@
+import asyncio
+
+import httpx
+
+from job_scraper.utils import url_validator
+from job_scraper.utils.url_validator import can_parse_url_async
+from job_scraper.utils.url_validator import ReachabilityCache
+
+URL = "https://www.wanted.co.kr/wdlist/518/10231"
+
+
+def test_dropped_connection_is_cached_briefly(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(url_validator.time, "monotonic", lambda: now[0])
+    responses = [httpx.ConnectError("connection reset"), 200]
+
+    def handler(request):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return httpx.Response(response)
+
+    cache = ReachabilityCache(ttl=3600, negative_ttl=30)
+
+    async def scenario():
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            assert not await can_parse_url_async(URL, client, cache)
+            # 같은 host의 다른 URL도 잠시 동안은 바로 실패
+            assert cache.get(URL.replace("10231", "655")) is False
+
+            now[0] = 31.0
+            assert await can_parse_url_async(URL, client, cache)
+            now[0] = 3000.0
+            assert cache.get(URL) is True
+
+    asyncio.run(scenario())
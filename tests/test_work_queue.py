@@ -0,0 +1,125 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from job_scraper.scrapers.wanted_scraper import QUEUE_DONE
+from job_scraper.scrapers.wanted_scraper import WantedScraper
+from job_scraper.storage.work_queue import DONE
+from job_scraper.storage.work_queue import DurableWorkQueue
+from job_scraper.storage.work_queue import FAILED
+from job_scraper.storage.work_queue import IN_PROGRESS
+
+QUEUE = "WantedScraper:10231:locations=all"
+
+
+def posting(posting_id):
+    return {f"/wd/{posting_id}": {"posting_id": posting_id, "position": "DBA"}}
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return DurableWorkQueue(
+        str(tmp_path / "work_queue.db"), batch_size=100, max_attempts=2
+    )
+
+
+def test_restore_returns_unfinished_postings(journal):
+    async def attempt(posting_id, status):
+        await journal.mark(QUEUE, posting_id, IN_PROGRESS)
+        await journal.mark(QUEUE, posting_id, status)
+
+    async def scenario():
+        for posting_id in ("1", "2", "3", "4", "5"):
+            await journal.add(QUEUE, posting(posting_id))
+        await attempt("1", DONE)
+        await attempt("2", FAILED)  # 1번 실패 -> 다시 시도
+        await attempt("3", FAILED)
+        await attempt("3", FAILED)  # max_attempts만큼 실패 -> 포기
+        await journal.mark(QUEUE, "4", IN_PROGRESS)  # 도중에 중단됨
+        await journal.mark_listed(QUEUE)
+        return await journal.restore(QUEUE)
+
+    postings, finished, listed = asyncio.run(scenario())
+    assert postings == [posting("2"), posting("4"), posting("5")]
+    assert finished == {"1", "3"}
+    assert listed
+    assert journal.stats(QUEUE) == {
+        DONE: 1,
+        FAILED: 2,
+        IN_PROGRESS: 1,
+        "pending": 1,
+    }
+    asyncio.run(journal.close())
+
+
+def test_reset_forgets_the_queue(journal):
+    async def scenario():
+        await journal.add(QUEUE, posting("1"))
+        await journal.add("other", posting("1"))
+        await journal.mark_listed(QUEUE)
+        await journal.reset(QUEUE)
+        restored = await journal.restore(QUEUE), await journal.restore("other")
+        await journal.close()
+        return restored
+
+    (postings, finished, listed), (other, _, _) = asyncio.run(scenario())
+    assert (postings, finished, listed) == ([], set(), False)
+    assert other == [posting("1")]
+
+
+def test_idle_buffer_is_committed_after_flush_interval(tmp_path):
+    path = str(tmp_path / "work_queue.db")
+    journal = DurableWorkQueue(path, batch_size=100, flush_interval=0.05)
+
+    def committed():
+        connection = sqlite3.connect(path)
+        try:
+            (count,) = connection.execute(
+                "SELECT COUNT(*) FROM work_item"
+            ).fetchone()
+        finally:
+            connection.close()
+        return count
+
+    async def scenario():
+        await journal.add(QUEUE, posting("1"))
+        assert committed() == 0
+        # 다른 쓰기 없이 시간만 지나도 commit된다
+        await asyncio.sleep(0.2)
+        assert committed() == 1
+        await journal.close()
+
+    asyncio.run(scenario())
+
+
+def test_resume_skips_a_finished_list_phase(journal):
+    scraper = WantedScraper(
+        "10231",
+        "https://www.wanted.co.kr/wdlist/518/10231",
+        durable_queue=journal,
+        resume=True,
+    )
+    listed, fetched = [], []
+
+    async def list_phase():
+        listed.append(True)
+
+    async def fetch_job_details(num_workers=None):
+        while (queued := await scraper.work_queue.get()) is not QUEUE_DONE:
+            fetched.extend(queued)
+
+    scraper.fetch_job_details = fetch_job_details
+
+    async def scenario():
+        for posting_id in ("1", "2"):
+            await journal.add(scraper.queue_name, posting(posting_id))
+        await journal.mark(scraper.queue_name, "1", DONE)
+        await journal.mark_listed(scraper.queue_name)
+        await scraper._crawl(list_phase)
+        await journal.close()
+
+    asyncio.run(scenario())
+    assert listed == []
+    assert fetched == ["/wd/2"]
+    assert scraper.seen_postings == {"1", "2"}